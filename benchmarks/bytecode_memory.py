@@ -0,0 +1,55 @@
+import sys
+import tracemalloc
+
+from benchmarks.synthetic import debug_heavy_class
+from objects.attributes import AttributeCode
+from parser.class_parser import parse_class
+
+
+# Compares the memory held by method bodies as Bytecode (parallel arrays) against the previous
+# dict[int, ParsedOpcode] representation, rebuilt here from the same instructions.
+#
+#   python -m benchmarks.bytecode_memory [class file ...]
+
+
+def code_attributes(clazz):
+    for method in clazz.methods:
+        for attribute in method.attribute_info:
+            if isinstance(attribute, AttributeCode):
+                yield attribute
+
+
+def compact_size(code) -> int:
+    arrays = (code.opcodes, code.pcs, code.operand_starts, code.operands, code.pc_index)
+    return sys.getsizeof(code) + sum(sys.getsizeof(values) for values in arrays)
+
+
+def dict_size(code) -> int:
+    tracemalloc.start()
+    operations = dict(code.items())
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del operations
+    return size
+
+
+def main(sources):
+    print(f"{'class':<40}{'instructions':>14}{'dict':>12}{'compact':>12}{'ratio':>8}")
+    for name, source in sources:
+        codes = [attribute.code for attribute in code_attributes(parse_class(source))]
+
+        instructions = sum(len(code) for code in codes)
+        legacy = sum(dict_size(code) for code in codes)
+        compact = sum(compact_size(code) for code in codes)
+        print(f"{name:<40}{instructions:>14}{legacy / 1024:>9.1f} KiB{compact / 1024:>9.1f} KiB{legacy / compact:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(
+        [(filename, filename) for filename in sys.argv[1:]] or [
+            ("tests/Class.class", "tests/Class.class"),
+            ("tests/TableSwitch.class", "tests/TableSwitch.class"),
+            ("synthetic (50 methods x 2000 bytes)", debug_heavy_class())
+        ]
+    )
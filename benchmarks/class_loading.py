@@ -0,0 +1,103 @@
+import argparse
+import os
+import tempfile
+import zipfile
+from time import perf_counter
+
+from parser.class_writer import ClassFileBuilder
+from runtime.class_loader import ClassLoader
+
+
+# Class lookup on a generated classpath of directories and JARs: cold index build, warm start from a
+# persisted index, and lookups through the index against probing every entry on the filesystem.
+#
+#   python -m benchmarks.class_loading [--entries N] [--packages P] [--classes C]
+
+
+def build_classpath(root, entries, packages, classes) -> tuple[list[str], list[str]]:
+    # Alternates directories and JARs; returns (classpath, every class name)
+    classpath = list()
+    names = list()
+
+    for e in range(entries):
+        members = dict()
+        for p in range(packages):
+            for c in range(classes):
+                name = f"bench/e{e}/p{p}/C{c}"
+                members[name] = ClassFileBuilder(name).build()
+        names.extend(members)
+
+        if e % 2 == 0:
+            entry = os.path.join(root, f"classes{e}")
+            for name, data in members.items():
+                path = os.path.join(entry, *name.split("/")) + ".class"
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as file:
+                    file.write(data)
+        else:
+            entry = os.path.join(root, f"lib{e}.jar")
+            with zipfile.ZipFile(entry, "w") as archive:
+                for name, data in members.items():
+                    archive.writestr(name + ".class", data)
+
+        classpath.append(entry)
+
+    return classpath, names
+
+
+def probe(classpath, name) -> str | None:
+    # Lookup without an index: every entry is asked in turn
+    for entry in classpath:
+        if os.path.isdir(entry):
+            if os.path.exists(os.path.join(entry, *name.split("/")) + ".class"):
+                return entry
+        else:
+            with zipfile.ZipFile(entry) as archive:
+                try:
+                    archive.getinfo(name + ".class")
+                    return entry
+                except KeyError:
+                    pass
+    return None
+
+
+def timed(function, *args):
+    start = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classpath lookup with and without the package index")
+    parser.add_argument("--entries", type=int, default=8, help="classpath entries, alternating directories and JARs")
+    parser.add_argument("--packages", type=int, default=10, help="packages per entry")
+    parser.add_argument("--classes", type=int, default=20, help="classes per package")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as root:
+        classpath, names = build_classpath(root, args.entries, args.packages, args.classes)
+        missing = [name.replace("/C", "/Missing") for name in names]
+        index_path = os.path.join(root, "classpath-index.json")
+
+        cold, cold_time = timed(ClassLoader, classpath, index_path)
+        warm, warm_time = timed(ClassLoader, classpath, index_path)
+        print(f"{len(names)} classes in {len(classpath)} entries")
+        print(f"  cold index build      {cold_time * 1e3:>10.2f} ms  ({cold.scanned} entries scanned)")
+        print(f"  warm index load       {warm_time * 1e3:>10.2f} ms  ({warm.scanned} entries scanned)")
+
+        print(f"  {'lookup':<22}{'indexed µs':>12}{'probing µs':>12}")
+        for label, queries in (("hit", names), ("miss", missing)):
+            _, indexed = timed(lambda: [warm.locate(name) for name in queries])
+            sample = queries[::max(len(queries) // 200, 1)]
+            _, probed = timed(lambda: [probe(classpath, name) for name in sample])
+            print(f"  {label:<22}{indexed / len(queries) * 1e6:>12.2f}{probed / len(sample) * 1e6:>12.2f}")
+
+        _, load_time = timed(lambda: [warm.load(name) for name in names])
+        print(f"  load (read + parse)   {load_time / len(names) * 1e6:>10.2f} µs/class")
+
+        cold.close()
+        warm.close()
+
+
+if __name__ == "__main__":
+    main()
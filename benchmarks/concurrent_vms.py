@@ -0,0 +1,85 @@
+import argparse
+import io
+from concurrent.futures import ThreadPoolExecutor
+from struct import pack
+from time import perf_counter
+
+from parser.class_writer import ClassFileBuilder
+from runtime.opcodes import int32
+from runtime.class_loader import shared_classes
+from runtime.pyjvm import JVM, shared_methods
+
+
+# Hosts many short-lived JVMs in one process: each VM loads the same class, runs one request and is
+# discarded. Every VM must see its own static state, so each run returns the same total.
+#
+#   python -m benchmarks.concurrent_vms [--vms N] [--workers W] [--iterations I]
+
+
+CLASS_NAME = "bench/Request"
+
+
+def request_class() -> bytes:
+    builder = ClassFileBuilder(CLASS_NAME)
+    total = builder.field_ref(CLASS_NAME, "total", "I")
+    builder.add_field("total", "I", 0x0008)
+
+    # for (int i = 0; i < n; i++) total += i; return total;
+    run = bytes((
+        0x03, 0x3C,
+        0x1B, 0x1A, 0xA2, *pack(">h", 17),
+        0xB2, *pack(">H", total), 0x1B, 0x60, 0xB3, *pack(">H", total),
+        0x84, 1, 1,
+        0xA7, *pack(">h", -16),
+        0xB2, *pack(">H", total), 0xAC
+    ))
+    builder.add_method("run", "(I)I", 0x0009, [builder.code(run, 2, 2, attributes=[
+        builder.stack_map_table([pack(">BHB", 252, 2, 1), pack(">B", 18)])
+    ])])
+
+    return builder.build()
+
+
+def serve(source, iterations) -> int:
+    vm = JVM(source, stdout=io.StringIO())
+    return vm.invoke((CLASS_NAME, "run", "(I)I"), [iterations])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Throughput of many JVMs in one process")
+    parser.add_argument("--vms", type=int, default=200, help="VMs created, one request each")
+    parser.add_argument("--workers", type=int, default=8, help="thread pool size")
+    parser.add_argument("--iterations", type=int, default=2_000, help="loop iterations per request")
+    args = parser.parse_args(argv)
+
+    source = request_class()
+    expected = int32(args.iterations * (args.iterations - 1) // 2)
+
+    # The first VM parses, verifies and prepares the class; the rest reuse the shared copy
+    start = perf_counter()
+    serve(source, args.iterations)
+    first = perf_counter() - start
+
+    start = perf_counter()
+    sequential = [serve(source, args.iterations) for _ in range(args.vms)]
+    sequential_time = perf_counter() - start
+
+    start = perf_counter()
+    with ThreadPoolExecutor(args.workers) as executor:
+        concurrent = list(executor.map(serve, [source] * args.vms, [args.iterations] * args.vms))
+    concurrent_time = perf_counter() - start
+
+    for results in (sequential, concurrent):
+        wrong = [result for result in results if result != expected]
+        if wrong:
+            raise AssertionError(f"{len(wrong)} VMs returned {wrong[0]}, expected {expected}: static state leaked")
+
+    print(f"first VM (parse + verify + prepare): {first * 1e3:.2f} ms")
+    print(f"shared classes: {len(shared_classes)}, prepared methods: {len(shared_methods)}")
+    print(f"{'mode':<24}{'VMs':>6}{'total ms':>12}{'ms/VM':>10}{'VMs/s':>10}")
+    for mode, elapsed in (("sequential", sequential_time), (f"{args.workers} threads", concurrent_time)):
+        print(f"{mode:<24}{args.vms:>6}{elapsed * 1e3:>12.1f}{elapsed * 1e3 / args.vms:>10.3f}{args.vms / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import sys
+import tracemalloc
+from struct import unpack
+from timeit import repeat
+
+from objects.constant_pool import *
+from parser.byte_reader import ByteReader
+from parser.class_parser import LinkedConstantPool, parse_class, parse_constant_pool, read_class, uint
+
+
+# Compares the previous eager, recursive constant pool linking pass against LinkedConstantPool, which
+# links entries on first access and builds shared entries once.
+#
+#   python -m benchmarks.constant_pool_linking [class file ...]
+
+
+def eager_link_constant_pool(constant_pool):
+    # Linking pass as it was before LinkedConstantPool: every reference is re-linked from scratch
+    def link_entry(entry):
+        if entry.tag == 1:
+            return entry.bytes.decode("utf-8")
+        elif entry.tag == 12:
+            return PConstantNameAndTypeInfo(
+                link_entry(constant_pool[entry.name_index]),
+                link_entry(constant_pool[entry.descriptor_index])
+            )
+        elif entry.tag == 7:
+            return PConstantClassInfo(link_entry(constant_pool[entry.name_index]))
+        elif entry.tag in (9, 10, 11):
+            return {9: PConstantFieldrefInfo, 10: PConstantMethodrefInfo, 11: PConstantInterfaceMethodrefInfo}[entry.tag](
+                link_entry(constant_pool[entry.class_index]),
+                link_entry(constant_pool[entry.name_and_type_index])
+            )
+        elif entry.tag == 8:
+            return PConstantStringInfo(link_entry(constant_pool[entry.string_index]))
+        elif entry.tag == 3:
+            return PConstantIntegerInfo(uint(entry.bytes, True))
+        elif entry.tag == 4:
+            return PConstantFloatInfo(unpack(">f", entry.bytes)[0])
+        elif entry.tag == 5:
+            return PConstantLongInfo(uint(entry.high_bytes + entry.low_bytes, True))
+        elif entry.tag == 6:
+            return PConstantDoubleInfo(unpack(">d", entry.high_bytes + entry.low_bytes)[0])
+        elif entry.tag == 15:
+            return PConstantMethodHandleInfo(entry.reference_kind, link_entry(constant_pool[entry.reference_index]))
+        elif entry.tag == 16:
+            return PConstantMethodTypeInfo(link_entry(constant_pool[entry.descriptor_index]))
+        elif entry.tag == 18:
+            return PConstantInvokeDynamicInfo(
+                entry.bootstrap_method_attr_index,
+                link_entry(constant_pool[entry.name_and_type_index])
+            )
+
+    new_pool = [None]
+    for entry in constant_pool:
+        if entry is None: continue
+
+        linked = link_entry(entry)
+        new_pool.append(linked)
+
+        if isinstance(linked, PConstantDoubleInfo) or isinstance(linked, PConstantLongInfo):
+            new_pool.append(None)
+    return new_pool
+
+
+def read_raw_pool(data):
+    with ByteReader(data) as reader:
+        reader.skip(8)
+        return parse_constant_pool(reader)[1]
+
+
+def linked_size(link, raw_pool):
+    tracemalloc.start()
+    pool = link(raw_pool)
+    entries = list(pool)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del pool, entries
+    return size
+
+
+def best_of(func, number=20):
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def main(filenames):
+    for filename in filenames:
+        with open(filename, "rb") as file:
+            data = file.read()
+        raw_pool = read_raw_pool(data)
+
+        eager = eager_link_constant_pool(raw_pool)
+        assert eager == list(LinkedConstantPool(raw_pool))
+
+        eager_time = best_of(lambda: eager_link_constant_pool(raw_pool))
+        full_time = best_of(lambda: list(LinkedConstantPool(raw_pool)))
+
+        # Entries actually touched while parsing the rest of the class
+        with ByteReader(data) as reader:
+            touched = read_class(reader).constant_pool
+            touched_count = sum(touched.is_linked(i) for i in range(1, len(touched)))
+
+        print(f"{filename}: {len(raw_pool) - 1} constant pool entries, {touched_count} touched by parse_class")
+        print(f"  eager link:            {eager_time * 1e3:8.3f} ms {linked_size(eager_link_constant_pool, raw_pool) / 1024:8.1f} KiB")
+        print(f"  on-demand, all linked: {full_time * 1e3:8.3f} ms {linked_size(LinkedConstantPool, raw_pool) / 1024:8.1f} KiB")
+        print(f"  parse_class:           {best_of(lambda: parse_class(data), 5) * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["tests/Class.class"])
@@ -0,0 +1,210 @@
+import argparse
+import io
+from struct import pack
+from time import perf_counter
+
+from parser.class_writer import ClassFileBuilder
+from runtime import opcodes
+from runtime.opcodes import int32
+from runtime.pyjvm import JVM
+
+
+# Bytecode executed per second on simple loops; the baseline figure for interpreter tuning.
+#
+#   python -m benchmarks.interpreter_loop [--iterations N] [--repeat R]
+
+
+CLASS_NAME = "bench/Loops"
+
+
+# --------------------------------------------------
+# LOOP CLASS
+# --------------------------------------------------
+
+
+def loop_class() -> bytes:
+    builder = ClassFileBuilder(CLASS_NAME, interfaces=("java/lang/Comparable",))
+    static = 0x0009
+    int_array = builder.class_ref("[I")
+    add = builder.method_ref(CLASS_NAME, "add", "(II)I")
+
+    # int s = 0; for (int i = 0; i < n; i++) s += i; return s;
+    int_loop = bytes((
+        0x03, 0x3C, 0x03, 0x3D,
+        0x1C, 0x1A, 0xA2, *pack(">h", 13),
+        0x1B, 0x1C, 0x60, 0x3C,
+        0x84, 2, 1,
+        0xA7, *pack(">h", -12),
+        0x1B, 0xAC
+    ))
+    builder.add_method("intLoop", "(I)I", static, [builder.code(int_loop, 2, 3, attributes=[
+        builder.stack_map_table([pack(">BHBB", 253, 4, 1, 1), pack(">B", 14)])
+    ])])
+
+    # long s = 0; for (int i = 0; i < n; i++) s += i; return s;
+    long_loop = bytes((
+        0x09, 0x40, 0x03, 0x3E,
+        0x1D, 0x1A, 0xA2, *pack(">h", 14),
+        0x1F, 0x1D, 0x85, 0x61, 0x40,
+        0x84, 3, 1,
+        0xA7, *pack(">h", -13),
+        0x1F, 0xAD
+    ))
+    builder.add_method("longLoop", "(I)J", static, [builder.code(long_loop, 4, 4, attributes=[
+        builder.stack_map_table([pack(">BHBB", 253, 4, 4, 1), pack(">B", 15)])
+    ])])
+
+    # int[] a = new int[n]; int s = 0; for (int i = 0; i < n; i++) { a[i] = i; s += a[i]; } return s;
+    array_loop = bytes((
+        0x1A, 0xBC, 10, 0x4C,
+        0x03, 0x3D, 0x03, 0x3E,
+        0x1D, 0x1A, 0xA2, *pack(">h", 19),
+        0x2B, 0x1D, 0x1D, 0x4F,
+        0x1C, 0x2B, 0x1D, 0x2E, 0x60, 0x3D,
+        0x84, 3, 1,
+        0xA7, *pack(">h", -18),
+        0x1C, 0xAC
+    ))
+    builder.add_method("arrayLoop", "(I)I", static, [builder.code(array_loop, 3, 4, attributes=[
+        builder.stack_map_table([pack(">BHBHBB", 254, 8, 7, int_array, 1, 1), pack(">B", 20)])
+    ])])
+
+    # static int add(int a, int b) { return a + b; }
+    builder.add_method("add", "(II)I", static, [builder.code(bytes((0x1A, 0x1B, 0x60, 0xAC)), 2, 2)])
+
+    # int s = 0; for (int i = 0; i < n; i++) s = add(s, i); return s;
+    call_loop = bytes((
+        0x03, 0x3C, 0x03, 0x3D,
+        0x1C, 0x1A, 0xA2, *pack(">h", 15),
+        0x1B, 0x1C, 0xB8, *pack(">H", add), 0x3C,
+        0x84, 2, 1,
+        0xA7, *pack(">h", -14),
+        0x1B, 0xAC
+    ))
+    builder.add_method("callLoop", "(I)I", static, [builder.code(call_loop, 2, 3, attributes=[
+        builder.stack_map_table([pack(">BHBB", 253, 4, 1, 1), pack(">B", 16)])
+    ])])
+
+    # Loops() { super(); }
+    object_init = builder.method_ref("java/lang/Object", "<init>", "()V")
+    builder.add_method("<init>", "()V", 0x0001, [builder.code(bytes((0x2A, 0xB7, *pack(">H", object_init), 0xB1)), 1, 1)])
+
+    # static int total; int value;
+    # Loops o = new Loops(); total = 0; for (int i = 0; i < n; i++) { o.value += i; total += i; }
+    # return o.value + total;
+    this_class = builder.class_ref(CLASS_NAME)
+    init = builder.method_ref(CLASS_NAME, "<init>", "()V")
+    total = builder.field_ref(CLASS_NAME, "total", "I")
+    value = builder.field_ref(CLASS_NAME, "value", "I")
+    builder.add_field("total", "I", 0x0008)
+    builder.add_field("value", "I", 0x0000)
+    field_loop = bytes((
+        0xBB, *pack(">H", this_class), 0x59, 0xB7, *pack(">H", init), 0x4C,
+        0x03, 0xB3, *pack(">H", total), 0x03, 0x3D,
+        0x1C, 0x1A, 0xA2, *pack(">h", 27),
+        0x2B, 0x2B, 0xB4, *pack(">H", value), 0x1C, 0x60, 0xB5, *pack(">H", value),
+        0xB2, *pack(">H", total), 0x1C, 0x60, 0xB3, *pack(">H", total),
+        0x84, 2, 1,
+        0xA7, *pack(">h", -26),
+        0x2B, 0xB4, *pack(">H", value), 0xB2, *pack(">H", total), 0x60, 0xAC
+    ))
+    builder.add_method("fieldLoop", "(I)I", static, [builder.code(field_loop, 3, 3, attributes=[
+        builder.stack_map_table([pack(">BHBHB", 253, 14, 7, this_class, 1), pack(">B", 28)])
+    ])])
+
+    # public int compareTo(Object other) { return 1; }
+    builder.add_method("compareTo", "(Ljava/lang/Object;)I", 0x0001, [builder.code(bytes((0x04, 0xAC)), 1, 2)])
+
+    # Loops o = new Loops(); int s = 0; for (int i = 0; i < n; i++) s += o.compareTo(o); return s;
+    # virtualLoop calls through invokevirtual Loops.compareTo, interfaceLoop through invokeinterface
+    # Comparable.compareTo
+    compare = builder.method_ref(CLASS_NAME, "compareTo", "(Ljava/lang/Object;)I")
+    comparable_compare = builder.interface_method_ref("java/lang/Comparable", "compareTo", "(Ljava/lang/Object;)I")
+    for name, invoke in (
+        ("virtualLoop", bytes((0xB6, *pack(">H", compare)))),
+        ("interfaceLoop", bytes((0xB9, *pack(">H", comparable_compare), 2, 0)))
+    ):
+        loop = bytes((
+            0xBB, *pack(">H", this_class), 0x59, 0xB7, *pack(">H", init), 0x4C,
+            0x03, 0x3D, 0x03, 0x3E,
+            0x1D, 0x1A, 0xA2, *pack(">h", 14 + len(invoke)),
+            0x1C, 0x2B, 0x2B, *invoke, 0x60, 0x3D,
+            0x84, 3, 1,
+            0xA7, *pack(">h", -13 - len(invoke)),
+            0x1C, 0xAC
+        ))
+        builder.add_method(name, "(I)I", static, [builder.code(loop, 3, 4, attributes=[
+            builder.stack_map_table([pack(">BHBHBB", 254, 12, 7, this_class, 1, 1), pack(">B", 15 + len(invoke))])
+        ])])
+
+    return builder.build()
+
+
+# (method, descriptor, expected result for n)
+LOOPS = (
+    ("intLoop", "(I)I", lambda n: int32(n * (n - 1) // 2)),
+    ("longLoop", "(I)J", lambda n: n * (n - 1) // 2),
+    ("arrayLoop", "(I)I", lambda n: int32(n * (n - 1) // 2)),
+    ("callLoop", "(I)I", lambda n: int32(n * (n - 1) // 2)),
+    ("fieldLoop", "(I)I", lambda n: int32(n * (n - 1))),
+    ("virtualLoop", "(I)I", lambda n: n),
+    ("interfaceLoop", "(I)I", lambda n: n),
+)
+
+
+# --------------------------------------------------
+# MEASUREMENT
+# --------------------------------------------------
+
+
+def count_instructions(method, vm, n) -> int:
+    # Runs once through a handler table that counts every dispatch
+    count = 0
+    original = list(opcodes.handlers)
+
+    def counting(handler):
+        def wrapper(frame, arg, index):
+            nonlocal count
+            count += 1
+            return handler(frame, arg, index)
+        return wrapper
+
+    opcodes.handlers[:] = [counting(handler) for handler in original]
+    try:
+        method(vm, [n])
+    finally:
+        opcodes.handlers[:] = original
+
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Interpreter throughput on simple loops")
+    parser.add_argument("--iterations", type=int, default=200_000, help="loop iterations per call")
+    parser.add_argument("--repeat", type=int, default=5, help="best of this many calls")
+    args = parser.parse_args(argv)
+
+    n = args.iterations
+    vm = JVM(loop_class(), stdout=io.StringIO())
+
+    print(f"{'loop':<12}{'instructions':>14}{'best ms':>10}{'Mops/s':>10}")
+    for name, descriptor, expected in LOOPS:
+        method = vm.resolve_static((CLASS_NAME, name, descriptor))
+
+        result = method(vm, [n])
+        if result != expected(n):
+            raise AssertionError(f"{name}({n}) returned {result}, expected {expected(n)}")
+
+        instructions = count_instructions(method, vm, n)
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = perf_counter()
+            method(vm, [n])
+            best = min(best, perf_counter() - start)
+
+        print(f"{name:<12}{instructions:>14}{best * 1e3:>10.1f}{instructions / best / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
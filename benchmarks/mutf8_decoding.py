@@ -0,0 +1,51 @@
+import sys
+from timeit import repeat
+
+from benchmarks.synthetic import SHAPES, generate_class
+from parser.byte_reader import ByteReader
+from parser.class_parser import parse_constant_pool, read_header
+from parser.mutf8 import decode_mutf8
+
+
+# Decodes every UTF-8 constant of a class with decode_mutf8 and with the plain bytes.decode("utf-8")
+# it replaced. Both run uncached, bypassing the symbol table.
+#
+#   python -m benchmarks.mutf8_decoding [class file ...]
+
+
+def utf8_constants(source) -> list[bytes]:
+    with ByteReader(source) as reader:
+        read_header(reader)
+        _, constant_pool = parse_constant_pool(reader)
+
+    return [entry.bytes for entry in constant_pool if entry is not None and entry.tag == 1]
+
+
+def main(sources):
+    print(f"{'class':<32}{'constants':>10}{'non-ASCII':>11}{'utf-8':>12}{'mutf-8':>12}")
+    for name, source in sources:
+        constants = utf8_constants(source)
+        non_ascii = sum(not raw.isascii() for raw in constants)
+
+        # bytes.decode does not understand C0 80 or surrogate pairs; only time what it can decode
+        decodable = list()
+        for raw in constants:
+            try:
+                raw.decode("utf-8")
+                decodable.append(raw)
+            except UnicodeDecodeError:
+                pass
+
+        utf8_time = min(repeat(lambda: [raw.decode("utf-8") for raw in decodable], number=20, repeat=5)) / 20
+        mutf8_time = min(repeat(lambda: [decode_mutf8(raw) for raw in decodable], number=20, repeat=5)) / 20
+        print(f"{name:<32}{len(constants):>10}{non_ascii:>11}{utf8_time * 1e3:>9.3f} ms{mutf8_time * 1e3:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        [(filename, filename) for filename in sys.argv[1:]] or [
+            ("tests/Class.class", "tests/Class.class"),
+            ("synthetic/constant-pool-heavy", generate_class(SHAPES["constant-pool-heavy"])),
+            ("synthetic/annotation-heavy", generate_class(SHAPES["annotation-heavy"]))
+        ]
+    )
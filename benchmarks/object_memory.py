@@ -0,0 +1,61 @@
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.synthetic import SHAPES, generate_class
+from objects.attributes import AttributeCode
+from parser.class_parser import parse_class
+
+
+# Measures the heap retained per parsed class, with the constant pool fully linked and every
+# attribute decoded, so the whole object model is counted.
+#
+#   python -m benchmarks.object_memory [class file ...]
+
+
+def touch(attributes):
+    for attribute in attributes:
+        if isinstance(attribute, AttributeCode):
+            touch(attribute.attribute_info)
+
+
+def retained_size(source) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    clazz = parse_class(source)
+    list(clazz.constant_pool)
+    for member in clazz.fields + clazz.methods:
+        touch(member.attribute_info)
+    touch(clazz.attribute_info)
+
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del clazz
+    return size
+
+
+def main(sources):
+    print(f"{'class':<32}{'class file':>14}{'retained':>14}{'ratio':>8}")
+    for name, source in sources:
+        if isinstance(source, str):
+            with open(source, "rb") as file:
+                source = file.read()
+
+        # The first parse also populates the process-wide symbol table; measure a warm one
+        retained_size(source)
+        size = retained_size(source)
+        print(f"{name:<32}{len(source) / 1024:>10.1f} KiB{size / 1024:>10.1f} KiB{size / len(source):>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(
+        [(filename, filename) for filename in sys.argv[1:]] or [
+            ("tests/Class.class", "tests/Class.class"),
+            ("tests/HelloWorld_Fields.class", "tests/HelloWorld_Fields.class"),
+            ("tests/TableSwitch.class", "tests/TableSwitch.class"),
+            *((f"synthetic/{shape}", generate_class(SHAPES[shape])) for shape in SHAPES)
+        ]
+    )
@@ -0,0 +1,151 @@
+import argparse
+import json
+import platform
+import sys
+from glob import glob
+from time import perf_counter
+
+from benchmarks.synthetic import SHAPES, generate_class
+from parser.class_parser import PARSER_VERSION, parse_class
+from parser.profiler import PHASES, ParseProfiler
+
+
+# Times parse_class phase by phase, through a ParseProfiler, over the synthetic corpus (one class per
+# shape in SHAPES) and the class files under tests/. Results can be written as JSON and compared
+# against an earlier run.
+#
+#   python -m benchmarks.parser_suite [--shape NAME ...] [--output results.json] [--compare baseline.json]
+
+
+# Relative slowdown reported as a regression by --compare
+REGRESSION_THRESHOLD = 0.10
+
+
+# --------------------------------------------------
+# PHASE TIMING
+# --------------------------------------------------
+
+
+def bench(name, data, repeat) -> dict:
+    # Per-phase minimum over the repeats; total is the best end-to-end parse_class time
+    phases = dict.fromkeys(PHASES, float("inf"))
+    total = float("inf")
+
+    def record(profile):
+        for phase, elapsed in profile.phases.items():
+            phases[phase] = min(phases[phase], elapsed)
+
+    profiler = ParseProfiler(callback=record)
+
+    for _ in range(repeat):
+        parse_class(data, profiler=profiler)
+
+        start = perf_counter()
+        parse_class(data)
+        total = min(total, perf_counter() - start)
+
+    return {
+        "name": name,
+        "bytes": len(data),
+        "total_ms": total * 1e3,
+        "phases_ms": {phase: elapsed * 1e3 for phase, elapsed in phases.items()},
+        "mb_per_s": len(data) / total / 1e6,
+        "classes_per_s": 1 / total
+    }
+
+
+# --------------------------------------------------
+# CORPUS
+# --------------------------------------------------
+
+
+def corpus(shapes) -> list[tuple[str, bytes]]:
+    classes = [(f"synthetic/{shape}", generate_class(SHAPES[shape])) for shape in shapes]
+
+    for filename in sorted(glob("tests/*.class")):
+        with open(filename, "rb") as file:
+            classes.append((filename, file.read()))
+
+    return classes
+
+
+# --------------------------------------------------
+# REPORTING
+# --------------------------------------------------
+
+
+def report(results):
+    print(f"{'class':<32}{'KiB':>8}{'total ms':>10}{'MB/s':>8}{'classes/s':>11}  " + "".join(f"{phase:>14}" for phase in PHASES))
+    for result in results:
+        print(
+            f"{result['name']:<32}{result['bytes'] / 1024:>8.1f}{result['total_ms']:>10.3f}"
+            f"{result['mb_per_s']:>8.2f}{result['classes_per_s']:>11.0f}  "
+            + "".join(f"{result['phases_ms'][phase]:>14.3f}" for phase in PHASES)
+        )
+
+    total_bytes = sum(result["bytes"] for result in results)
+    total_time = sum(result["total_ms"] for result in results) / 1e3
+    print(f"\n{len(results)} classes, {total_bytes / 1e6 / total_time:.2f} MB/s, {len(results) / total_time:.0f} classes/s")
+
+
+def compare(results, baseline):
+    previous = {result["name"]: result for result in baseline["results"]}
+    regressions = 0
+
+    print(f"\nCompared to baseline (parser version {baseline['parser_version']}, Python {baseline['python']})")
+    for result in results:
+        if result["name"] not in previous:
+            continue
+
+        old = previous[result["name"]]
+        timings = [("total", old["total_ms"], result["total_ms"])]
+        # Phases missing from older baselines are skipped
+        timings += [
+            (phase, old["phases_ms"][phase], result["phases_ms"][phase]) for phase in PHASES if phase in old["phases_ms"]
+        ]
+
+        for label, before, after in timings:
+            # Sub-microsecond phases are all noise
+            if before < 1e-3:
+                continue
+
+            change = (after - before) / before
+            if change > REGRESSION_THRESHOLD:
+                regressions += 1
+                print(f"  REGRESSION {result['name']} {label}: {before:.3f} ms -> {after:.3f} ms ({change:+.0%})")
+            elif label == "total":
+                print(f"  {result['name']}: {before:.3f} ms -> {after:.3f} ms ({change:+.0%})")
+
+    return regressions
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(prog="python -m benchmarks.parser_suite")
+    arguments.add_argument("--shape", action="append", choices=SHAPES, help="synthetic shapes to run (default: all)")
+    arguments.add_argument("--repeat", type=int, default=20)
+    arguments.add_argument("--output", help="write results as JSON")
+    arguments.add_argument("--compare", help="JSON results of an earlier run to check for regressions")
+    args = arguments.parse_args(argv)
+
+    results = [bench(name, data, args.repeat) for name, data in corpus(args.shape or SHAPES)]
+    report(results)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({
+                "parser_version": PARSER_VERSION,
+                "python": platform.python_version(),
+                "repeat": args.repeat,
+                "results": results
+            }, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            if compare(results, json.load(file)):
+                return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+from dataclasses import dataclass
+from struct import pack
+
+from parser.class_writer import ClassFileBuilder
+
+
+# --------------------------------------------------
+# SHAPES
+# --------------------------------------------------
+
+
+@dataclass
+class ClassShape:
+    # Extra constants (strings, integers, longs, method refs) beyond what the members need
+    constant_pool_padding: int = 0
+    fields: int = 4
+    methods: int = 10
+    # Bytes of bytecode per method
+    code_size: int = 200
+    # LineNumberTable / LocalVariableTable entries per method
+    line_numbers: int = 0
+    local_variables: int = 0
+    # RuntimeVisibleAnnotations per method
+    annotations: int = 0
+    # StackMapTable frames per 100 bytes of code
+    stack_map_density: float = 0.0
+
+
+SHAPES = {
+    "small": ClassShape(),
+    "constant-pool-heavy": ClassShape(constant_pool_padding=4000, methods=20),
+    "code-heavy": ClassShape(methods=40, code_size=4000),
+    "debug-heavy": ClassShape(methods=40, code_size=1000, line_numbers=300, local_variables=32),
+    "annotation-heavy": ClassShape(methods=60, code_size=50, annotations=6),
+    "stack-map-heavy": ClassShape(methods=40, code_size=1000, stack_map_density=5.0)
+}
+
+
+def method_body(builder: ClassFileBuilder, code_size: int) -> bytes:
+    field = builder.field_ref("bench/Synthetic", "counter", "I")
+    method = builder.method_ref("bench/Synthetic", "tick", "()V")
+
+    block = b"".join((
+        # local1 += 1
+        b"\x1b\x04\x60\x3c",
+        # this.counter; pop
+        b"\x2a\xb4" + pack(">H", field) + b"\x57",
+        # this.tick()
+        b"\x2a\xb6" + pack(">H", method),
+        # if (local1 >= 100) falls through to the next block either way
+        b"\x1b\x10\x64\xa2" + pack(">h", 3)
+    ))
+
+    blocks = max(code_size - 1, 0) // len(block)
+    code = block * blocks
+    return code + bytes(max(code_size - 1 - len(code), 0)) + b"\xb1"
+
+
+def stack_map_frames(builder: ClassFileBuilder, count: int) -> list[bytes]:
+    frames = list()
+
+    for i in range(count):
+        match i % 4:
+            # SameFrame
+            case 0: frames.append(pack(">B", 10))
+            # SameLocals1StackItemFrame, Integer
+            case 1: frames.append(pack(">BB", 64 + 10, 1))
+            # AppendFrame, one Integer local
+            case 2: frames.append(pack(">BHB", 252, 10, 1))
+            # FullFrame, this + Integer locals, empty stack
+            case 3: frames.append(pack(">BHHBHBH", 255, 10, 2, 7, builder.this_class, 1, 0))
+
+    return frames
+
+
+def generate_class(shape: ClassShape, name="bench/Synthetic") -> bytes:
+    builder = ClassFileBuilder(name)
+
+    for i in range(shape.constant_pool_padding):
+        match i % 4:
+            case 0: builder.string(f"constant string {i}")
+            case 1: builder.integer(i)
+            case 2: builder.long(i)
+            case 3: builder.method_ref(f"bench/Dependency{i % 50}", f"call{i}", "(ILjava/lang/String;)V")
+
+    builder.add_field("counter", "I")
+    for i in range(1, shape.fields):
+        builder.add_field(f"field{i}", "Ljava/lang/String;", access_flags=0x0002)
+
+    for m in range(shape.methods):
+        code_size = max(shape.code_size, 1)
+        code_attributes = list()
+
+        if shape.line_numbers:
+            code_attributes.append(builder.line_number_table(
+                [(pc * code_size // shape.line_numbers, pc + 1) for pc in range(shape.line_numbers)]
+            ))
+        if shape.local_variables:
+            code_attributes.append(builder.local_variable_table(
+                [(0, code_size, f"local{i}", "I", i) for i in range(shape.local_variables)]
+            ))
+        if shape.stack_map_density:
+            code_attributes.append(builder.stack_map_table(
+                stack_map_frames(builder, int(code_size * shape.stack_map_density / 100))
+            ))
+
+        method_attributes = [builder.code(
+            method_body(builder, code_size),
+            max_stack=4,
+            max_locals=max(shape.local_variables, 2),
+            attributes=code_attributes
+        )]
+
+        if shape.annotations:
+            method_attributes.append(builder.runtime_visible_annotations([
+                builder.annotation(f"Lbench/Marker{i};", {
+                    "value": f"method{m}",
+                    "priority": i,
+                    "kind": ("Lbench/Kind;", "FAST"),
+                    "tags": ["a", "b", "c"]
+                }) for i in range(shape.annotations)
+            ]))
+
+        builder.add_method(f"method{m}", "()V", attributes=method_attributes)
+
+    builder.add_method("tick", "()V", attributes=[builder.code(b"\xb1", max_stack=0, max_locals=1)])
+    builder.attributes.append(builder.attribute("SourceFile", pack(">H", builder.utf8("Synthetic.java"))))
+
+    return builder.build()
+
+
+def debug_heavy_class(methods=50, code_size=2000, locals_per_method=64) -> bytes:
+    builder = ClassFileBuilder()
+
+    for m in range(methods):
+        # nop sled terminated by return
+        code = bytes(code_size - 1) + b"\xb1"
+        line_numbers = [(pc, pc // 4 + 1) for pc in range(0, code_size, 2)]
+        local_variables = [(0, code_size, f"local{i}", "I", i) for i in range(locals_per_method)]
+        exception_table = [(0, code_size - 1, 0, 0)] * 32
+
+        builder.add_method(f"method{m}", "()V", attributes=[builder.code(
+            code,
+            max_locals=locals_per_method,
+            exception_table=exception_table,
+            attributes=[
+                builder.line_number_table(line_numbers),
+                builder.local_variable_table(local_variables)
+            ]
+        )])
+
+    return builder.build()
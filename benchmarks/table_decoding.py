@@ -0,0 +1,87 @@
+from struct import pack
+from timeit import repeat
+
+from benchmarks.synthetic import debug_heavy_class
+from objects.attributes import ExceptionHandler, LineNumber, LocalVariable
+from parser.byte_reader import ByteReader
+from parser.class_parser import EXCEPTION_HANDLER, LINE_NUMBER, LOCAL_VARIABLE, parse_class
+
+
+# Compares per-field decoding (one reader call per u2) against the precompiled struct layouts used by
+# parse_attribute, then times a full parse of a class dominated by debug tables.
+#
+#   python -m benchmarks.table_decoding
+
+
+ROWS = 10_000
+
+
+def per_field_line_numbers(reader, count):
+    return [LineNumber(reader.u2(), reader.u2()) for _ in range(count)]
+
+
+def per_field_exception_table(reader, count):
+    return [ExceptionHandler(reader.u2(), reader.u2(), reader.u2(), reader.u2()) for _ in range(count)]
+
+
+def per_field_local_variables(reader, count, constant_pool):
+    return [LocalVariable(
+        reader.u2(),
+        reader.u2(),
+        constant_pool[reader.u2()],
+        constant_pool[reader.u2()],
+        reader.u2()
+    ) for _ in range(count)]
+
+
+def struct_line_numbers(reader, count):
+    return [LineNumber(*entry) for entry in reader.table(LINE_NUMBER, count)]
+
+
+def struct_exception_table(reader, count):
+    return [ExceptionHandler(*entry) for entry in reader.table(EXCEPTION_HANDLER, count)]
+
+
+def struct_local_variables(reader, count, constant_pool):
+    return [
+        LocalVariable(start_pc, length, constant_pool[name_index], constant_pool[descriptor_index], index)
+        for start_pc, length, name_index, descriptor_index, index in reader.table(LOCAL_VARIABLE, count)
+    ]
+
+
+def best_of(func, data, *args, number=20):
+    return min(repeat(lambda: func(ByteReader(data), *args), number=number, repeat=5)) / number
+
+
+def main():
+    constant_pool = [None, "name", "I"]
+    tables = {
+        "LineNumberTable": (
+            b"".join(pack(">2H", i, i) for i in range(ROWS)),
+            per_field_line_numbers, struct_line_numbers, ()
+        ),
+        "Code exception_table": (
+            b"".join(pack(">4H", i, i + 1, i + 2, 0) for i in range(ROWS)),
+            per_field_exception_table, struct_exception_table, ()
+        ),
+        "LocalVariableTable": (
+            b"".join(pack(">5H", i, 1, 1, 2, i) for i in range(ROWS)),
+            per_field_local_variables, struct_local_variables, (constant_pool,)
+        )
+    }
+
+    print(f"{'table':<24}{'per-field':>14}{'struct':>14}{'speedup':>10}")
+    for name, (data, per_field, bulk, args) in tables.items():
+        assert per_field(ByteReader(data), ROWS, *args) == bulk(ByteReader(data), ROWS, *args)
+
+        per_field_time = best_of(per_field, data, ROWS, *args)
+        bulk_time = best_of(bulk, data, ROWS, *args)
+        print(f"{name:<24}{per_field_time * 1e3:>11.2f} ms{bulk_time * 1e3:>11.2f} ms{per_field_time / bulk_time:>9.1f}x")
+
+    clazz = debug_heavy_class()
+    parse_time = min(repeat(lambda: parse_class(clazz), number=5, repeat=5)) / 5
+    print(f"\nparse_class on debug-heavy class ({len(clazz) / 1024:.0f} KiB): {parse_time * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import sys
+from collections import Counter
+from timeit import repeat
+
+from objects.attributes import AttributeCode
+from parser.class_parser import parse_class
+from parser.class_reader import ClassReader, ClassVisitor
+
+
+# Counts invoked methods with a ClassReader visitor and with a full parse_class walk, and times a
+# visitor that only collects Methodref constants and skips every member.
+#
+#   python -m benchmarks.visitor_scan [class file ...]
+
+
+INVOKES = {182, 183, 184, 185}
+
+
+class MethodrefCounter(ClassVisitor):
+    def __init__(self):
+        self.calls = Counter()
+
+    def visit_attribute(self, name, length):
+        # Only bytecode is of interest
+        return name == "Code"
+
+    def visit_code(self, max_stack, max_locals, code, exception_table):
+        for index, opcode in enumerate(code.opcodes):
+            if opcode in INVOKES:
+                self.calls[code.operands[code.operand_starts[index]]] += 1
+
+
+class MethodrefConstants(ClassVisitor):
+    def __init__(self):
+        self.methodrefs = list()
+
+    def visit_constant(self, index, entry):
+        if entry.tag == 10 or entry.tag == 11:
+            self.methodrefs.append(index)
+
+    def visit_field(self, access_flags, name, descriptor):
+        return False
+
+    def visit_method(self, access_flags, name, descriptor):
+        return False
+
+    def visit_attribute(self, name, length):
+        return False
+
+
+def constants_scan(source):
+    collector = MethodrefConstants()
+    ClassReader(source).accept(collector)
+    return collector.methodrefs
+
+
+def visitor_scan(source):
+    counter = MethodrefCounter()
+    ClassReader(source).accept(counter)
+    return counter.calls
+
+
+def parse_class_scan(source):
+    calls = Counter()
+
+    for method in parse_class(source).methods:
+        for attribute in method.attribute_info:
+            if isinstance(attribute, AttributeCode):
+                code = attribute.code
+                for index, opcode in enumerate(code.opcodes):
+                    if opcode in INVOKES:
+                        calls[code.operands[code.operand_starts[index]]] += 1
+
+    return calls
+
+
+def main(filenames):
+    for filename in filenames:
+        with open(filename, "rb") as file:
+            data = file.read()
+
+        assert visitor_scan(data) == parse_class_scan(data)
+
+        visitor_time = min(repeat(lambda: visitor_scan(data), number=10, repeat=5)) / 10
+        parse_time = min(repeat(lambda: parse_class_scan(data), number=10, repeat=5)) / 10
+        constants_time = min(repeat(lambda: constants_scan(data), number=10, repeat=5)) / 10
+        print(f"{filename}")
+        print(f"  call sites, parse_class:    {parse_time * 1e3:8.2f} ms")
+        print(f"  call sites, visitor:        {visitor_time * 1e3:8.2f} ms")
+        print(f"  Methodref constants only:   {constants_time * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["tests/Class.class"])
@@ -1,8 +1,10 @@
+import sys
+
 from runtime.pyjvm import JVM
 
 
 def main():
-    JVM("tests/HelloWorld_Fields.class")
+    sys.exit(JVM("tests/HelloWorld_Fields.class").run())
 
 
 if __name__ == "__main__":
@@ -1,22 +1,70 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntFlag
 
 from objects.constant_pool import *
 from objects.stack_map_frames import StackMapFrame
-from runtime.opcodes import ParsedOpcode
+from objects.bytecode import Bytecode
+from objects.stateless import Stateless
 
 
 class Attribute:
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeUnparsed:
     attribute_name_index: int
     attribute_length: int
 
 
-@dataclass
+@dataclass(slots=True)
+class AttributeLazy(Attribute):
+    attribute_name_index: int
+    attribute_length: int
+    # Start of the undecoded attribute body within the class file buffer
+    offset: int
+
+
+class LazyAttributeList(Sequence):
+    __slots__ = ("__attributes", "source", "decode")
+
+    def __init__(self, attributes: list[Attribute], source, decode: callable):
+        self.__attributes = attributes
+        # Class file buffer the recorded offsets refer to
+        self.source = source
+        self.decode = decode
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        attribute = self.__attributes[index]
+        if isinstance(attribute, AttributeLazy):
+            # Decode on first access and cache the result in place
+            attribute = self.__attributes[index] = self.decode(attribute, self.source)
+
+        return attribute
+
+    def __len__(self):
+        return len(self.__attributes)
+
+    def __eq__(self, other):
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self):
+        return repr(self.__attributes)
+
+    def raw_attributes(self) -> list[Attribute]:
+        # As stored: decoded attributes and AttributeLazy placeholders
+        return self.__attributes
+
+    def __reduce__(self):
+        # Serialized fully decoded; the buffer does not travel with it
+        return list, (list(self),)
+
+
+@dataclass(slots=True)
 class AttributeUnrecognized(Attribute):
     attribute_name_index: int
     attribute_length: int
@@ -24,12 +72,12 @@ class AttributeUnrecognized(Attribute):
     info: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeConstantValue(Attribute):
     constantvalue: PConstantPoolEntry
 
 
-@dataclass
+@dataclass(slots=True)
 class ExceptionHandler:
     start_pc: int
     end_pc: int
@@ -37,102 +85,102 @@ class ExceptionHandler:
     catch_type: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeCode(Attribute):
     max_stack: int
     max_locals: int
     code_length: int
-    code: dict[int, ParsedOpcode]
+    code: Bytecode
     exception_table_length: int
     exception_table: list[ExceptionHandler]
     attributes_count: int
     attribute_info: list[Attribute]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeStackMapTable(Attribute):
     number_of_entries: int
     entries: list[StackMapFrame]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeExceptions(Attribute):
     number_of_exceptions: int
     exception_index_table: list[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeExceptions(Attribute):
     number_of_exceptions: int
     exception_index_table: list[int]
 
 
-class InnerClassAccessFlags(Enum):
-    ACC_PUBLIC = b'0001'
-    ACC_PRIVATE = b'0002'
-    ACC_PROTECTED = b'0004'
-    ACC_STATIC = b'0008'
-    ACC_FINAL = b'0010'
-    ACC_INTERFACE = b'0200'
-    ACC_ABSTRACT = b'0400'
-    ACC_SYNTHETIC = b'1000'
-    ACC_ANNOTATION = b'2000'
-    ACC_ENUM = b'4000'
+class InnerClassAccessFlags(IntFlag):
+    ACC_PUBLIC = 0x0001
+    ACC_PRIVATE = 0x0002
+    ACC_PROTECTED = 0x0004
+    ACC_STATIC = 0x0008
+    ACC_FINAL = 0x0010
+    ACC_INTERFACE = 0x0200
+    ACC_ABSTRACT = 0x0400
+    ACC_SYNTHETIC = 0x1000
+    ACC_ANNOTATION = 0x2000
+    ACC_ENUM = 0x4000
 
 
 
-@dataclass
+@dataclass(slots=True)
 class InnerClassEntry:
     inner_class_info: PConstantClassInfo
     outer_class_info: any
     inner_name: any
-    inner_class_access_flags: list[InnerClassAccessFlags]
+    inner_class_access_flags: InnerClassAccessFlags
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeInnerClasses(Attribute):
     number_of_classes: int
     classes: list[InnerClassEntry]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeEnclosingMethod(Attribute):
     clazz: PConstantClassInfo
     method: any
 
 
-class AttributeSynthetic(Attribute):
-    pass
+class AttributeSynthetic(Stateless, Attribute):
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeSignature(Attribute):
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeSourceFile(Attribute):
     sourcefile: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeSourceDebugExtension(Attribute):
     debug_extension: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class LineNumber:
     start_pc: int
     line_number: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeLineNumberTable(Attribute):
     line_number_table_length: int
     line_number_table: list[LineNumber]
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalVariable:
     start_pc: int
     length: int
@@ -141,13 +189,13 @@ class LocalVariable:
     index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeLocalVariableTable(Attribute):
     local_variable_table_length: int
     local_variable_table: list[LocalVariable]
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalVariableType:
     start_pc: int
     length: int
@@ -156,205 +204,205 @@ class LocalVariableType:
     index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeLocalVariableTypeTable(Attribute):
     local_variable_type_table_length: int
     local_variable_type_table: list[LocalVariableType]
 
 
-@dataclass
-class AttributeDeprecated(Attribute):
+@dataclass(slots=True)
+class AttributeDeprecated(Stateless, Attribute):
     pass
 
 
 class ElementValue:
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ByteElementValue(ElementValue):
     const_value: PConstantIntegerInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class CharElementValue(ElementValue):
     const_value: PConstantIntegerInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class DoubleElementValue(ElementValue):
     const_value: PConstantDoubleInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatElementValue(ElementValue):
     const_value: PConstantFloatInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class IntElementValue(ElementValue):
     const_value: PConstantIntegerInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class LongElementValue(ElementValue):
     const_value: PConstantLongInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class ShortElementValue(ElementValue):
     const_value: PConstantIntegerInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class BooleanElementValue(ElementValue):
     const_value: PConstantIntegerInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class StringElementValue(ElementValue):
     const_value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EnumElementValue(ElementValue):
     type_name: str
     const_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassElementValue(ElementValue):
     class_info: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementValuePair:
     element_name: int
     element_value: ElementValue
 
 
-@dataclass
+@dataclass(slots=True)
 class Annotation(ElementValue):
     type_: str
     num_element_value_pairs: int
     element_value_pairs: list[ElementValuePair]
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayElementValue(ElementValue):
     num_values: int
     values: list[ElementValue]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeRuntimeVisibleAnnotations(Attribute):
     num_annotations: int
     annotations: list[Annotation]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeRuntimeInvisibleAnnotations(Attribute):
     num_annotations: int
     annotations: list[Annotation]
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterAnnotations:
     num_annotations: int
     annotations: list[Annotation]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeRuntimeVisibleParameterAnnotations(Attribute):
     num_parameters: int
     parameter_annotations: list[ParameterAnnotations]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeRuntimeInvisibleParameterAnnotations(Attribute):
     num_parameters: int
     parameter_annotations: list[ParameterAnnotations]
 
 
 class TargetInfo:
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeParameterTarget(TargetInfo):
     type_parameter_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SupertypeTarget(TargetInfo):
     supertype_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeParameterBoundTarget(TargetInfo):
     type_parameter_index: int
     bound_index: int
 
 
-@dataclass
-class EmptyTarget(TargetInfo):
+@dataclass(slots=True)
+class EmptyTarget(Stateless, TargetInfo):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class FormalParameterTarget(TargetInfo):
     formal_parameter_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ThrowsTarget(TargetInfo):
     throws_type_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalvarInfo:
     start_pc: int
     length: int
     index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalvarTarget(TargetInfo):
     table_length: int
     table: list[LocalvarInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class CatchTarget(TargetInfo):
     exception_table_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class OffsetTarget(TargetInfo):
     offset: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeArgumentTarget(TargetInfo):
     offset: int
     type_argument_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PathStep:
     type_path_kind: int
     type_argument_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TypePath:
     path_length: int
     path: list[PathStep]
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeAnnotation:
-    target_type: str
+    target_type: int
     target_info: TargetInfo
     target_path: TypePath
     type_: str
@@ -362,49 +410,49 @@ class TypeAnnotation:
     element_value_pairs: list[ElementValuePair]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeRuntimeVisibleTypeAnnotations(Attribute):
     num_annotations: int
     annotations: list[TypeAnnotation]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeRuntimeInvisibleTypeAnnotations(Attribute):
     num_annotations: int
     annotations: list[TypeAnnotation]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeAnnotationDefault(Attribute):
     default_value: ElementValue
 
 
-@dataclass
+@dataclass(slots=True)
 class BootstrapMethod:
     bootstrap_method_ref: PConstantMethodHandleInfo
     num_bootstrap_arguments: int
     bootstrap_arguments: list[PConstantPoolEntry]
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeBootstrapMethods(Attribute):
     num_bootstrap_methods: int
     bootstrap_methods: list[BootstrapMethod]
 
 
-class MethodParameterFlags(Enum):
-    ACC_FINAL = b'0010'
-    ACC_SYNTHETIC = b'1000'
-    ACC_MANDATED = b'8000'
+class MethodParameterFlags(IntFlag):
+    ACC_FINAL = 0x0010
+    ACC_SYNTHETIC = 0x1000
+    ACC_MANDATED = 0x8000
 
 
-@dataclass
+@dataclass(slots=True)
 class MethodParameter:
     name_index: int
-    access_flags: list[MethodParameterFlags]
+    access_flags: MethodParameterFlags
 
 
-@dataclass
+@dataclass(slots=True)
 class AttributeMethodParameters(Attribute):
     num_bootstrap_methods: int
     bootstrap_methods: list[MethodParameter]
@@ -2,6 +2,6 @@ from dataclasses import dataclass
 from objects.attributes import ElementValue, Annotation
 
 
-@dataclass
+@dataclass(slots=True)
 class AnnotationElementValue(ElementValue):
     annotation_value: Annotation
@@ -0,0 +1,76 @@
+from array import array
+from collections.abc import Mapping
+
+from runtime.opcodes import opcodes, ParsedOpcode
+
+
+# Marks pcs that do not start an instruction
+NO_INSTRUCTION = 0xFFFF
+
+
+# Array-backed method body. Instructions are stored in parallel arrays indexed by instruction index,
+# with a pc -> index table for O(1) access either way. Operands of all instructions share one flat
+# array, sliced through `operand_starts`.
+#
+# Operands are stored decoded (see parse_bytecode): constant pool indices as ints, immediates
+# sign-extended and every branch or switch target as an absolute pc.
+#
+# Behaves as a read-only mapping of pc -> ParsedOpcode, which is built on access.
+class Bytecode(Mapping):
+    __slots__ = ("code_length", "opcodes", "pcs", "operand_starts", "operands", "pc_index")
+
+    def __init__(self, code_length: int, opcodes: array, pcs: array, operand_starts: array, operands: array):
+        self.code_length = code_length
+        # u1 opcode per instruction
+        self.opcodes = opcodes
+        # u2 pc per instruction
+        self.pcs = pcs
+        # Start of each instruction's operands in `operands`; one extra trailing entry marks the end
+        self.operand_starts = operand_starts
+        self.operands = operands
+
+        self.pc_index = array("H", [NO_INSTRUCTION]) * code_length
+        for index, pc in enumerate(pcs):
+            self.pc_index[pc] = index
+
+    def __getitem__(self, pc) -> ParsedOpcode:
+        return self.at(self.index_of(pc))
+
+    def __iter__(self):
+        return iter(self.pcs)
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def __contains__(self, pc):
+        return 0 <= pc < self.code_length and self.pc_index[pc] != NO_INSTRUCTION
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def index_of(self, pc) -> int:
+        if pc not in self:
+            raise KeyError(pc)
+        return self.pc_index[pc]
+
+    def pc_of(self, index) -> int:
+        return self.pcs[index]
+
+    def opcode_at(self, index) -> int:
+        return self.opcodes[index]
+
+    def operands_at(self, index) -> tuple[int, ...]:
+        return tuple(self.operands[self.operand_starts[index]:self.operand_starts[index + 1]])
+
+    def at(self, index) -> ParsedOpcode:
+        opcode = self.opcodes[index]
+        operands = self.operands_at(index)
+
+        match opcode:
+            # tableswitch: default target, low, high, targets...
+            case 170: params = (operands[0], operands[1], operands[2], operands[3:])
+            # lookupswitch: default target, npairs, (match, target)...
+            case 171: params = (operands[0], dict(zip(operands[2::2], operands[3::2])))
+            case _: params = operands
+
+        return ParsedOpcode(opcodes[opcode].func_ref, params)
@@ -1,29 +1,29 @@
 from dataclasses import dataclass, Field
-from enum import Enum
+from enum import IntFlag
 
 from objects.attributes import Attribute
 from objects.constant_pool import ConstantPoolEntry
 from objects.methods import Method
 
 
-class ClassFlags(Enum):
-    ACC_PUBLIC = b'0001'
-    ACC_SUPER = b'0020'
-    ACC_FINAL = b'0010'
-    ACC_INTERFACE = b'0200'
-    ACC_ABSTRACT = b'0400'
-    ACC_SYNTHETIC = b'1000'
-    ACC_ANNOTATION = b'2000'
-    ACC_ENUM = b'4000'
+class ClassFlags(IntFlag):
+    ACC_PUBLIC = 0x0001
+    ACC_SUPER = 0x0020
+    ACC_FINAL = 0x0010
+    ACC_INTERFACE = 0x0200
+    ACC_ABSTRACT = 0x0400
+    ACC_SYNTHETIC = 0x1000
+    ACC_ANNOTATION = 0x2000
+    ACC_ENUM = 0x4000
 
 
-@dataclass
+@dataclass(slots=True)
 class Class:
     minor_version: int
     major_version: int
     constant_pool_count: int
     constant_pool: list[ConstantPoolEntry]
-    access_flags: list[ClassFlags]
+    access_flags: ClassFlags
     this_class: int
     super_class: int
     interfaces_count: int
@@ -36,7 +36,28 @@ class Class:
     attribute_info: list[Attribute]
 
 
-@dataclass
+@dataclass(slots=True)
+class ClassSummary:
+    minor_version: int
+    major_version: int
+    access_flags: ClassFlags
+    this_class: str
+    super_class: str | None
+    interfaces: list[str]
+    # Names of every Class entry in the constant pool
+    class_references: list[str]
+
+
+@dataclass(slots=True)
 class ClassInstance:
     identifier: str
-    fields: dict[str, any]
\ No newline at end of file
+    # Indexed by the slots of the class's field layout (objects/runtime.py FieldLayout)
+    fields: list
+
+# Java array; elements are stored unboxed, one per element regardless of type
+class ArrayInstance(list):
+    __slots__ = ("descriptor",)
+
+    def __init__(self, descriptor: str, elements):
+        super().__init__(elements)
+        self.descriptor = descriptor
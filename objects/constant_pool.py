@@ -2,13 +2,14 @@ from dataclasses import dataclass
 
 
 class ConstantPoolEntry:
+    __slots__ = ()
     tag: int
 
 class PConstantPoolEntry:
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantNameAndTypeInfo(ConstantPoolEntry):
     tag = 12
     # ConstantUtf8Info
@@ -17,25 +18,25 @@ class ConstantNameAndTypeInfo(ConstantPoolEntry):
     descriptor_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantNameAndTypeInfo(PConstantPoolEntry):
     name: str
     descriptor: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantClassInfo(ConstantPoolEntry):
     tag = 7
     # ConstantUtf8Info
     name_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantClassInfo(PConstantPoolEntry):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantFieldrefInfo(ConstantPoolEntry):
     tag = 9
     # ConstantClassInfo
@@ -44,13 +45,13 @@ class ConstantFieldrefInfo(ConstantPoolEntry):
     name_and_type_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantFieldrefInfo(PConstantPoolEntry):
     clazz: PConstantClassInfo
     name_and_type: PConstantNameAndTypeInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantMethodrefInfo(ConstantPoolEntry):
     tag = 10
     # ConstantClassInfo
@@ -59,13 +60,13 @@ class ConstantMethodrefInfo(ConstantPoolEntry):
     name_and_type_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantMethodrefInfo(PConstantPoolEntry):
     clazz: PConstantClassInfo
     name_and_type: PConstantNameAndTypeInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantInterfaceMethodrefInfo(ConstantPoolEntry):
     tag = 11
     # ConstantClassInfo
@@ -74,71 +75,71 @@ class ConstantInterfaceMethodrefInfo(ConstantPoolEntry):
     name_and_type_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantInterfaceMethodrefInfo(PConstantPoolEntry):
     clazz: PConstantClassInfo
     name_and_type: PConstantNameAndTypeInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantStringInfo(ConstantPoolEntry):
     tag = 8
     # ConstantUtf8Info
     string_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantStringInfo(PConstantPoolEntry):
     string: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantIntegerInfo(ConstantPoolEntry):
     tag = 3
     bytes: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantIntegerInfo(PConstantPoolEntry):
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantFloatInfo(ConstantPoolEntry):
     tag = 4
     bytes: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantFloatInfo(PConstantPoolEntry):
     value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantLongInfo(ConstantPoolEntry):
     tag = 5
     high_bytes: bytes
     low_bytes: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantLongInfo(PConstantPoolEntry):
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantDoubleInfo(ConstantPoolEntry):
     tag = 6
     high_bytes: bytes
     low_bytes: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantDoubleInfo(PConstantPoolEntry):
     value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantUtf8Info(ConstantPoolEntry):
     tag = 1
     length: int
@@ -146,7 +147,7 @@ class ConstantUtf8Info(ConstantPoolEntry):
     bytes: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantMethodHandleInfo(ConstantPoolEntry):
     tag = 15
     reference_kind: int
@@ -154,25 +155,25 @@ class ConstantMethodHandleInfo(ConstantPoolEntry):
     reference_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantMethodHandleInfo(PConstantPoolEntry):
     reference_kind: int
     reference: PConstantPoolEntry
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantMethodTypeInfo(ConstantPoolEntry):
     tag = 16
     # ConstantUtf8Info
     descriptor_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantMethodTypeInfo(PConstantPoolEntry):
     descriptor: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstantInvokeDynamicInfo(ConstantPoolEntry):
     tag = 18
     # bootstrap_methods index
@@ -181,7 +182,7 @@ class ConstantInvokeDynamicInfo(ConstantPoolEntry):
     name_and_type_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PConstantInvokeDynamicInfo(PConstantPoolEntry):
     # bootstrap_methods index
     bootstrap_method_attr_index: int
@@ -9,6 +9,17 @@ class ClassFormatError(Exception):
         return self.message if self.message else "No further details provided"
 
 
+class VerifyError(Exception):
+    def __init__(self, *args):
+        if args:
+            self.message = args[0]
+        else:
+            self.message = None
+
+    def __str__(self):
+        return self.message if self.message else "No further details provided"
+
+
 class UnsupportedClassVersionError(Exception):
     def __init__(self, *args):
         if args:
@@ -1,24 +1,24 @@
 from dataclasses import dataclass
-from enum import auto, Enum
+from enum import IntFlag
 
 from objects.attributes import Attribute
 
 
-class FieldFlags(Enum):
-    ACC_PUBLIC = b'0001'
-    ACC_PRIVATE = b'0002'
-    ACC_PROTECTED = b'0004'
-    ACC_STATIC = b'0008'
-    ACC_FINAL = b'0010'
-    ACC_VOLATILE = b'0040'
-    ACC_TRANSIENT = b'0080'
-    ACC_SYNTHETIC = b'1000'
-    ACC_ENUM = b'4000'
+class FieldFlags(IntFlag):
+    ACC_PUBLIC = 0x0001
+    ACC_PRIVATE = 0x0002
+    ACC_PROTECTED = 0x0004
+    ACC_STATIC = 0x0008
+    ACC_FINAL = 0x0010
+    ACC_VOLATILE = 0x0040
+    ACC_TRANSIENT = 0x0080
+    ACC_SYNTHETIC = 0x1000
+    ACC_ENUM = 0x4000
 
 
-@dataclass
+@dataclass(slots=True)
 class Field:
-    access_flags: list[FieldFlags]
+    access_flags: FieldFlags
     name: int
     descriptor: int
     attributes_count: int
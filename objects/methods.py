@@ -1,27 +1,27 @@
 from dataclasses import dataclass
-from enum import auto, Enum
+from enum import IntFlag
 
 from objects.attributes import Attribute
 
 
-class MethodFlags(Enum):
-    ACC_PUBLIC = b'0001'
-    ACC_PRIVATE = b'0002'
-    ACC_PROTECTED = b'0004'
-    ACC_STATIC = b'0008'
-    ACC_FINAL = b'0010'
-    ACC_SYNCHRONIZED = b'0020'
-    ACC_BRIDGE = b'0040'
-    ACC_VARARGS = b'0080'
-    ACC_NATIVE = b'0100'
-    ACC_ABSTRACT = b'0400'
-    ACC_STRICT = b'0800'
-    ACC_SYNTHETIC = b'1000'
+class MethodFlags(IntFlag):
+    ACC_PUBLIC = 0x0001
+    ACC_PRIVATE = 0x0002
+    ACC_PROTECTED = 0x0004
+    ACC_STATIC = 0x0008
+    ACC_FINAL = 0x0010
+    ACC_SYNCHRONIZED = 0x0020
+    ACC_BRIDGE = 0x0040
+    ACC_VARARGS = 0x0080
+    ACC_NATIVE = 0x0100
+    ACC_ABSTRACT = 0x0400
+    ACC_STRICT = 0x0800
+    ACC_SYNTHETIC = 0x1000
 
 
-@dataclass
+@dataclass(slots=True)
 class Method:
-    access_flags: list[MethodFlags]
+    access_flags: MethodFlags
     name: int
     descriptor: int
     attributes_count: int
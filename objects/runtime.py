@@ -1,8 +1,72 @@
+from array import array
 from dataclasses import dataclass
 
 
-@dataclass
+# Method body prepared for the interpreter (runtime/interpreter.py). Instructions are addressed by
+# index; `args[i]` holds instruction i's operands resolved into the form its handler expects.
+@dataclass(slots=True)
+class Executable:
+    opcodes: list[int]
+    args: list[any]
+    max_stack: int
+    max_locals: int
+    # (start index, end index, handler index, catch class name or None for any)
+    exception_table: list[tuple[int, int, int, str | None]]
+    # pc of each instruction, for error reporting
+    pcs: array
+
+
+# Method tables of a class as linked by one VM (runtime/pyjvm.py). `vtable` holds the callable each
+# virtual method selects for objects of the class, at the index `slots` gives for its (name,
+# descriptor); subclasses keep the indices of their superclass and override entries in place.
+# Private methods take a slot of their own that subclasses never override. `interfaces` lists every
+# interface the class implements, and `itables` the callables for each one, in the order of that
+# interface's own `slots`. An interface's `vtable` holds its default methods, or placeholders
+# raising AbstractMethodError, and `interfaces` starts with the interface itself.
+@dataclass(slots=True)
+class MethodTables:
+    vtable: list
+    slots: dict[tuple[str, str], int]
+    private: dict[tuple[str, str], int]
+    interfaces: tuple[str, ...]
+    itables: dict[str, list]
+
+
+# Instance field layout of a class as linked by one VM (runtime/pyjvm.py). Objects keep their fields
+# in a list, at the index `slots` gives for each (declaring class, name): superclass fields come first
+# and keep their index in every subclass, and a field shadowing one of a superclass takes a slot of
+# its own. `defaults` holds the initial value of every slot.
+@dataclass(slots=True)
+class FieldLayout:
+    slots: dict[tuple[str, str], int]
+    defaults: list
+
+
+# Activation of one bytecode method. `locals` and `stack` are allocated once at their exact sizes
+# (max_locals, max_stack) and never resized; `sp` is the index of the first free stack slot. Long and
+# double values take two slots in both, the value followed by a second slot whose content is
+# unspecified.
+@dataclass(slots=True)
 class Frame:
-    local_vars = list
-    operand_stack = list
-    constant_pool = list
+    vm: any
+    # Class declaring the executing method
+    clazz: any
+    code: Executable
+    locals: list
+    stack: list
+    sp: int = 0
+    # Set by the return instructions
+    result: any = None
+
+
+# Carries a Java throwable (a ClassInstance) up through the interpreter
+class JavaException(Exception):
+    def __init__(self, instance):
+        super().__init__(instance)
+        self.instance = instance
+
+    def __str__(self):
+        # The message is the first field of every throwable (see runtime/natives.py builtin_fields)
+        message = self.instance.fields[0]
+        name = self.instance.identifier.replace("/", ".")
+        return f"{name}: {message}" if message is not None else name
@@ -4,43 +4,58 @@ from objects.type_verification import VerificationTypeInfo
 
 
 class StackMapFrame:
-    pass
+    __slots__ = ()
 
 
-@dataclass
+SAME_FRAMES = dict[int, "SameFrame"]()
+
+
+# Interned per frame_type (0-63) and immutable, so instances are shared between all tables
+@dataclass(slots=True, frozen=True)
 class SameFrame(StackMapFrame):
     # Offset delta
     frame_type: int
 
+    def __new__(cls, frame_type):
+        instance = SAME_FRAMES.get(frame_type)
+        if instance is None:
+            instance = SAME_FRAMES[frame_type] = object.__new__(cls)
+
+        return instance
+
+    def __reduce__(self):
+        # Unpickles through __new__ so the interned instance is reused
+        return SameFrame, (self.frame_type,)
+
 
-@dataclass
+@dataclass(slots=True)
 class SameLocals1StackItemFrame(StackMapFrame):
     # Offset delta + 64
     frame_type: int
     stack: list[VerificationTypeInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class SameLocals1StackItemFrameExtended(StackMapFrame):
     frame_type: int
     offset_delta: int
     stack: list[VerificationTypeInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class ChopFrame(StackMapFrame):
     # k (missing locals) + 251
     frame_type: int
     offset_delta: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SameFrameExtended(StackMapFrame):
     frame_type: int
     offset_delta: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AppendFrame(StackMapFrame):
     frame_type: int
     offset_delta: int
@@ -48,7 +63,7 @@ class AppendFrame(StackMapFrame):
     locals: list[VerificationTypeInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class FullFrame(StackMapFrame):
     frame_type: int
     offset_delta: int
@@ -0,0 +1,17 @@
+# Base for parsed objects that carry no state, such as most verification types. Every
+# instantiation returns the one shared instance of the class, and so does unpickling, which
+# goes through __new__ as well.
+class Stateless:
+    __slots__ = ()
+
+    def __new__(cls):
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = object.__new__(cls)
+            # Class attribute; instances themselves have no slots to write to
+            cls._instance = instance
+
+        return instance
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
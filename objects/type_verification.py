@@ -1,43 +1,45 @@
 from dataclasses import dataclass
 
+from objects.stateless import Stateless
+
 
 class VerificationTypeInfo:
-    pass
+    __slots__ = ()
 
 
-class TopVariableInfo(VerificationTypeInfo):
-    pass
+class TopVariableInfo(Stateless, VerificationTypeInfo):
+    __slots__ = ()
 
 
-class IntegerVariableInfo(VerificationTypeInfo):
-    pass
+class IntegerVariableInfo(Stateless, VerificationTypeInfo):
+    __slots__ = ()
 
 
-class FloatVariableInfo(VerificationTypeInfo):
-    pass
+class FloatVariableInfo(Stateless, VerificationTypeInfo):
+    __slots__ = ()
 
 
-class NullVariableInfo(VerificationTypeInfo):
-    pass
+class NullVariableInfo(Stateless, VerificationTypeInfo):
+    __slots__ = ()
 
 
-class UninitializedThisVariableInfo(VerificationTypeInfo):
-    pass
+class UninitializedThisVariableInfo(Stateless, VerificationTypeInfo):
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectVariableInfo(VerificationTypeInfo):
     cpool_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UninitializedVariableInfo(VerificationTypeInfo):
     offset: int
 
 
-class LongVariableInfo(VerificationTypeInfo):
-    pass
+class LongVariableInfo(Stateless, VerificationTypeInfo):
+    __slots__ = ()
 
 
-class DoubleVariableInfo(VerificationTypeInfo):
-    pass
+class DoubleVariableInfo(Stateless, VerificationTypeInfo):
+    __slots__ = ()
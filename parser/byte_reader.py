@@ -0,0 +1,104 @@
+import mmap
+import os
+import sys
+from struct import Struct
+
+
+U4 = Struct(">I")
+S4 = Struct(">i")
+
+
+# A mapping stays valid without its file, so on Python 3.13+ (Unix) it is made without a descriptor
+# of its own: lazily parsed classes keep their mapping for as long as they live. Older versions
+# always duplicate the descriptor; the mapping then holds it until ByteReader.close or collection
+# closes the mapping.
+MAP_OPTIONS = {"trackfd": False} if sys.version_info >= (3, 13) and os.name != "nt" else {}
+
+
+def map_file(file) -> mmap.mmap | None:
+    # Returns None for empty files, which cannot be mapped
+    if os.fstat(file.fileno()).st_size == 0:
+        return None
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ, **MAP_OPTIONS)
+
+
+# Cursor over a class file held in a single buffer. Filenames are memory-mapped; anything else must
+# support the buffer protocol (bytes, bytearray, memoryview, mmap, ...). Values are decoded straight
+# out of the underlying memoryview without intermediate reads or copies.
+class ByteReader:
+    def __init__(self, source, offset=0):
+        self._mapping = None
+
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as file:
+                self._mapping = map_file(file)
+                source = self._mapping if self._mapping is not None else file.read()
+
+        self.source = source
+        self.buffer = memoryview(source).cast("B")
+        self.offset = offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def remaining(self) -> int:
+        return len(self.buffer) - self.offset
+
+    def u1(self) -> int:
+        value = self.buffer[self.offset]
+        self.offset += 1
+        return value
+
+    def u2(self) -> int:
+        buffer = self.buffer
+        offset = self.offset
+        self.offset = offset + 2
+        return (buffer[offset] << 8) | buffer[offset + 1]
+
+    def u4(self) -> int:
+        value = U4.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 4
+        return value
+
+    def s4(self) -> int:
+        value = S4.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 4
+        return value
+
+    def read(self, length) -> memoryview:
+        # Zero-copy view; must not outlive the reader
+        end = self.offset + length
+        if end > len(self.buffer):
+            raise IndexError("read past end of buffer")
+
+        view = self.buffer[self.offset:end]
+        self.offset = end
+        return view
+
+    def read_bytes(self, length) -> bytes:
+        return bytes(self.read(length))
+
+    def table(self, layout: Struct, count) -> list[tuple]:
+        # Decodes `count` fixed-width records in a single pass
+        return list(layout.iter_unpack(self.read(layout.size * count)))
+
+    def skip(self, length):
+        self.offset += length
+
+    def close(self, keep_source=False):
+        self.buffer.release()
+
+        # A kept mapping stays open until every holder of `source` is collected
+        if self._mapping is not None and not keep_source:
+            try:
+                self._mapping.close()
+            except BufferError:
+                # Views are still referenced elsewhere (e.g. by a traceback); the mapping is closed on collection
+                pass
+            self._mapping = None
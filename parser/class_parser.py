@@ -1,8 +1,16 @@
-from struct import unpack
-from binascii import hexlify
+import os
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
+from struct import Struct, unpack, error as StructError
+from time import perf_counter
 
 from objects.attributes import *
 from objects.attributes_ext import AnnotationElementValue
+from objects.bytecode import Bytecode
 from objects.classes import *
 from objects.constant_pool import *
 from objects.errors import ClassFormatError, UnsupportedClassVersionError
@@ -11,90 +19,162 @@ from objects.methods import *
 from objects.stack_map_frames import *
 from objects.type_verification import *
 
+from parser.byte_reader import ByteReader
+from parser.symbol_table import symbols
+from parser.verifier import verify_class
 from runtime.opcodes import opcodes, ParsedOpcode
 
 
+# Stamped into parse cache keys; bump whenever the parsed object model changes
+PARSER_VERSION = 8
+
+
+# --------------------------------------------------
+# FIXED-WIDTH TABLE LAYOUTS
+# --------------------------------------------------
+
+
+# start_pc, end_pc, handler_pc, catch_type
+EXCEPTION_HANDLER = Struct(">4H")
+# start_pc, line_number
+LINE_NUMBER = Struct(">2H")
+# start_pc, length, name_index, descriptor_index/signature_index, index
+LOCAL_VARIABLE = Struct(">5H")
+# inner_class_info_index, outer_class_info_index, inner_name_index, inner_class_access_flags
+INNER_CLASS = Struct(">4H")
+# Constant pool index
+INDEX = Struct(">H")
+# tableswitch default, low, high
+S4_3 = Struct(">3i")
+# lookupswitch default, npairs
+S4_2 = Struct(">2i")
+# wide opcode, index
+WIDE = Struct(">BH")
+# wide iinc, index, const
+WIDE_IINC = Struct(">BHh")
+
+
 # --------------------------------------------------
 # CLASS STRUCTURE
 # --------------------------------------------------
 
 
-def parse_class(filename) -> Class:
-    file = open(filename, "rb")
+def parse_class(source, lazy=False, cache=None, profiler=None, verify=False, hierarchy=None) -> Class:
+    # Accepts a filename or any buffer-protocol object holding the class file bytes.
+    # In lazy mode attributes are only decoded when first accessed, so the buffer is kept alive.
+    # A ParseProfiler passed as `profiler` records every class that is actually decoded.
+    # With `verify`, bytecode is type checked against class hierarchy `hierarchy` if given (see
+    # parser/verifier.py).
+    reader = ByteReader(source)
+    try:
+        if cache is None:
+            clazz = read_class(reader, lazy, profiler)
+        else:
+            # Cache hits are returned without running the decoder. Entries are stored before
+            # verification, since its outcome depends on the hierarchy of the caller.
+            key = cache.key(reader.buffer)
+            clazz = cache.get(key)
+            if clazz is None:
+                clazz = read_class(reader, lazy, profiler)
+                cache.put(key, clazz)
+
+        if verify:
+            verify_class(clazz, hierarchy)
 
+        return clazz
+    except (StructError, IndexError):
+        raise ClassFormatError("Failed to parse class: unexpected end of class file")
+    finally:
+        reader.close(keep_source=lazy)
+
+
+def read_header(reader) -> tuple[int, int]:
     # All valid class files must start with 0xCAFEBABE
-    if hex_(file.read(4)) != b"cafebabe":
-        file.close()
+    if reader.u4() != 0xCAFEBABE:
         raise ClassFormatError(f"Failed to parse class: invalid magic number; likely not a class file")
 
-    minor_version = uint(file.read(2))
-    major_version = uint(file.read(2))
+    minor_version = reader.u2()
+    major_version = reader.u2()
 
     # Currently only targeting class spec 52.0 (Java SE 8)
     if f"{major_version}.{minor_version}" != "52.0":
-        file.close()
         raise UnsupportedClassVersionError(f"Failed to parse class: unsupported major/minor version {major_version}.{minor_version}")
 
+    return minor_version, major_version
+
+
+def read_class(reader, lazy=False, profiler=None) -> Class:
+    # Phases are only timed with a profiler; otherwise this costs one check per phase
+    recorder = profiler.recorder(reader) if profiler is not None else None
+
+    minor_version, major_version = read_header(reader)
+    if recorder is not None:
+        recorder.mark("header")
+
     # Parse constant pool
-    constant_pool_count = uint(file.read(2))
-    constant_pool = [None]
+    constant_pool_count, constant_pool = parse_constant_pool(reader)
+    if recorder is not None:
+        recorder.mark("constant_pool")
 
-    # Iterate through constant pool
-    pool_count = constant_pool_count-1
-    for _ in range(pool_count):
-        constant_type = uint(file.read(1))
-        entry = parse_constant_pool_entry(file, constant_type)
-        constant_pool.append(entry)
-    
-    # Resolve constant symbolic links
+    # Resolve constant symbolic links on demand
     constant_pool = link_constant_pool(constant_pool)
+    if recorder is not None:
+        # Profiled classes are linked up front so that linking is timed as a phase of its own
+        constant_pool.link_all()
+        recorder.mark("linking")
 
     # Decode access flag mask
-    access_flags = parse_access_flags(file, ClassFlags)
+    access_flags = parse_access_flags(reader, ClassFlags)
 
-    this_class = constant_pool[uint(file.read(2))].name
-    super_class = constant_pool[uint(file.read(2))].name
+    this_class = constant_pool[reader.u2()].name
+
+    # java/lang/Object has no superclass
+    super_class_index = reader.u2()
+    super_class = constant_pool[super_class_index].name if super_class_index else None
 
     # Parse superinterfaces
-    interfaces_count = uint(file.read(2))
+    interfaces_count = reader.u2()
     interfaces = list()
 
     # Iterate through superinterfaces
     for _ in range(interfaces_count):
-        interfaces.append(uint(file.read(2)))
+        interfaces.append(reader.u2())
+
+    if recorder is not None:
+        recorder.mark("class_info")
 
     # Parse fields
-    fields_count = uint(file.read(2))
+    fields_count = reader.u2()
     fields = list()
 
     # Iterate through fields
     for _ in range(fields_count):
-        fields.append(parse_field_method(file, False, constant_pool))
+        fields.append(parse_field_method(reader, False, constant_pool, lazy))
+
+    if recorder is not None:
+        recorder.mark("fields")
 
     # Parse methods
-    methods_count = uint(file.read(2))
+    methods_count = reader.u2()
     methods = list()
 
     # Iterate through methods
-    for _ in range(methods_count):
-        methods.append(parse_field_method(file, True, constant_pool))
+    if recorder is None:
+        for _ in range(methods_count):
+            methods.append(parse_field_method(reader, True, constant_pool, lazy))
+    else:
+        for _ in range(methods_count):
+            start = perf_counter()
+            method = parse_field_method(reader, True, constant_pool, lazy)
+            recorder.method(method, perf_counter() - start)
+            methods.append(method)
+
+        recorder.mark("methods")
 
     # Parse class attributes
-    attributes_count = uint(file.read(2))
-    attribute_info = list()
-
-    # Iterate through attributes
-    for _ in range(attributes_count):
-        attribute_name_index = uint(file.read(2))
-        attribute_length = uint(file.read(4))
-
-        attribute_info.append(parse_attribute(AttributeUnparsed(
-            attribute_name_index,
-            attribute_length
-        ), file, constant_pool))
-
-    # Parsing complete; ready for validation
-    # TODO: Class validation
+    attributes_count, attribute_info = parse_attributes(reader, constant_pool, lazy)
+    if recorder is not None:
+        recorder.mark("attributes")
 
     clazz = Class(
         minor_version,
@@ -114,131 +194,313 @@ def parse_class(filename) -> Class:
         attribute_info
     )
 
-    file.close()
+    if recorder is not None:
+        profiler.record(recorder.finish(clazz))
+
     return clazz
 
 
-def parse_constant_pool_entry(file, constant_type):
+def parse_constant_pool(reader):
+    constant_pool_count = reader.u2()
+    constant_pool = [None]
+
+    # Iterate through constant pool
+    while len(constant_pool) < constant_pool_count:
+        constant_type = reader.u1()
+        entry = parse_constant_pool_entry(reader, constant_type)
+        constant_pool.append(entry)
+
+        # Long and double constants take up two entries
+        if constant_type == 5 or constant_type == 6:
+            constant_pool.append(None)
+
+    return constant_pool_count, constant_pool
+
+
+def parse_constant_pool_entry(reader, constant_type):
     match constant_type:
         case 1:
-            length = uint(file.read(2))
-            return ConstantUtf8Info(length, file.read(length))
-        case 3: return ConstantIntegerInfo(file.read(4))
-        case 4: return ConstantFloatInfo(file.read(4))
-        case 5: return ConstantLongInfo(file.read(4), file.read(4))
-        case 6: return ConstantDoubleInfo(file.read(4), file.read(4))
-        case 7: return ConstantClassInfo(uint(file.read(2)))
-        case 8: return ConstantStringInfo(uint(file.read(2)))
+            length = reader.u2()
+            return ConstantUtf8Info(length, reader.read_bytes(length))
+        case 3: return ConstantIntegerInfo(reader.read_bytes(4))
+        case 4: return ConstantFloatInfo(reader.read_bytes(4))
+        case 5: return ConstantLongInfo(reader.read_bytes(4), reader.read_bytes(4))
+        case 6: return ConstantDoubleInfo(reader.read_bytes(4), reader.read_bytes(4))
+        case 7: return ConstantClassInfo(reader.u2())
+        case 8: return ConstantStringInfo(reader.u2())
         case 9:
             return ConstantFieldrefInfo(
-                uint(file.read(2)),
-                uint(file.read(2))
+                reader.u2(),
+                reader.u2()
             )
         case 10:
             return ConstantMethodrefInfo(
-                uint(file.read(2)),
-                uint(file.read(2))
+                reader.u2(),
+                reader.u2()
             )
         case 11:
             return ConstantInterfaceMethodrefInfo(
-                uint(file.read(2)),
-                uint(file.read(2))
+                reader.u2(),
+                reader.u2()
             )
         case 12:
             return ConstantNameAndTypeInfo(
-                uint(file.read(2)),
-                uint(file.read(2))
+                reader.u2(),
+                reader.u2()
             )
         case 15:
             return ConstantMethodHandleInfo(
-                uint(file.read(1)),
-                uint(file.read(2))
+                reader.u1(),
+                reader.u2()
             )
-        case 16: return ConstantMethodTypeInfo(uint(file.read(2)))
+        case 16: return ConstantMethodTypeInfo(reader.u2())
         case 18:
             return ConstantInvokeDynamicInfo(
-                uint(file.read(2)),
-                uint(file.read(2))
+                reader.u2(),
+                reader.u2()
             )
         case _:
             raise ClassFormatError(f"Failed to parse class: invalid constant type {constant_type}")
 
 
-def link_constant_pool(constant_pool):
-    def link_entry(entry):
-        if entry.tag == 1:
-            return entry.bytes.decode("utf-8")
-        elif entry.tag == 12:
-            return PConstantNameAndTypeInfo(
-                link_entry(constant_pool[entry.name_index]),
-                link_entry(constant_pool[entry.descriptor_index])
-            )
-        elif entry.tag == 7:
-            return PConstantClassInfo(
-                link_entry(constant_pool[entry.name_index])
-            )
-        elif entry.tag == 9:
-            return PConstantFieldrefInfo(
-                link_entry(constant_pool[entry.class_index]),
-                link_entry(constant_pool[entry.name_and_type_index])
-            )
-        elif entry.tag == 10:
-            return PConstantMethodrefInfo(
-                link_entry(constant_pool[entry.class_index]),
-                link_entry(constant_pool[entry.name_and_type_index])
-            )
-        elif entry.tag == 11:
-            return PConstantInterfaceMethodrefInfo(
-                link_entry(constant_pool[entry.class_index]),
-                link_entry(constant_pool[entry.name_and_type_index])
-            )
-        elif entry.tag == 8:
-            return PConstantStringInfo(
-                link_entry(constant_pool[entry.string_index])
-            )
-        elif entry.tag == 3:
-            return PConstantIntegerInfo(
-                uint(entry.bytes, True)
-            )
-        elif entry.tag == 4:
-            return PConstantFloatInfo(
-                unpack(">f", entry.bytes)[0]
-            )
-        elif entry.tag == 5:
-            return PConstantLongInfo(
-                uint(bytes(bytearray(entry.high_bytes).extend(entry.low_bytes)), True)
-            )
-        elif entry.tag == 6:
-            return PConstantDoubleInfo(
-                unpack(">d", bytes(bytearray(entry.high_bytes).extend(entry.low_bytes)))[0]
-            )
-        elif entry.tag == 15:
-            return PConstantMethodHandleInfo(
-                entry.reference_kind,
-                link_entry(constant_pool[entry.reference_index])
-            )
-        elif entry.tag == 16:
-            return PConstantMethodTypeInfo(
-                link_entry(constant_pool[entry.descriptor_index])
-            )
-        elif entry.tag == 18:
-            return PConstantInvokeDynamicInfo(
-                entry.bootstrap_method_attr_index,
-                link_entry(constant_pool[entry.name_and_type_index])
-            )
+# Placeholder for entries that have not been linked yet
+class Unlinked:
+    pass
+
+
+class LinkedConstantPool(Sequence):
+    __slots__ = ("raw", "__linked")
+
+    def __init__(self, constant_pool: list[ConstantPoolEntry]):
+        self.raw = constant_pool
+        self.__linked = [Unlinked] * len(constant_pool)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        # Entries are linked on first access; shared entries are only ever built once
+        linked = self.__linked[index]
+        if linked is Unlinked:
+            linked = self.__linked[index] = self.__link(self.raw[index])
+
+        return linked
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __eq__(self, other):
+        return isinstance(other, Sequence) and list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def tag(self, index) -> int | None:
+        entry = self.raw[index]
+        return entry.tag if entry is not None else None
+
+    def raw_entry(self, index) -> ConstantPoolEntry | None:
+        return self.raw[index]
+
+    def is_linked(self, index) -> bool:
+        return self.__linked[index] is not Unlinked
+
+    def link_all(self):
+        for index in range(len(self.raw)):
+            self[index]
+
+    def __link(self, entry):
+        if entry is None:
+            return None
+
+        match entry.tag:
+            # Shared with every other class in the process
+            case 1: return symbols.intern(entry.bytes)
+            case 12:
+                return PConstantNameAndTypeInfo(
+                    self[entry.name_index],
+                    self[entry.descriptor_index]
+                )
+            case 7: return PConstantClassInfo(self[entry.name_index])
+            case 9:
+                return PConstantFieldrefInfo(
+                    self[entry.class_index],
+                    self[entry.name_and_type_index]
+                )
+            case 10:
+                return PConstantMethodrefInfo(
+                    self[entry.class_index],
+                    self[entry.name_and_type_index]
+                )
+            case 11:
+                return PConstantInterfaceMethodrefInfo(
+                    self[entry.class_index],
+                    self[entry.name_and_type_index]
+                )
+            case 8: return PConstantStringInfo(self[entry.string_index])
+            case 3: return PConstantIntegerInfo(uint(entry.bytes, True))
+            case 4: return PConstantFloatInfo(unpack(">f", entry.bytes)[0])
+            case 5: return PConstantLongInfo(uint(entry.high_bytes + entry.low_bytes, True))
+            case 6: return PConstantDoubleInfo(unpack(">d", entry.high_bytes + entry.low_bytes)[0])
+            case 15:
+                return PConstantMethodHandleInfo(
+                    entry.reference_kind,
+                    self[entry.reference_index]
+                )
+            case 16: return PConstantMethodTypeInfo(self[entry.descriptor_index])
+            case 18:
+                return PConstantInvokeDynamicInfo(
+                    entry.bootstrap_method_attr_index,
+                    self[entry.name_and_type_index]
+                )
+            case _:
+                raise ClassFormatError(f"Failed to parse class: invalid constant pool tag {entry.tag}")
+
+
+def link_constant_pool(constant_pool) -> LinkedConstantPool:
+    return LinkedConstantPool(constant_pool)
+
+
+# --------------------------------------------------
+# SKIM PARSING
+# --------------------------------------------------
+
+
+# Payload sizes of fixed-width constant pool entries, keyed by tag
+CONSTANT_SIZES = {3: 4, 4: 4, 5: 8, 6: 8, 7: 2, 8: 2, 9: 4, 10: 4, 11: 4, 12: 4, 15: 3, 16: 2, 18: 4}
+
+
+def skim_class(source) -> ClassSummary:
+    # Header-only parse: stops after the interfaces table without decoding members or attributes
+    reader = ByteReader(source)
+    try:
+        return read_class_summary(reader)
+    except (StructError, IndexError):
+        raise ClassFormatError("Failed to parse class: unexpected end of class file")
+    finally:
+        reader.close()
+
+
+def read_class_summary(reader) -> ClassSummary:
+    minor_version, major_version = read_header(reader)
+
+    # Walk the constant pool, only remembering where UTF-8 entries are and what Class entries point at
+    constant_pool_count = reader.u2()
+    utf8_entries = dict[int, tuple[int, int]]()
+    class_entries = dict[int, int]()
+
+    index = 1
+    while index < constant_pool_count:
+        tag = reader.u1()
+
+        if tag == 1:
+            length = reader.u2()
+            utf8_entries[index] = (reader.offset, length)
+            reader.skip(length)
+        elif tag == 7:
+            class_entries[index] = reader.u2()
+        elif tag in CONSTANT_SIZES:
+            reader.skip(CONSTANT_SIZES[tag])
         else:
-            raise ClassFormatError(f"Failed to parse class: invalid constant pool tag {entry.tag}")
+            raise ClassFormatError(f"Failed to parse class: invalid constant type {tag}")
+
+        # Long and double constants take up two entries
+        index += 2 if tag == 5 or tag == 6 else 1
+
+    buffer = reader.buffer
+
+    def class_name(class_index):
+        offset, length = utf8_entries[class_entries[class_index]]
+        return symbols.intern(bytes(buffer[offset:offset + length]))
+
+    access_flags = parse_access_flags(reader, ClassFlags)
+    this_class = class_name(reader.u2())
+
+    # java/lang/Object has no superclass
+    super_class_index = reader.u2()
+    super_class = class_name(super_class_index) if super_class_index else None
+
+    interfaces_count = reader.u2()
+    interfaces = [class_name(reader.u2()) for _ in range(interfaces_count)]
+
+    return ClassSummary(
+        minor_version,
+        major_version,
+        access_flags,
+        this_class,
+        super_class,
+        interfaces,
+        [class_name(class_index) for class_index in class_entries]
+    )
+
 
-    new_pool = [None]
-    for entry in constant_pool:
-        if entry is None: continue
+# --------------------------------------------------
+# BATCH PARSING
+# --------------------------------------------------
+
+
+@dataclass
+class ParseResult:
+    path: str
+    clazz: Class | None
+    error: Exception | None
+
+
+def find_class_files(paths) -> Iterator[str]:
+    # Accepts class files, directories (searched recursively) and classpath strings
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    for path in paths:
+        for entry in str(path).split(os.pathsep):
+            if os.path.isdir(entry):
+                for root, dirs, files in os.walk(entry):
+                    dirs.sort()
+                    for name in sorted(files):
+                        if name.endswith(".class"):
+                            yield os.path.join(root, name)
+            elif entry:
+                yield entry
+
+
+def parse_class_files(filenames, cache=None) -> list[ParseResult]:
+    results = list()
+
+    for filename in filenames:
+        # A failing file is reported without aborting the rest of the batch
+        try:
+            results.append(ParseResult(filename, parse_class(filename, cache=cache), None))
+        except Exception as e:
+            results.append(ParseResult(filename, None, e))
 
-        linked = link_entry(entry)
-        new_pool.append(linked)
+    return results
 
-        if isinstance(linked, PConstantDoubleInfo) or isinstance(linked, PConstantLongInfo):
-            new_pool.append(None)
-    return new_pool
+
+def parse_classes(paths, workers=None, chunk_size=32, cache=None) -> Iterator[ParseResult]:
+    filenames = list(find_class_files(paths))
+
+    if workers == 1:
+        for filename in filenames:
+            yield from parse_class_files([filename], cache)
+        return
+
+    # Results are streamed back per chunk, in completion order
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        chunks = {
+            executor.submit(parse_class_files, filenames[i:i + chunk_size], cache): filenames[i:i + chunk_size]
+            for i in range(0, len(filenames), chunk_size)
+        }
+
+        for future in as_completed(chunks):
+            try:
+                yield from future.result()
+            except Exception as e:
+                # Worker died or results could not be sent back
+                for filename in chunks[future]:
+                    yield ParseResult(filename, None, e)
+    finally:
+        executor.shutdown(cancel_futures=True)
 
 
 # --------------------------------------------------
@@ -246,60 +508,104 @@ def link_constant_pool(constant_pool):
 # --------------------------------------------------
 
 
-def parse_attribute(attribute, file, constant_pool):
-    attribute_name = constant_pool[attribute.attribute_name_index]
-    match attribute_name:
-        case "ConstantValue":
-            return AttributeConstantValue(uint(file.read(2)))
+def parse_attributes(reader, constant_pool, lazy=False):
+    attributes_count = reader.u2()
+    attribute_info = list()
 
-        case "Code":
-            max_stack = uint(file.read(2))
-            max_locals = uint(file.read(2))
-            code_length = uint(file.read(4))
+    # Iterate through attributes
+    for _ in range(attributes_count):
+        attribute_name_index = reader.u2()
+        attribute_length = reader.u4()
+        offset = reader.offset
 
-            code = parse_bytecode(file.read(code_length))
+        if lazy:
+            # Record where the attribute lives; it is decoded on first access
+            attribute_info.append(AttributeLazy(attribute_name_index, attribute_length, offset))
+        else:
+            attribute_info.append(parse_attribute(AttributeUnparsed(
+                attribute_name_index,
+                attribute_length
+            ), reader, constant_pool))
 
-            exception_table_length = uint(file.read(2))
-            exception_table = list()
+        # Always resume from the declared end of the attribute
+        reader.offset = offset + attribute_length
 
-            for _ in range(exception_table_length):
-                exception_table.append(ExceptionHandler(
-                    uint(file.read(2)),
-                    uint(file.read(2)),
-                    uint(file.read(2)),
-                    uint(file.read(2))
-                ))
+    if lazy:
+        attribute_info = LazyAttributeList(
+            attribute_info,
+            reader.source,
+            partial(parse_lazy_attribute, constant_pool=constant_pool)
+        )
 
-            attributes_count = uint(file.read(2))
-            attribute_info = list()
-
-            # Iterate through nested attributes
-            for _ in range(attributes_count):
-                attribute_name_index = uint(file.read(2))
-                attribute_length = uint(file.read(4))
-
-                attribute_info.append(parse_attribute(AttributeUnparsed(
-                    attribute_name_index,
-                    attribute_length
-                ), file, constant_pool))
-
-            return AttributeCode(
-                max_stack,
-                max_locals,
-                code_length,
-                code,
-                exception_table_length,
-                exception_table,
-                attributes_count,
-                attribute_info
-            )
+    return attributes_count, attribute_info
+
+
+def parse_lazy_attribute(attribute, source, constant_pool):
+    # Fails like the eager path when the deferred bytes turn out to be truncated or corrupt
+    try:
+        with ByteReader(source, attribute.offset) as reader:
+            return parse_attribute(AttributeUnparsed(
+                attribute.attribute_name_index,
+                attribute.attribute_length
+            ), reader, constant_pool, True)
+    except (StructError, IndexError):
+        raise ClassFormatError("Failed to parse class: unexpected end of class file")
+
+
+def parse_code_body(reader, decode=True) -> tuple:
+    # Code attribute up to its nested attributes: (max_stack, max_locals, code_length, code,
+    # exception_table). Without `decode` the bytecode and exception table are skipped and left None.
+    max_stack = reader.u2()
+    max_locals = reader.u2()
+    code_length = reader.u4()
+
+    if not decode:
+        reader.skip(code_length)
+        reader.skip(reader.u2() * EXCEPTION_HANDLER.size)
+        return max_stack, max_locals, code_length, None, None
+
+    code = parse_bytecode(reader.read(code_length))
+
+    exception_table_length = reader.u2()
+    exception_table = [
+        ExceptionHandler(*entry) for entry in reader.table(EXCEPTION_HANDLER, exception_table_length)
+    ]
+
+    return max_stack, max_locals, code_length, code, exception_table
+
+
+def code_attribute(body, attribute_info) -> AttributeCode:
+    max_stack, max_locals, code_length, code, exception_table = body
+    return AttributeCode(
+        max_stack,
+        max_locals,
+        code_length,
+        code,
+        len(exception_table),
+        exception_table,
+        len(attribute_info),
+        attribute_info
+    )
+
+
+def parse_attribute(attribute, reader, constant_pool, lazy=False):
+    attribute_name = constant_pool[attribute.attribute_name_index]
+    match attribute_name:
+        case "ConstantValue":
+            return AttributeConstantValue(reader.u2())
+
+        case "Code":
+            body = parse_code_body(reader)
+            # Parse nested attributes
+            _, attribute_info = parse_attributes(reader, constant_pool, lazy)
+            return code_attribute(body, attribute_info)
 
         case "StackMapTable":
-            number_of_entries = uint(file.read(2))
+            number_of_entries = reader.u2()
             entries = list()
 
             for _ in range(number_of_entries):
-                tag = uint(file.read(1))
+                tag = reader.u1()
                 match tag:
                     # SameFrame
                     case tag if tag in range(0, 64):
@@ -308,55 +614,55 @@ def parse_attribute(attribute, file, constant_pool):
                     # SameLocals1StackItemFrame
                     case tag if tag in range(64, 128):
                         stack = list()
-                        stack.append(parse_verification_type_info(file))
+                        stack.append(parse_verification_type_info(reader))
 
                         entries.append(SameLocals1StackItemFrame(tag, stack))
 
                     # SameLocals1StackItemFrameExtended
                     case tag if tag == 247:
-                        offset_delta = uint(file.read(2))
+                        offset_delta = reader.u2()
 
                         stack = list()
-                        stack.append(parse_verification_type_info(file))
+                        stack.append(parse_verification_type_info(reader))
 
                         entries.append(SameLocals1StackItemFrameExtended(tag, offset_delta, stack))
 
                     # ChopFrame
                     case tag if tag in range(248, 251):
-                        offset_delta = uint(file.read(2))
+                        offset_delta = reader.u2()
 
                         entries.append(ChopFrame(tag, offset_delta))
 
                     # SameFrameExtended
                     case tag if tag == 251:
-                        offset_delta = uint(file.read(2))
+                        offset_delta = reader.u2()
 
                         entries.append(SameFrameExtended(tag, offset_delta))
 
                     # AppendFrame
                     case tag if tag in range(252, 255):
-                        offset_delta = uint(file.read(2))
+                        offset_delta = reader.u2()
 
                         localz = list()
                         for _ in range(tag-251):
                             # Double and long might need special treatment here
-                            localz.append(parse_verification_type_info(file))
+                            localz.append(parse_verification_type_info(reader))
 
                         entries.append(AppendFrame(tag, offset_delta, localz))
 
                     # FullFrame
                     case tag if tag == 255:
-                        offset_delta = uint(file.read(2))
+                        offset_delta = reader.u2()
 
-                        number_of_locals = uint(file.read(2))
+                        number_of_locals = reader.u2()
                         localz = list()
                         for _ in range(number_of_locals):
-                            localz.append(parse_verification_type_info(file))
+                            localz.append(parse_verification_type_info(reader))
 
-                        number_of_stack_items = uint(file.read(2))
+                        number_of_stack_items = reader.u2()
                         stack = list()
                         for _ in range(number_of_stack_items):
-                            stack.append(parse_verification_type_info(file))
+                            stack.append(parse_verification_type_info(reader))
 
                         entries.append(FullFrame(
                             tag,
@@ -374,32 +680,30 @@ def parse_attribute(attribute, file, constant_pool):
             return AttributeStackMapTable(number_of_entries, entries)
 
         case "Exceptions":
-            number_of_exceptions = uint(file.read(2))
-            exception_index_table = list()
-
-            for _ in range(number_of_exceptions):
-                exception_index_table.append(uint(file.read(2)))
+            number_of_exceptions = reader.u2()
+            exception_index_table = [index for index, in reader.table(INDEX, number_of_exceptions)]
 
             return AttributeExceptions(number_of_exceptions, exception_index_table)
 
         case "InnerClasses":
-            number_of_classes = uint(file.read(2))
-            classes = list()
-
-            for _ in range(number_of_classes):
-                classes.append(InnerClassEntry(
-                    constant_pool[file.read(2)],
-                    uint(file.read(2)),
-                    uint(file.read(2)),
-                    uint(file.read(2))
-                ))
+            number_of_classes = reader.u2()
+            classes = [
+                InnerClassEntry(
+                    constant_pool[inner_class_info_index],
+                    outer_class_info_index,
+                    inner_name_index,
+                    InnerClassAccessFlags(flags)
+                )
+                for inner_class_info_index, outer_class_info_index, inner_name_index, flags
+                in reader.table(INNER_CLASS, number_of_classes)
+            ]
 
             return AttributeInnerClasses(number_of_classes, classes)
 
         case "EnclosingMethod":
             return AttributeEnclosingMethod(
-                constant_pool[uint(file.read(2))],
-                uint(file.read(2))
+                constant_pool[reader.u2()],
+                reader.u2()
             )
 
         case "Synthetic":
@@ -408,56 +712,42 @@ def parse_attribute(attribute, file, constant_pool):
         case "Signature":
             # TODO: Parse signatures
             return AttributeSignature(
-                constant_pool[uint(file.read(2))]
+                constant_pool[reader.u2()]
             )
 
         case "SourceFile":
             return AttributeSourceFile(
-                constant_pool[uint(file.read(2))]
+                constant_pool[reader.u2()]
             )
 
         case "SourceDebugExtension":
-            return AttributeSourceDebugExtension(file.read(attribute.attribute_length))
+            return AttributeSourceDebugExtension(reader.read_bytes(attribute.attribute_length))
 
         case "LineNumberTable":
-            line_number_table_length = uint(file.read(2))
-            line_number_table = list()
-
-            for _ in range(line_number_table_length):
-                line_number_table.append(LineNumber(
-                    uint(file.read(2)),
-                    uint(file.read(2))
-                ))
+            line_number_table_length = reader.u2()
+            line_number_table = [
+                LineNumber(*entry) for entry in reader.table(LINE_NUMBER, line_number_table_length)
+            ]
 
             return AttributeLineNumberTable(line_number_table_length, line_number_table)
 
         case "LocalVariableTable":
-            local_variable_table_length = uint(file.read(2))
-            local_variable_table = list()
-
-            for _ in range(local_variable_table_length):
-                local_variable_table.append(LocalVariable(
-                    uint(file.read(2)),
-                    uint(file.read(2)),
-                    constant_pool[uint(file.read(2))],
-                    constant_pool[uint(file.read(2))],
-                    uint(file.read(2))
-                ))
+            local_variable_table_length = reader.u2()
+            local_variable_table = [
+                LocalVariable(start_pc, length, constant_pool[name_index], constant_pool[descriptor_index], index)
+                for start_pc, length, name_index, descriptor_index, index
+                in reader.table(LOCAL_VARIABLE, local_variable_table_length)
+            ]
 
             return AttributeLocalVariableTable(local_variable_table_length, local_variable_table)
 
         case "LocalVariableTypeTable":
-            local_variable_type_table_length = uint(file.read(2))
-            local_variable_type_table = list()
-
-            for _ in range(local_variable_type_table_length):
-                local_variable_type_table.append(LocalVariableType(
-                    uint(file.read(2)),
-                    uint(file.read(2)),
-                    constant_pool[uint(file.read(2))],
-                    constant_pool[uint(file.read(2))],
-                    uint(file.read(2))
-                ))
+            local_variable_type_table_length = reader.u2()
+            local_variable_type_table = [
+                LocalVariableType(start_pc, length, constant_pool[name_index], constant_pool[signature_index], index)
+                for start_pc, length, name_index, signature_index, index
+                in reader.table(LOCAL_VARIABLE, local_variable_type_table_length)
+            ]
 
             return AttributeLocalVariableTypeTable(local_variable_type_table_length, local_variable_type_table)
 
@@ -465,85 +755,85 @@ def parse_attribute(attribute, file, constant_pool):
             return AttributeDeprecated()
 
         case "RuntimeVisibleAnnotations":
-            num_annotations = uint(file.read(2))
+            num_annotations = reader.u2()
             annotations = list()
 
             for _ in range(num_annotations):
-                annotations.append(parse_annotation(file, constant_pool))
+                annotations.append(parse_annotation(reader, constant_pool))
 
             return AttributeRuntimeVisibleAnnotations(num_annotations, annotations)
 
         case "RuntimeInvisibleAnnotations":
-            num_annotations = uint(file.read(2))
+            num_annotations = reader.u2()
             annotations = list()
 
             for _ in range(num_annotations):
-                annotations.append(parse_annotation(file, constant_pool))
+                annotations.append(parse_annotation(reader, constant_pool))
 
             return AttributeRuntimeInvisibleAnnotations(num_annotations, annotations)
 
         case "RuntimeVisibleParameterAnnotations":
-            num_parameters = uint(file.read(2))
+            num_parameters = reader.u2()
             parameter_annotations = list()
 
             for _ in range(num_parameters):
-                num_annotations = uint(file.read(2))
+                num_annotations = reader.u2()
                 annotations = list()
 
                 for _ in range(num_annotations):
-                    annotations.append(parse_annotation(file, constant_pool))
+                    annotations.append(parse_annotation(reader, constant_pool))
 
                 parameter_annotations.append(ParameterAnnotations(num_annotations, annotations))
 
             return AttributeRuntimeVisibleParameterAnnotations(num_parameters, parameter_annotations)
 
         case "RuntimeInvisibleParameterAnnotations":
-            num_parameters = uint(file.read(2))
+            num_parameters = reader.u2()
             parameter_annotations = list()
 
             for _ in range(num_parameters):
-                num_annotations = uint(file.read(2))
+                num_annotations = reader.u2()
                 annotations = list()
 
                 for _ in range(num_annotations):
-                    annotations.append(parse_annotation(file))
+                    annotations.append(parse_annotation(reader, constant_pool))
 
                 parameter_annotations.append(ParameterAnnotations(num_annotations, annotations))
 
             return AttributeRuntimeInvisibleParameterAnnotations(num_parameters, parameter_annotations)
 
         case "RuntimeVisibleTypeAnnotations":
-            num_annotations = uint(file.read(2))
+            num_annotations = reader.u2()
             annotations = list()
 
             for _ in range(num_annotations):
-                annotations.append(parse_typeannotation(file))
+                annotations.append(parse_typeannotation(reader, constant_pool))
 
             return AttributeRuntimeVisibleTypeAnnotations(num_annotations, annotations)
 
         case "RuntimeInvisibleTypeAnnotations":
-            num_annotations = uint(file.read(2))
+            num_annotations = reader.u2()
             annotations = list()
 
             for _ in range(num_annotations):
-                annotations.append(parse_typeannotation(file))
+                annotations.append(parse_typeannotation(reader, constant_pool))
 
             return AttributeRuntimeInvisibleTypeAnnotations(num_annotations, annotations)
 
         case "AnnotationDefault":
-            return AttributeAnnotationDefault(parse_element_value(file, constant_pool))
+            return AttributeAnnotationDefault(parse_element_value(reader, constant_pool))
 
         case "BootstrapMethods":
-            num_bootstrap_methods = uint(file.read(2))
+            num_bootstrap_methods = reader.u2()
             bootstrap_methods = list()
 
             for _ in range(num_bootstrap_methods):
-                bootstrap_method_ref = constant_pool[uint(file.read(2))]
-                num_bootstrap_arguments = uint(file.read(2))
+                bootstrap_method_ref = constant_pool[reader.u2()]
+                num_bootstrap_arguments = reader.u2()
                 bootstrap_arguments = list()
 
                 for _ in range(num_bootstrap_arguments):
-                    bootstrap_arguments.append(constant_pool[uint(file.read(2))])
+                    bootstrap_arguments.append(constant_pool[reader.u2()])
 
                 bootstrap_methods.append(BootstrapMethod(
                     bootstrap_method_ref,
@@ -554,13 +844,13 @@ def parse_attribute(attribute, file, constant_pool):
             return AttributeBootstrapMethods(num_bootstrap_methods, bootstrap_methods)
 
         case "MethodParameters":
-            parameters_count = uint(file.read(1))
+            parameters_count = reader.u1()
             parameters = list()
 
             for _ in range(parameters_count):
                 parameters.append(MethodParameter(
-                    uint(file.read(2)),
-                    parse_access_flags(file, MethodParameterFlags)
+                    reader.u2(),
+                    parse_access_flags(reader, MethodParameterFlags)
                 ))
 
             return AttributeMethodParameters(parameters_count, parameters)
@@ -570,165 +860,159 @@ def parse_attribute(attribute, file, constant_pool):
             return AttributeUnrecognized(
                 attribute.attribute_name_index,
                 attribute.attribute_length,
-                file.read(attribute.attribute_length)
+                reader.read_bytes(attribute.attribute_length)
             )
 
 
-def parse_bytecode(code):
-    operations = dict[int, ParsedOpcode]()
+def parse_bytecode(code) -> Bytecode:
+    code_length = len(code)
+    instructions = array("B")
+    pcs = array("H")
+    operand_starts = array("I")
+    operands = array("i")
 
     i = 0
-    while i < len(code):
+    while i < code_length:
         try:
             opcode = opcodes[code[i]]
-        except IndexError:
+        except KeyError:
             raise ClassFormatError(f"Failed to parse class: unknown opcode {code[i]}")
 
+        pc = i
+        instructions.append(code[pc])
+        pcs.append(pc)
+        operand_starts.append(len(operands))
+
         match code[i]:
             # VARIABLE LENGTH
 
             # tableswitch (170; 0xaa)
             case 170:
-                i_initial = i
-                switches = list()
-
-                # Byte padding
-                i += i % 4
-
-                default = uint(bytes(code[i:i + 4]), signed=True)
-                i += 4
-
-                low = uint(bytes(code[i:i + 4]), signed=True)
-                i += 4
+                # Operands are padded to the next multiple of 4
+                i = (i + 4) & ~3
 
-                high = uint(bytes(code[i:i + 4]), signed=True)
-                i += 4
+                default, low, high = S4_3.unpack_from(code, i)
+                i += 12
 
-                for _ in range(high - low + 1):
-                    switches.append(uint(bytes(code[i:i + 4]), signed=True))
-                    i += 4
+                # Jump offsets are resolved to absolute pcs
+                operands.extend((pc + default, low, high))
+                operands.extend(pc + offset for offset in array_s4(code, i, high - low + 1))
+                i += (high - low + 1) * 4
 
-                operations[i_initial] = ParsedOpcode(opcode.func_ref, (default, tuple(switches)))
-
-            # tableswitch (171; 0xab)
+            # lookupswitch (171; 0xab)
             case 171:
-                i_initial = i
-                switches = dict[int, int]()
-
-                # Byte padding
-                i += i % 4
-
-                default = uint(bytes(code[i:i + 4]), signed=True)
-                i += 4
+                # Operands are padded to the next multiple of 4
+                i = (i + 4) & ~3
 
-                npairs = uint(bytes(code[i:i + 4]), signed=True)
-                i += 4
+                default, npairs = S4_2.unpack_from(code, i)
+                i += 8
 
-                for _ in range(npairs):
-                    match = uint(bytes(code[i:i + 4]), signed=True)
-                    i += 4
-                    offset = uint(bytes(code[i:i + 4]), signed=True)
-                    i += 4
+                # Flattened match, target pairs; jump offsets are resolved to absolute pcs
+                pairs = array_s4(code, i, npairs * 2)
+                pairs[1::2] = array("i", (pc + offset for offset in pairs[1::2]))
 
-                    switches[match] = offset
-
-                operations[i_initial] = ParsedOpcode(opcode.func_ref, (default, tuple(switches)))
+                operands.extend((pc + default, npairs))
+                operands.extend(pairs)
+                i += npairs * 8
 
             # wide (196; 0xc4)
             case 196:
-                i_initial = i
-                params = list()
-
-                i += 1
-                mod_opcode = code[i]
-
-                # Handle iinc
-                param_count = 4 if mod_opcode == 132 else 2
-                for j in range(1, param_count + 1):
-                    params.append(code[i+j])
-                i += param_count
-
-                operations[i_initial] = ParsedOpcode(opcode.func_ref, (tuple(params)))
+                # Modified opcode, u2 local index and, for iinc, an s2 increment
+                if code[i + 1] == 132:
+                    operands.extend(WIDE_IINC.unpack_from(code, i + 1))
+                    i += WIDE_IINC.size + 1
+                else:
+                    operands.extend(WIDE.unpack_from(code, i + 1))
+                    i += WIDE.size + 1
 
             # CONSTANT-LENGTH
 
             case _:
-                params = list()
+                param_count = opcode.param_count
+                if param_count:
+                    values = opcode.operand_layout.unpack_from(code, i + 1)
+                    operands.extend((pc + values[0],) if opcode.branch else values)
+                i += param_count + 1
 
-                for j in range(1, opcode.param_count + 1):
-                    params.append(code[i+j])
+    if i != code_length:
+        raise ClassFormatError("Failed to parse class: truncated instruction at end of code")
 
-                operations[i] = ParsedOpcode(opcode.func_ref, (tuple(params)))
-                i += opcode.param_count + 1 if opcode.param_count > 0 else 1
+    operand_starts.append(len(operands))
+    return Bytecode(code_length, instructions, pcs, operand_starts, operands)
 
-    return operations
 
+def array_s4(code, offset, count) -> array:
+    values = array("i", code[offset:offset + count * 4].tobytes())
+    if sys.byteorder == "little":
+        values.byteswap()
+    return values
 
-def parse_annotation(file, constant_pool):
-    type_index = constant_pool[uint(file.read(2))]
-    num_element_value_pairs = uint(file.read(2))
+
+def parse_annotation(reader, constant_pool):
+    type_index = constant_pool[reader.u2()]
+    num_element_value_pairs = reader.u2()
     element_value_pairs = list()
 
     for _ in range(num_element_value_pairs):
-        element_name_index = uint(file.read(2))
-        element_value = parse_element_value(file, constant_pool)
+        element_name_index = reader.u2()
+        element_value = parse_element_value(reader, constant_pool)
 
         element_value_pairs.append(ElementValuePair(element_name_index, element_value))
 
     return Annotation(type_index, num_element_value_pairs, element_value_pairs)
 
 
-def parse_typeannotation(file):
-    target_type = hexlify(file.read(1)).decode("ascii")
+def parse_typeannotation(reader, constant_pool):
+    target_type = reader.u1()
 
     match target_type:
-        case "00" | "01": target_info = TypeParameterTarget(uint(file.read(2)))
-        case "10": target_info = SupertypeTarget(uint(file.read(2)))
-        case "11" | "12": target_info = TypeParameterBoundTarget(
-                uint(file.read(1)),
-                uint(file.read(1))
+        case 0x00 | 0x01: target_info = TypeParameterTarget(reader.u2())
+        case 0x10: target_info = SupertypeTarget(reader.u2())
+        case 0x11 | 0x12: target_info = TypeParameterBoundTarget(
+                reader.u1(),
+                reader.u1()
             )
-        case "13" | "14" | "15": target_info = EmptyTarget()
-        case "16": target_info = FormalParameterTarget(uint(file.read(1)))
-        case "17": target_info = ThrowsTarget(uint(file.read(2)))
-        case "40" | "41":
-            table_length = uint(file.read(2))
+        case 0x13 | 0x14 | 0x15: target_info = EmptyTarget()
+        case 0x16: target_info = FormalParameterTarget(reader.u1())
+        case 0x17: target_info = ThrowsTarget(reader.u2())
+        case 0x40 | 0x41:
+            table_length = reader.u2()
             table = list()
 
             for _ in range(table_length):
                 table.append(LocalvarInfo(
-                    uint(file.read(2)),
-                    uint(file.read(2)),
-                    uint(file.read(2))
+                    reader.u2(),
+                    reader.u2(),
+                    reader.u2()
                 ))
 
             target_info = LocalvarTarget(table_length, table)
-        case "42": target_info = CatchTarget(uint(file.read(2)))
-        case "43" | "44" | "45" | "46": target_info = OffsetTarget(uint(file.read(2)))
-        case "47" | "48" | "49" | "4A" | "4B": target_info = TypeArgumentTarget(
-                uint(file.read(2)),
-                uint(file.read(1))
+        case 0x42: target_info = CatchTarget(reader.u2())
+        case 0x43 | 0x44 | 0x45 | 0x46: target_info = OffsetTarget(reader.u2())
+        case 0x47 | 0x48 | 0x49 | 0x4A | 0x4B: target_info = TypeArgumentTarget(
+                reader.u2(),
+                reader.u1()
             )
         case _:
-            raise ClassFormatError(f"Failed to parse class: invalid target_type '{target_type}' in type annotation")
+            raise ClassFormatError(f"Failed to parse class: invalid target_type {target_type:#04x} in type annotation")
 
-    path_length = uint(file.read(1))
+    path_length = reader.u1()
     path = list()
 
     for _ in range(path_length):
         path.append(PathStep(
-            uint(file.read(1)),
-            uint(file.read(1))
+            reader.u1(),
+            reader.u1()
         ))
 
     target_path = TypePath(path_length, path)
-    type_index = uint(file.read(2))
-    num_element_value_pairs = uint(file.read(2))
+    type_index = reader.u2()
+    num_element_value_pairs = reader.u2()
     element_value_pairs = list()
 
     for _ in range(num_element_value_pairs):
-        element_name_index = uint(file.read(2))
-        element_value = parse_element_value(file, constant_pool)
+        element_name_index = reader.u2()
+        element_value = parse_element_value(reader, constant_pool)
 
         element_value_pairs.append(ElementValuePair(element_name_index, element_value))
 
@@ -742,37 +1026,37 @@ def parse_typeannotation(file):
     )
 
 
-def parse_element_value(file, constant_pool) -> ElementValue:
-    tag = file.read(1).decode("ascii")
+def parse_element_value(reader, constant_pool) -> ElementValue:
+    tag = chr(reader.u1())
     match tag:
-        case "B": return ByteElementValue(constant_pool[uint(file.read(2))])
-        case "C": return CharElementValue(constant_pool[uint(file.read(2))])
-        case "D": return DoubleElementValue(constant_pool[uint(file.read(2))])
-        case "F": return FloatElementValue(constant_pool[uint(file.read(2))])
-        case "I": return IntElementValue(constant_pool[uint(file.read(2))])
-        case "J": return LongElementValue(constant_pool[uint(file.read(2))])
-        case "S": return ShortElementValue(constant_pool[uint(file.read(2))])
-        case "Z": return ByteElementValue(constant_pool[uint(file.read(2))])
-        case "s": return StringElementValue(constant_pool[uint(file.read(2))])
+        case "B": return ByteElementValue(constant_pool[reader.u2()])
+        case "C": return CharElementValue(constant_pool[reader.u2()])
+        case "D": return DoubleElementValue(constant_pool[reader.u2()])
+        case "F": return FloatElementValue(constant_pool[reader.u2()])
+        case "I": return IntElementValue(constant_pool[reader.u2()])
+        case "J": return LongElementValue(constant_pool[reader.u2()])
+        case "S": return ShortElementValue(constant_pool[reader.u2()])
+        case "Z": return ByteElementValue(constant_pool[reader.u2()])
+        case "s": return StringElementValue(constant_pool[reader.u2()])
         case "e": return EnumElementValue(
-                constant_pool[uint(file.read(2))],
-                constant_pool[uint(file.read(2))]
+                constant_pool[reader.u2()],
+                constant_pool[reader.u2()]
             )
-        case "c": return ClassElementValue(constant_pool[uint(file.read(2))])
-        case "@": return AnnotationElementValue(parse_annotation(file, constant_pool))
+        case "c": return ClassElementValue(constant_pool[reader.u2()])
+        case "@": return AnnotationElementValue(parse_annotation(reader, constant_pool))
         case "[":
-            num_values = uint(file.read(2))
+            num_values = reader.u2()
             values = list()
 
             for _ in range(num_values):
-                values.append(parse_element_value(file, constant_pool))
+                values.append(parse_element_value(reader, constant_pool))
 
             return ArrayElementValue(num_values, values)
         case _: raise ClassFormatError(f"Failed to parse class: invalid element value union tag {tag}")
 
 
-def parse_verification_type_info(file) -> VerificationTypeInfo:
-    tag = uint(file.read(1))
+def parse_verification_type_info(reader) -> VerificationTypeInfo:
+    tag = reader.u1()
     match tag:
         case 0: return TopVariableInfo()
         case 1: return IntegerVariableInfo()
@@ -781,8 +1065,8 @@ def parse_verification_type_info(file) -> VerificationTypeInfo:
         case 4: return LongVariableInfo()
         case 5: return NullVariableInfo()
         case 6: return UninitializedThisVariableInfo()
-        case 7: return ObjectVariableInfo(uint(file.read(2)))
-        case 8: return UninitializedVariableInfo(uint(file.read(2)))
+        case 7: return ObjectVariableInfo(reader.u2())
+        case 8: return UninitializedVariableInfo(reader.u2())
         case _: raise ClassFormatError(f"Failed to parse class: invalid verification type union tag {tag}")
 
 
@@ -791,24 +1075,13 @@ def parse_verification_type_info(file) -> VerificationTypeInfo:
 # --------------------------------------------------
 
 
-def parse_field_method(file, method, constant_pool) -> Field | Method:
-    access_flags = parse_access_flags(file, MethodFlags if method else FieldFlags)
-    name = constant_pool[uint(file.read(2))]
-    descriptor = constant_pool[uint(file.read(2))]
+def parse_field_method(reader, method, constant_pool, lazy=False) -> Field | Method:
+    access_flags = parse_access_flags(reader, MethodFlags if method else FieldFlags)
+    name = constant_pool[reader.u2()]
+    descriptor = constant_pool[reader.u2()]
 
     # Parse structure attributes
-    attributes_count = uint(file.read(2))
-    attribute_info = list()
-
-    # Iterate through attributes
-    for _ in range(attributes_count):
-        attribute_name_index = uint(file.read(2))
-        attribute_length = uint(file.read(4))
-
-        attribute_info.append(parse_attribute(AttributeUnparsed(
-            attribute_name_index,
-            attribute_length
-        ), file, constant_pool))
+    attributes_count, attribute_info = parse_attributes(reader, constant_pool, lazy)
 
     return Method(
         access_flags,
@@ -830,15 +1103,8 @@ def parse_field_method(file, method, constant_pool) -> Field | Method:
 # --------------------------------------------------
 
 
-def check_mask(bytes_1: bytes, bytes_2: bytes) -> bool:
-    return (int.from_bytes(bytes_1, 'big') & int.from_bytes(bytes_2, 'big')).to_bytes(max(len(bytes_1), len(bytes_2)), 'big') == bytes_2
-
-
-def parse_access_flags(file, flags):
-    mask = hex_(file.read(2))
-    access_flags = [flag for flag in flags if check_mask(mask, flag.value)]
-
-    return access_flags    
+def parse_access_flags(reader, flags):
+    return flags(reader.u2())
 
 
 # --------------------------------------------------
@@ -848,7 +1114,3 @@ def parse_access_flags(file, flags):
 
 def uint(bytez, signed=False, endianness="big") -> int:
     return int.from_bytes(bytez, byteorder=endianness, signed=signed)
-
-
-def hex_(bytez: bytes) -> bytes:
-    return hexlify(bytez)
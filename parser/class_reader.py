@@ -0,0 +1,192 @@
+from struct import error as StructError
+
+from objects.attributes import AttributeCode, AttributeUnparsed, ExceptionHandler
+from objects.bytecode import Bytecode
+from objects.classes import ClassFlags
+from objects.constant_pool import ConstantPoolEntry
+from objects.errors import ClassFormatError
+from objects.fields import FieldFlags
+from objects.methods import MethodFlags
+from parser.byte_reader import ByteReader
+from parser.class_parser import (
+    code_attribute,
+    link_constant_pool,
+    parse_access_flags,
+    parse_attribute,
+    parse_code_body,
+    parse_constant_pool,
+    read_header
+)
+
+
+# --------------------------------------------------
+# VISITOR
+# --------------------------------------------------
+
+
+# Callbacks made by ClassReader, in class file order. Returning False from visit_field, visit_method
+# or visit_attribute skips the member's attributes or the attribute's bytes without decoding them.
+# Attributes and bytecode are only decoded for visitors that override visit_attribute_value or
+# visit_code. A Code attribute reaches visit_attribute_value after its nested attributes, which are
+# dispatched on their own as well; its attribute_info holds the nested attributes that were not skipped.
+class ClassVisitor:
+    def visit_header(self, minor_version: int, major_version: int, constant_pool_count: int):
+        pass
+
+    def visit_constant(self, index: int, entry: ConstantPoolEntry):
+        pass
+
+    def visit_class(self, access_flags: ClassFlags, this_class: str, super_class: str | None, interfaces: list[str]):
+        pass
+
+    def visit_field(self, access_flags: FieldFlags, name: str, descriptor: str) -> bool | None:
+        pass
+
+    def visit_method(self, access_flags: MethodFlags, name: str, descriptor: str) -> bool | None:
+        pass
+
+    def visit_attribute(self, name: str, length: int) -> bool | None:
+        pass
+
+    def visit_attribute_value(self, attribute):
+        pass
+
+    def visit_code(self, max_stack: int, max_locals: int, code: Bytecode, exception_table: list[ExceptionHandler]):
+        pass
+
+    def visit_end(self):
+        pass
+
+
+# --------------------------------------------------
+# READER
+# --------------------------------------------------
+
+
+class ClassReader:
+    def __init__(self, source):
+        self.source = source
+
+    def accept(self, visitor: ClassVisitor):
+        reader = ByteReader(self.source)
+        try:
+            ClassReaderWalk(reader, visitor).walk()
+        except (StructError, IndexError):
+            raise ClassFormatError("Failed to parse class: unexpected end of class file")
+        finally:
+            reader.close()
+
+
+class ClassReaderWalk:
+    def __init__(self, reader, visitor):
+        self.reader = reader
+        self.visitor = visitor
+
+        # Decoding is skipped entirely for callbacks the visitor does not implement
+        visitor_type = type(visitor)
+        self.wants_values = visitor_type.visit_attribute_value is not ClassVisitor.visit_attribute_value
+        self.wants_code = visitor_type.visit_code is not ClassVisitor.visit_code
+
+    def walk(self):
+        reader = self.reader
+        visitor = self.visitor
+
+        minor_version, major_version = read_header(reader)
+
+        constant_pool_count, constant_pool = parse_constant_pool(reader)
+        visitor.visit_header(minor_version, major_version, constant_pool_count)
+
+        for index, entry in enumerate(constant_pool):
+            # Index 0 and the second slot of long and double constants hold no entry
+            if entry is not None:
+                visitor.visit_constant(index, entry)
+
+        self.constant_pool = constant_pool = link_constant_pool(constant_pool)
+
+        access_flags = parse_access_flags(reader, ClassFlags)
+        this_class = constant_pool[reader.u2()].name
+
+        # java/lang/Object has no superclass
+        super_class_index = reader.u2()
+        super_class = constant_pool[super_class_index].name if super_class_index else None
+
+        interfaces_count = reader.u2()
+        interfaces = [constant_pool[reader.u2()].name for _ in range(interfaces_count)]
+
+        visitor.visit_class(access_flags, this_class, super_class, interfaces)
+
+        for _ in range(reader.u2()):
+            self.walk_member(visitor.visit_field, FieldFlags)
+
+        for _ in range(reader.u2()):
+            self.walk_member(visitor.visit_method, MethodFlags)
+
+        self.walk_attributes()
+        visitor.visit_end()
+
+    def walk_member(self, visit, flags):
+        reader = self.reader
+        access_flags = parse_access_flags(reader, flags)
+        name = self.constant_pool[reader.u2()]
+        descriptor = self.constant_pool[reader.u2()]
+
+        if visit(access_flags, name, descriptor) is False:
+            self.skip_attributes()
+        else:
+            self.walk_attributes()
+
+    def walk_attributes(self) -> list:
+        # Returns the decoded attributes; always empty unless the visitor wants attribute values
+        reader = self.reader
+        attributes = list()
+
+        for _ in range(reader.u2()):
+            attribute_name_index = reader.u2()
+            attribute_length = reader.u4()
+            offset = reader.offset
+
+            name = self.constant_pool[attribute_name_index]
+            if self.visitor.visit_attribute(name, attribute_length) is not False:
+                if name == "Code":
+                    attribute = self.walk_code()
+                elif self.wants_values:
+                    attribute = parse_attribute(AttributeUnparsed(
+                        attribute_name_index,
+                        attribute_length
+                    ), reader, self.constant_pool)
+                else:
+                    attribute = None
+
+                if attribute is not None:
+                    self.visitor.visit_attribute_value(attribute)
+                    attributes.append(attribute)
+
+            # Always resume from the declared end of the attribute
+            reader.offset = offset + attribute_length
+
+        return attributes
+
+    def walk_code(self) -> AttributeCode | None:
+        body = parse_code_body(self.reader, self.wants_code or self.wants_values)
+        max_stack, max_locals, _, code, exception_table = body
+
+        if code is None:
+            # Nested attributes (LineNumberTable, StackMapTable, ...)
+            self.walk_attributes()
+            return None
+
+        if self.wants_code:
+            self.visitor.visit_code(max_stack, max_locals, code, exception_table)
+
+        attribute_info = self.walk_attributes()
+        if not self.wants_values:
+            return None
+
+        return code_attribute(body, attribute_info)
+
+    def skip_attributes(self):
+        reader = self.reader
+
+        for _ in range(reader.u2()):
+            reader.skip(2)
+            reader.skip(reader.u4())
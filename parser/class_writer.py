@@ -0,0 +1,139 @@
+from struct import pack
+
+
+# --------------------------------------------------
+# CLASS FILE ASSEMBLY
+# --------------------------------------------------
+
+
+# Assembles class files constant by constant and member by member; the benchmarks generate their
+# corpus with it and the tests their classes
+class ClassFileBuilder:
+    def __init__(self, this_class="bench/Synthetic", super_class="java/lang/Object", interfaces=(), access_flags=0x0021):
+        self.pool = list[bytes]()
+        self.pool_indices = dict[tuple, int]()
+        self.fields = list[bytes]()
+        self.methods = list[bytes]()
+        self.attributes = list[bytes]()
+
+        self.this_class = self.class_ref(this_class)
+        self.super_class = self.class_ref(super_class)
+        self.interfaces = [self.class_ref(interface) for interface in interfaces]
+        self.access_flags = access_flags
+
+    def __constant(self, key, entry, slots=1):
+        if key not in self.pool_indices:
+            self.pool_indices[key] = len(self.pool) + 1
+            self.pool.append(entry)
+
+            # Long and double constants take up two entries
+            for _ in range(slots - 1):
+                self.pool.append(b"")
+
+        return self.pool_indices[key]
+
+    def utf8(self, value: str) -> int:
+        encoded = value.encode("utf-8")
+        return self.__constant(("utf8", value), pack(">BH", 1, len(encoded)) + encoded)
+
+    def integer(self, value: int) -> int:
+        return self.__constant(("int", value), pack(">Bi", 3, value))
+
+    def long(self, value: int) -> int:
+        return self.__constant(("long", value), pack(">Bq", 5, value), 2)
+
+    def class_ref(self, name: str) -> int:
+        return self.__constant(("class", name), pack(">BH", 7, self.utf8(name)))
+
+    def string(self, value: str) -> int:
+        return self.__constant(("string", value), pack(">BH", 8, self.utf8(value)))
+
+    def name_and_type(self, name: str, descriptor: str) -> int:
+        return self.__constant(
+            ("nat", name, descriptor),
+            pack(">BHH", 12, self.utf8(name), self.utf8(descriptor))
+        )
+
+    def method_ref(self, owner: str, name: str, descriptor: str) -> int:
+        return self.__constant(
+            ("method", owner, name, descriptor),
+            pack(">BHH", 10, self.class_ref(owner), self.name_and_type(name, descriptor))
+        )
+
+    def interface_method_ref(self, owner: str, name: str, descriptor: str) -> int:
+        return self.__constant(
+            ("interface method", owner, name, descriptor),
+            pack(">BHH", 11, self.class_ref(owner), self.name_and_type(name, descriptor))
+        )
+
+    def field_ref(self, owner: str, name: str, descriptor: str) -> int:
+        return self.__constant(
+            ("field", owner, name, descriptor),
+            pack(">BHH", 9, self.class_ref(owner), self.name_and_type(name, descriptor))
+        )
+
+    def attribute(self, name: str, body: bytes) -> bytes:
+        return pack(">HI", self.utf8(name), len(body)) + body
+
+    def add_field(self, name, descriptor, access_flags=0x0001, attributes=()):
+        self.fields.append(
+            pack(">HHHH", access_flags, self.utf8(name), self.utf8(descriptor), len(attributes)) + b"".join(attributes)
+        )
+
+    def add_method(self, name, descriptor, access_flags=0x0001, attributes=()):
+        self.methods.append(
+            pack(">HHHH", access_flags, self.utf8(name), self.utf8(descriptor), len(attributes)) + b"".join(attributes)
+        )
+
+    def code(self, code: bytes, max_stack=2, max_locals=2, exception_table=(), attributes=()) -> bytes:
+        body = pack(">HHI", max_stack, max_locals, len(code)) + code
+        body += pack(">H", len(exception_table)) + b"".join(pack(">4H", *entry) for entry in exception_table)
+        body += pack(">H", len(attributes)) + b"".join(attributes)
+        return self.attribute("Code", body)
+
+    def line_number_table(self, entries) -> bytes:
+        return self.attribute(
+            "LineNumberTable",
+            pack(">H", len(entries)) + b"".join(pack(">2H", *entry) for entry in entries)
+        )
+
+    def local_variable_table(self, entries) -> bytes:
+        return self.attribute(
+            "LocalVariableTable",
+            pack(">H", len(entries)) + b"".join(
+                pack(">5H", start_pc, length, self.utf8(name), self.utf8(descriptor), index)
+                for start_pc, length, name, descriptor, index in entries
+            )
+        )
+
+    def stack_map_table(self, frames) -> bytes:
+        return self.attribute("StackMapTable", pack(">H", len(frames)) + b"".join(frames))
+
+    def element_value(self, value) -> bytes:
+        match value:
+            case str(): return b"s" + pack(">H", self.utf8(value))
+            case int(): return b"I" + pack(">H", self.integer(value))
+            case (enum_type, const_name): return b"e" + pack(">HH", self.utf8(enum_type), self.utf8(const_name))
+            case list(): return b"[" + pack(">H", len(value)) + b"".join(self.element_value(item) for item in value)
+
+    def annotation(self, type_, pairs: dict) -> bytes:
+        return pack(">HH", self.utf8(type_), len(pairs)) + b"".join(
+            pack(">H", self.utf8(name)) + self.element_value(value) for name, value in pairs.items()
+        )
+
+    def runtime_visible_annotations(self, annotations) -> bytes:
+        return self.attribute(
+            "RuntimeVisibleAnnotations",
+            pack(">H", len(annotations)) + b"".join(annotations)
+        )
+
+    def build(self) -> bytes:
+        return b"".join((
+            pack(">IHHH", 0xCAFEBABE, 0, 52, len(self.pool) + 1),
+            *self.pool,
+            pack(">HHHH", self.access_flags, self.this_class, self.super_class, len(self.interfaces)),
+            pack(f">{len(self.interfaces)}H", *self.interfaces),
+            pack(">H", len(self.fields)), *self.fields,
+            pack(">H", len(self.methods)), *self.methods,
+            pack(">H", len(self.attributes)), *self.attributes
+        ))
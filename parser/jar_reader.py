@@ -0,0 +1,80 @@
+import mmap
+import zipfile
+import zlib
+from collections.abc import Iterator
+from struct import Struct
+
+from objects.classes import Class
+from parser.class_parser import parse_class
+
+
+# signature, version, flags, compression, mtime, mdate, crc32, compressed size, size, name length, extra length
+LOCAL_FILE_HEADER = Struct("<IHHHHHIIIHH")
+LOCAL_FILE_SIGNATURE = 0x04034B50
+
+
+# Reads classes straight out of a JAR/ZIP archive. The central directory is read once and indexed by
+# binary class name; entries are then located through their local header offsets in a memory mapping
+# of the archive, without extracting anything to disk.
+class JarFile:
+    def __init__(self, path):
+        self.path = path
+        self.__file = open(path, "rb")
+        self.__mapping = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with zipfile.ZipFile(self.__file) as archive:
+            # Binary name (e.g. java/lang/Object) -> central directory entry
+            self.index = {
+                info.filename[:-len(".class")]: info
+                for info in archive.infolist()
+                if info.filename.endswith(".class") and not info.filename.startswith("META-INF/")
+            }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, name):
+        return name.replace(".", "/") in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def names(self) -> list[str]:
+        return list(self.index)
+
+    def read(self, name):
+        info = self.index[name.replace(".", "/")]
+
+        header = LOCAL_FILE_HEADER.unpack_from(self.__mapping, info.header_offset)
+        if header[0] != LOCAL_FILE_SIGNATURE:
+            raise zipfile.BadZipFile(f"Bad local file header for {info.filename} in {self.path}")
+
+        # The local extra field may differ from the central directory's copy
+        start = info.header_offset + LOCAL_FILE_HEADER.size + header[9] + header[10]
+        data = memoryview(self.__mapping)[start:start + info.compress_size]
+
+        match info.compress_type:
+            # Stored entries are parsed in place
+            case zipfile.ZIP_STORED: return data
+            case zipfile.ZIP_DEFLATED: return zlib.decompress(data, -zlib.MAX_WBITS, info.file_size)
+            case _:
+                with zipfile.ZipFile(self.__file) as archive:
+                    return archive.read(info)
+
+    def get_class(self, name, lazy=False, cache=None) -> Class:
+        return parse_class(self.read(name), lazy, cache)
+
+    def classes(self, lazy=False, cache=None) -> Iterator[Class]:
+        for name in self.index:
+            yield self.get_class(name, lazy, cache)
+
+    def close(self):
+        try:
+            self.__mapping.close()
+        except BufferError:
+            # Lazily parsed stored entries still reference the mapping; it is closed on collection
+            pass
+        self.__file.close()
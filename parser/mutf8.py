@@ -0,0 +1,43 @@
+import re
+
+from objects.errors import ClassFormatError
+
+
+# --------------------------------------------------
+# MODIFIED UTF-8
+# --------------------------------------------------
+
+
+# Class files encode strings as Modified UTF-8 (JVMS §4.4.7), which differs from standard UTF-8 in
+# two ways: NUL is written as the two bytes C0 80, and supplementary characters are written as a
+# surrogate pair of two three-byte sequences instead of one four-byte sequence.
+#
+# No byte may be 00 or lie in the range F0-FF; standard UTF-8 allows both (NUL and four-byte
+# sequences), so they are rejected before decoding.
+INVALID_BYTES = re.compile(b"[\x00\xf0-\xff]")
+
+
+def decode_mutf8(raw: bytes) -> str:
+    # Nearly every name and descriptor is ASCII without NUL, which decodes the same in both encodings
+    if raw.isascii() and 0 not in raw:
+        return raw.decode()
+
+    if INVALID_BYTES.search(raw) is not None:
+        raise ClassFormatError("Failed to parse class: malformed modified UTF-8 constant (invalid byte)")
+
+    # Once those bytes are excluded, both differences are invalid in standard UTF-8, so anything the
+    # strict codec accepts decodes the same either way
+    try:
+        return raw.decode()
+    except UnicodeDecodeError:
+        pass
+
+    try:
+        # Surrogate halves are decoded individually, then joined through a UTF-16 round trip
+        decoded = raw.replace(b"\xc0\x80", b"\x00").decode("utf-8", "surrogatepass")
+        if b"\xed" in raw:
+            decoded = decoded.encode("utf-16-le", "surrogatepass").decode("utf-16-le", "surrogatepass")
+
+        return decoded
+    except UnicodeDecodeError as error:
+        raise ClassFormatError(f"Failed to parse class: malformed modified UTF-8 constant ({error.reason})")
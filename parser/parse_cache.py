@@ -0,0 +1,152 @@
+import os
+import pickle
+import tempfile
+import zlib
+from hashlib import sha256
+from stat import S_IWGRP, S_IWOTH
+
+from objects.classes import Class
+from parser.class_parser import PARSER_VERSION
+
+
+CACHE_SUFFIX = ".parsed"
+
+
+def is_private(stat) -> bool:
+    # Owned by the current user and not writable by group or others; POSIX only
+    if not hasattr(os, "getuid"):
+        return True
+    return stat.st_uid == os.getuid() and not stat.st_mode & (S_IWGRP | S_IWOTH)
+
+
+# On-disk cache of parsed classes, keyed by class file content hash and parser version.
+# Entries are written atomically (temporary file + rename), so several processes can share one
+# directory. Recency is tracked through file modification times, which drive LRU eviction once
+# the directory grows past `max_bytes`.
+#
+# Entries are pickles, and unpickling runs code, so only a directory and entries that nobody but the
+# current user can write are trusted: anyone else able to write them could run code in every parser
+# process. An untrusted directory is refused outright; untrusted entries are treated as misses.
+class ParseCache:
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not is_private(os.stat(directory)):
+            raise PermissionError(f"Parse cache directory {directory} is writable by other users")
+
+        self.__size = sum(size for _, size, _ in self.__entries())
+
+    def key(self, data) -> str:
+        return f"{sha256(data).hexdigest()}-{PARSER_VERSION}"
+
+    def path(self, key) -> str:
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def get(self, key) -> Class | None:
+        path = self.path(key)
+
+        try:
+            with open(path, "rb") as file:
+                # Checked on the open file, so it cannot be swapped after the check
+                if not is_private(os.fstat(file.fileno())):
+                    self.misses += 1
+                    return None
+                clazz = pickle.loads(zlib.decompress(file.read()))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Unreadable or stale entry; drop it and parse again
+            self.__remove(path)
+            self.misses += 1
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return clazz
+
+    def put(self, key, clazz: Class):
+        data = zlib.compress(pickle.dumps(clazz, pickle.HIGHEST_PROTOCOL))
+
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, self.path(key))
+        except OSError:
+            # Caching is best effort
+            self.__remove(temp_path)
+            return
+
+        self.__size += len(data)
+        if self.__size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        entries = sorted(self.__entries(), key=lambda entry: entry[2])
+        self.__size = sum(size for _, size, _ in entries)
+
+        # Least recently used first
+        for path, size, _ in entries:
+            if self.__size <= self.max_bytes:
+                break
+
+            if self.__remove(path):
+                self.evictions += 1
+            self.__size -= size
+
+    def clear(self):
+        for path, _, _ in self.__entries():
+            self.__remove(path)
+        self.__size = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.__size
+        }
+
+    def __entries(self):
+        # (path, size, last use) of every cached class
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return
+
+        for entry in entries:
+            if not entry.name.endswith(CACHE_SUFFIX):
+                continue
+
+            try:
+                stat = entry.stat()
+            except OSError:
+                # Evicted by another process
+                continue
+
+            yield entry.path, stat.st_size, stat.st_mtime
+
+    @staticmethod
+    def __remove(path) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            # Already gone, or not ours to remove; either way the entry is no longer used
+            return False
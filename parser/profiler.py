@@ -0,0 +1,154 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from heapq import nlargest
+from time import perf_counter
+
+from objects.attributes import AttributeCode, AttributeLazy, LazyAttributeList
+
+
+# Phases of read_class, in order. Constant pool entries are normally linked on demand; a profiled parse
+# links the whole pool right after reading it, so "linking" is timed separately and consumes no bytes.
+PHASES = ("header", "constant_pool", "linking", "class_info", "fields", "methods", "attributes")
+
+
+# --------------------------------------------------
+# CLASS PROFILE
+# --------------------------------------------------
+
+
+@dataclass(slots=True)
+class ClassProfile:
+    # Binary name, known once class_info has been read
+    name: str | None = None
+    size: int = 0
+    # Seconds spent in each phase
+    phases: dict[str, float] = field(default_factory=dict)
+    # Class file bytes consumed by each phase
+    section_bytes: dict[str, int] = field(default_factory=dict)
+    constant_tags: Counter = field(default_factory=Counter)
+    attributes: Counter = field(default_factory=Counter)
+    # (seconds, name + descriptor) per method
+    methods: list[tuple[float, str]] = field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+
+# Records one read_class call. Only created when a profiler is passed in.
+class ClassProfileRecorder:
+    def __init__(self, reader):
+        self.reader = reader
+        self.profile = ClassProfile(size=len(reader))
+        self.last_time = perf_counter()
+        self.last_offset = reader.offset
+
+    def mark(self, phase):
+        # Closes the current phase at the reader's position
+        now = perf_counter()
+        offset = self.reader.offset
+
+        self.profile.phases[phase] = now - self.last_time
+        self.profile.section_bytes[phase] = offset - self.last_offset
+
+        self.last_offset = offset
+        # Excludes the bookkeeping above from the next phase
+        self.last_time = perf_counter()
+
+    def method(self, method, elapsed):
+        self.profile.methods.append((elapsed, method.name + method.descriptor))
+
+    def finish(self, clazz) -> ClassProfile:
+        profile = self.profile
+        profile.name = clazz.this_class
+
+        constant_pool = clazz.constant_pool
+        profile.constant_tags.update(entry.tag for entry in constant_pool.raw if entry is not None)
+
+        for member in clazz.fields + clazz.methods:
+            self.count_attributes(member.attribute_info, constant_pool)
+        self.count_attributes(clazz.attribute_info, constant_pool)
+
+        return profile
+
+    def count_attributes(self, attributes, constant_pool):
+        # Counted without forcing lazy attributes to decode
+        if isinstance(attributes, LazyAttributeList):
+            attributes = attributes.raw_attributes()
+
+        for attribute in attributes:
+            if isinstance(attribute, AttributeLazy):
+                self.profile.attributes[constant_pool[attribute.attribute_name_index]] += 1
+            else:
+                self.profile.attributes[type(attribute).__name__.removeprefix("Attribute")] += 1
+
+                if isinstance(attribute, AttributeCode):
+                    self.count_attributes(attribute.attribute_info, constant_pool)
+
+
+# --------------------------------------------------
+# PROFILER
+# --------------------------------------------------
+
+
+# Collects a ClassProfile for every class parsed with it (parse_class(..., profiler=profiler)).
+# `callback` is called with each profile as soon as the class is read; the totals over all classes
+# are kept for report().
+class ParseProfiler:
+    def __init__(self, callback=None, slowest=10):
+        self.callback = callback
+        self.slowest = slowest
+
+        self.classes = 0
+        self.bytes = 0
+        self.phases = Counter()
+        self.section_bytes = Counter()
+        self.constant_tags = Counter()
+        self.attributes = Counter()
+        # (seconds, class, method) of the slowest methods seen so far
+        self.slowest_methods = list[tuple[float, str, str]]()
+
+    def recorder(self, reader) -> ClassProfileRecorder:
+        return ClassProfileRecorder(reader)
+
+    def record(self, profile: ClassProfile):
+        self.classes += 1
+        self.bytes += profile.size
+        self.phases.update(profile.phases)
+        self.section_bytes.update(profile.section_bytes)
+        self.constant_tags.update(profile.constant_tags)
+        self.attributes.update(profile.attributes)
+
+        self.slowest_methods = nlargest(
+            self.slowest,
+            self.slowest_methods + [(elapsed, profile.name, method) for elapsed, method in profile.methods]
+        )
+
+        if self.callback is not None:
+            self.callback(profile)
+
+    def report(self) -> str:
+        total = sum(self.phases.values())
+        lines = [f"{self.classes} classes, {self.bytes / 1024:.1f} KiB, {total * 1e3:.3f} ms"]
+
+        if total:
+            lines.append(f"  {self.bytes / total / 1e6:.2f} MB/s, {self.classes / total:.0f} classes/s")
+
+        lines.append("")
+        lines.append(f"  {'phase':<16}{'ms':>10}{'share':>8}{'KiB':>10}")
+        for phase in PHASES:
+            elapsed = self.phases[phase]
+            share = elapsed / total if total else 0
+            lines.append(f"  {phase:<16}{elapsed * 1e3:>10.3f}{share:>8.1%}{self.section_bytes[phase] / 1024:>10.1f}")
+
+        lines.append("")
+        lines.append("  constant tags: " + ", ".join(f"{tag}={count}" for tag, count in sorted(self.constant_tags.items())))
+        lines.append("  attributes: " + ", ".join(f"{name}={count}" for name, count in self.attributes.most_common()))
+
+        if self.slowest_methods:
+            lines.append("")
+            lines.append("  slowest methods:")
+            for elapsed, clazz, method in self.slowest_methods:
+                lines.append(f"    {elapsed * 1e3:>8.3f} ms  {clazz}.{method}")
+
+        return "\n".join(lines)
@@ -0,0 +1,57 @@
+import sys
+from threading import Lock
+
+from parser.mutf8 import decode_mutf8
+
+
+# --------------------------------------------------
+# SYMBOL TABLE
+# --------------------------------------------------
+
+
+# Process-wide table of decoded modified UTF-8 constants, keyed by their raw class file bytes. Every
+# class linked in this process gets the same str object for the same constant, so names and
+# descriptors such as java/lang/Object, ()V or Code are only held once and compare by identity first.
+#
+# Symbols are also passed through sys.intern, making them identical to the string literals used by
+# the parser and the runtime.
+class SymbolTable:
+    def __init__(self):
+        self.symbols = dict[bytes, str]()
+        # Total number of lookups, hits included
+        self.lookups = 0
+        self.__lock = Lock()
+
+    def intern(self, raw: bytes) -> str:
+        self.lookups += 1
+
+        symbol = self.symbols.get(raw)
+        if symbol is None:
+            decoded = sys.intern(decode_mutf8(raw))
+
+            # Two threads decoding the same new symbol must still agree on one object
+            with self.__lock:
+                symbol = self.symbols.setdefault(raw, decoded)
+
+        return symbol
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __contains__(self, raw):
+        return raw in self.symbols
+
+    def clear(self):
+        with self.__lock:
+            self.symbols.clear()
+            self.lookups = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "unique": len(self.symbols),
+            "total": self.lookups,
+            "bytes": sum(len(raw) for raw in self.symbols)
+        }
+
+
+symbols = SymbolTable()
@@ -0,0 +1,771 @@
+from functools import cache
+
+from objects.attributes import AttributeCode, AttributeStackMapTable
+from objects.constant_pool import *
+from objects.errors import VerifyError
+from objects.methods import MethodFlags
+from objects.stack_map_frames import *
+from objects.type_verification import *
+
+
+# Type-checking verifier for Java SE 8 class files (JVMS §4.10.1). Every method body is checked in
+# a single linear pass against the frames declared in its StackMapTable: operand and local types,
+# stack depth, branch and handler targets, and object initialization.
+#
+# Class types are only compared by name here. Without a class hierarchy, one class type is assumed
+# assignable to another, as the JVMS itself does for interfaces; pass `hierarchy` to verify_class
+# to check them.
+
+
+# --------------------------------------------------
+# VERIFICATION TYPES
+# --------------------------------------------------
+
+
+TOP = "top"
+INT = "int"
+FLOAT = "float"
+LONG = "long"
+DOUBLE = "double"
+NULL = "null"
+UNINITIALIZED_THIS = "uninitializedThis"
+# Any reference, initialized or not; only ever expected, never held
+REFERENCE = "reference"
+
+# Initialized class and array types are their field descriptors ("Ljava/lang/String;", "[I"), and
+# the result of `new` at some pc is the tuple ("uninitialized", pc)
+OBJECT = "Ljava/lang/Object;"
+STRING = "Ljava/lang/String;"
+THROWABLE = "Ljava/lang/Throwable;"
+
+# Class types every array is assignable to
+ARRAY_SUPERTYPES = {OBJECT, "Ljava/lang/Cloneable;", "Ljava/io/Serializable;"}
+
+# newarray atype -> array type
+PRIMITIVE_ARRAYS = {4: "[Z", 5: "[C", 6: "[F", 7: "[D", 8: "[B", 9: "[S", 10: "[I", 11: "[J"}
+
+CATEGORY_2 = {LONG, DOUBLE}
+
+
+def is_object(type_) -> bool:
+    # Initialized class or array type
+    return type(type_) is str and type_[0] in "L["
+
+
+def is_reference(type_) -> bool:
+    return type_ == NULL or type_ == UNINITIALIZED_THIS or type(type_) is tuple or is_object(type_)
+
+
+def is_assignable(source, target, hierarchy=None) -> bool:
+    if source == target or target == TOP:
+        return True
+    if target == REFERENCE:
+        return is_reference(source)
+    if is_object(target):
+        return source == NULL or is_object(source) and is_object_assignable(source, target, hierarchy)
+    return False
+
+
+def is_object_assignable(source, target, hierarchy) -> bool:
+    if source == target or target == OBJECT:
+        return True
+
+    if target[0] == "[":
+        if source[0] != "[":
+            return False
+
+        # Primitive components must match exactly
+        source_component, target_component = source[1:], target[1:]
+        if not is_object(source_component) or not is_object(target_component):
+            return source_component == target_component
+
+        return is_object_assignable(source_component, target_component, hierarchy)
+
+    if source[0] == "[":
+        return target in ARRAY_SUPERTYPES
+
+    return hierarchy is None or hierarchy(source[1:-1], target[1:-1])
+
+
+def class_type(name: str) -> str:
+    # Class constant names are binary names, except for array classes
+    return name if name[0] == "[" else f"L{name};"
+
+
+def expand(types) -> list:
+    # Category 2 types occupy two slots; the second is top
+    slots = list()
+    for type_ in types:
+        slots.append(type_)
+        if type_ in CATEGORY_2:
+            slots.append(TOP)
+
+    return slots
+
+
+# --------------------------------------------------
+# DESCRIPTORS
+# --------------------------------------------------
+
+
+def field_type(descriptor, i=0) -> tuple[str, int]:
+    # Verification type of the field descriptor starting at i, and the index following it
+    match descriptor[i]:
+        case "B" | "C" | "I" | "S" | "Z": return INT, i + 1
+        case "F": return FLOAT, i + 1
+        case "J": return LONG, i + 1
+        case "D": return DOUBLE, i + 1
+        case "L":
+            end = descriptor.index(";", i) + 1
+            return descriptor[i:end], end
+        case "[":
+            start = i
+            while descriptor[i] == "[":
+                i += 1
+            _, end = field_type(descriptor, i)
+            return descriptor[start:end], end
+        case _:
+            raise VerifyError(f"Failed to verify class: invalid descriptor {descriptor}")
+
+
+@cache
+def method_types(descriptor) -> tuple[tuple[str, ...], str | None]:
+    # Argument types and return type (None for void)
+    arguments = list()
+
+    i = 1
+    while descriptor[i] != ")":
+        type_, i = field_type(descriptor, i)
+        arguments.append(type_)
+
+    return tuple(arguments), None if descriptor[i + 1] == "V" else field_type(descriptor, i + 1)[0]
+
+
+# --------------------------------------------------
+# CLASS VERIFICATION
+# --------------------------------------------------
+
+
+# Results are not recorded here, since they depend on the hierarchy; the runtime verifies each class
+# once per process and namespace (see JVM.verify in runtime/pyjvm.py)
+def verify_class(clazz, hierarchy=None):
+    # Raises VerifyError on the first method that fails. `hierarchy(source, target)` decides whether
+    # one binary class name is assignable to another.
+    for method in clazz.methods:
+        for attribute in method.attribute_info:
+            if isinstance(attribute, AttributeCode):
+                MethodVerifier(clazz, method, attribute, hierarchy).verify()
+
+
+# --------------------------------------------------
+# METHOD VERIFICATION
+# --------------------------------------------------
+
+
+class MethodVerifier:
+    def __init__(self, clazz, method, attribute, hierarchy):
+        self.clazz = clazz
+        self.method = method
+        self.constant_pool = clazz.constant_pool
+        self.hierarchy = hierarchy
+
+        self.code = attribute.code
+        self.max_stack = attribute.max_stack
+        self.max_locals = attribute.max_locals
+        self.exception_table = attribute.exception_table
+
+        self.this_type = class_type(clazz.this_class)
+        self.arguments, self.return_type = method_types(method.descriptor)
+        self.is_init = method.name == "<init>"
+
+        self.pc = 0
+        self.locals = list()
+        self.stack = list()
+
+        self.frames = self.stack_map_frames(attribute)
+
+    def fail(self, reason):
+        raise VerifyError(
+            f"Failed to verify {self.clazz.this_class}.{self.method.name}{self.method.descriptor} at pc {self.pc}: {reason}"
+        )
+
+    # FRAMES
+
+    def initial_locals(self) -> list:
+        # Unexpanded; `this` is uninitialized until a constructor calls super() or this()
+        if MethodFlags.ACC_STATIC in self.method.access_flags:
+            return list(self.arguments)
+
+        if self.is_init and self.clazz.super_class is not None:
+            return [UNINITIALIZED_THIS, *self.arguments]
+
+        return [self.this_type, *self.arguments]
+
+    def frame(self, locals_, stack) -> tuple[list, list]:
+        locals_ = expand(locals_)
+        stack = expand(stack)
+
+        if len(locals_) > self.max_locals:
+            self.fail(f"frame has {len(locals_)} locals, max_locals is {self.max_locals}")
+        if len(stack) > self.max_stack:
+            self.fail(f"frame has {len(stack)} stack slots, max_stack is {self.max_stack}")
+
+        return locals_ + [TOP] * (self.max_locals - len(locals_)), stack
+
+    def stack_map_frames(self, attribute) -> dict[int, tuple[list, list]]:
+        initial = self.initial_locals()
+        self.initial_frame = self.frame(initial, [])
+
+        entries = list()
+        for nested in attribute.attribute_info:
+            if isinstance(nested, AttributeStackMapTable):
+                entries = nested.entries
+
+        frames = dict()
+        locals_ = initial
+        pc = -1
+
+        for entry in entries:
+            stack = []
+
+            match entry:
+                case SameFrame():
+                    delta = entry.frame_type
+                case SameLocals1StackItemFrame():
+                    delta = entry.frame_type - 64
+                    stack = [self.frame_type(entry.stack[0])]
+                case SameLocals1StackItemFrameExtended():
+                    delta = entry.offset_delta
+                    stack = [self.frame_type(entry.stack[0])]
+                case ChopFrame():
+                    delta = entry.offset_delta
+                    chopped = 251 - entry.frame_type
+                    if chopped > len(locals_):
+                        self.fail("stack map frame chops more locals than there are")
+                    locals_ = locals_[:-chopped]
+                case SameFrameExtended():
+                    delta = entry.offset_delta
+                case AppendFrame():
+                    delta = entry.offset_delta
+                    locals_ = locals_ + [self.frame_type(type_) for type_ in entry.locals]
+                case FullFrame():
+                    delta = entry.offset_delta
+                    locals_ = [self.frame_type(type_) for type_ in entry.locals]
+                    stack = [self.frame_type(type_) for type_ in entry.stack]
+
+            # The first frame's offset is its delta; every later one is one past the previous frame
+            pc += delta + 1
+            self.pc = pc
+            if pc not in self.code:
+                self.fail("stack map frame is not at an instruction")
+
+            frames[pc] = self.frame(locals_, stack)
+
+        return frames
+
+    def frame_type(self, info):
+        match info:
+            case TopVariableInfo(): return TOP
+            case IntegerVariableInfo(): return INT
+            case FloatVariableInfo(): return FLOAT
+            case LongVariableInfo(): return LONG
+            case DoubleVariableInfo(): return DOUBLE
+            case NullVariableInfo(): return NULL
+            case UninitializedThisVariableInfo(): return UNINITIALIZED_THIS
+            case ObjectVariableInfo(): return class_type(self.constant_pool[info.cpool_index].name)
+            case UninitializedVariableInfo(): return "uninitialized", info.offset
+
+    def check_frame(self, pc, locals_, stack):
+        # Control passes to `pc` with the given state, which must match the frame declared there
+        target = self.frames.get(pc)
+        if target is None:
+            self.fail(f"no stack map frame at branch target {pc}")
+
+        target_locals, target_stack = target
+        if len(stack) != len(target_stack):
+            self.fail(f"stack height {len(stack)} does not match the frame at {pc}")
+
+        for source, expected in zip(locals_, target_locals):
+            if not is_assignable(source, expected, self.hierarchy):
+                self.fail(f"local {source} is not assignable to {expected} in the frame at {pc}")
+        for source, expected in zip(stack, target_stack):
+            if not is_assignable(source, expected, self.hierarchy):
+                self.fail(f"stack item {source} is not assignable to {expected} in the frame at {pc}")
+
+    def check_handlers(self, pc, locals_):
+        for handler in self.exception_table:
+            if handler.start_pc <= pc < handler.end_pc:
+                catch_type = class_type(self.constant_pool[handler.catch_type].name) if handler.catch_type else THROWABLE
+                self.check_frame(handler.handler_pc, locals_, [catch_type])
+
+    # WALK
+
+    def verify(self):
+        code = self.code
+        locals_, stack = self.initial_frame
+        self.locals, self.stack = list(locals_), list(stack)
+
+        # Set after instructions that never fall through (goto, return, athrow, switches)
+        dead = False
+
+        for index in range(len(code)):
+            pc = self.pc = code.pcs[index]
+
+            frame = self.frames.get(pc)
+            if frame is not None:
+                if not dead:
+                    self.check_frame(pc, self.locals, self.stack)
+                self.locals, self.stack = list(frame[0]), list(frame[1])
+            elif dead:
+                self.fail("expected a stack map frame after an unconditional branch")
+
+            # Handlers may be entered before or after the instruction's effect on locals
+            self.check_handlers(pc, self.locals)
+            locals_before = list(self.locals)
+
+            dead = self.execute(code.opcodes[index], code.operands_at(index))
+
+            if self.locals != locals_before:
+                self.check_handlers(pc, self.locals)
+
+        if not dead:
+            self.fail("execution falls off the end of the code")
+
+    # OPERAND STACK & LOCALS
+
+    def push(self, type_):
+        self.stack.append(type_)
+        if type_ in CATEGORY_2:
+            self.stack.append(TOP)
+
+        if len(self.stack) > self.max_stack:
+            self.fail(f"operand stack exceeds max_stack {self.max_stack}")
+
+    def pop(self, expected=REFERENCE):
+        stack = self.stack
+
+        if expected in CATEGORY_2:
+            if len(stack) < 2 or stack[-1] != TOP or stack[-2] != expected:
+                self.fail(f"expected {expected} on the operand stack")
+            stack.pop()
+            return stack.pop()
+
+        if not stack:
+            self.fail("operand stack underflow")
+
+        type_ = stack.pop()
+        if not is_assignable(type_, expected, self.hierarchy):
+            self.fail(f"expected {expected} on the operand stack, found {type_}")
+
+        return type_
+
+    def pop_slots(self, count) -> list:
+        # Raw slots for the dup/pop family, which must not split a category 2 value
+        if len(self.stack) < count:
+            self.fail("operand stack underflow")
+        if self.stack[-count] == TOP:
+            self.fail("instruction splits a long or double on the operand stack")
+
+        slots = self.stack[-count:]
+        del self.stack[-count:]
+        return slots
+
+    def pop_category_1(self):
+        type_ = self.pop_slots(1)[0]
+        if type_ in CATEGORY_2:
+            self.fail("instruction splits a long or double on the operand stack")
+        return type_
+
+    def push_slots(self, slots):
+        self.stack.extend(slots)
+        if len(self.stack) > self.max_stack:
+            self.fail(f"operand stack exceeds max_stack {self.max_stack}")
+
+    def load(self, index, expected):
+        size = 2 if expected in CATEGORY_2 else 1
+        if index + size > self.max_locals:
+            self.fail(f"local {index} is out of range")
+
+        type_ = self.locals[index]
+        if expected in CATEGORY_2:
+            if type_ != expected or self.locals[index + 1] != TOP:
+                self.fail(f"expected {expected} in local {index}")
+        elif not is_assignable(type_, expected, self.hierarchy):
+            self.fail(f"expected {expected} in local {index}, found {type_}")
+
+        self.push(type_)
+
+    def store(self, index, expected):
+        type_ = self.pop(expected)
+
+        size = 2 if type_ in CATEGORY_2 else 1
+        if index + size > self.max_locals:
+            self.fail(f"local {index} is out of range")
+
+        locals_ = self.locals
+        # Overwriting the second half of a long or double invalidates the whole value
+        if index > 0 and locals_[index - 1] in CATEGORY_2:
+            locals_[index - 1] = TOP
+
+        locals_[index] = type_
+        if size == 2:
+            locals_[index + 1] = TOP
+
+    def replace_uninitialized(self, uninitialized, initialized):
+        # Every copy of the object becomes initialized at once
+        self.locals = [initialized if type_ == uninitialized else type_ for type_ in self.locals]
+        self.stack = [initialized if type_ == uninitialized else type_ for type_ in self.stack]
+
+    # CONSTANT POOL
+
+    def class_constant(self, index) -> str:
+        entry = self.constant_pool[index]
+        if not isinstance(entry, PConstantClassInfo):
+            self.fail(f"constant {index} is not a class")
+        return class_type(entry.name)
+
+    def field_constant(self, index) -> tuple[str, str]:
+        entry = self.constant_pool[index]
+        if not isinstance(entry, PConstantFieldrefInfo):
+            self.fail(f"constant {index} is not a field reference")
+        return class_type(entry.clazz.name), field_type(entry.name_and_type.descriptor)[0]
+
+    def ldc_type(self, index, wide) -> str:
+        entry = self.constant_pool[index]
+
+        match entry:
+            case PConstantIntegerInfo() if not wide: return INT
+            case PConstantFloatInfo() if not wide: return FLOAT
+            case PConstantStringInfo() if not wide: return STRING
+            case PConstantClassInfo() if not wide: return "Ljava/lang/Class;"
+            case PConstantMethodTypeInfo() if not wide: return "Ljava/lang/invoke/MethodType;"
+            case PConstantMethodHandleInfo() if not wide: return "Ljava/lang/invoke/MethodHandle;"
+            case PConstantLongInfo() if wide: return LONG
+            case PConstantDoubleInfo() if wide: return DOUBLE
+            case _: self.fail(f"constant {index} cannot be loaded by {'ldc2_w' if wide else 'ldc'}")
+
+    # INSTRUCTIONS
+
+    def execute(self, opcode, operands) -> bool:
+        # Applies one instruction to the current frame; returns True if it never falls through
+        pop, push = self.pop, self.push
+
+        match opcode:
+            # nop
+            case 0: pass
+
+            # CONSTANTS
+
+            case 1: push(NULL)
+            case 2 | 3 | 4 | 5 | 6 | 7 | 8 | 16 | 17: push(INT)
+            case 9 | 10: push(LONG)
+            case 11 | 12 | 13: push(FLOAT)
+            case 14 | 15: push(DOUBLE)
+            case 18 | 19: push(self.ldc_type(operands[0], False))
+            case 20: push(self.ldc_type(operands[0], True))
+
+            # LOADS & STORES
+
+            case 21: self.load(operands[0], INT)
+            case 22: self.load(operands[0], LONG)
+            case 23: self.load(operands[0], FLOAT)
+            case 24: self.load(operands[0], DOUBLE)
+            case 25: self.load(operands[0], REFERENCE)
+            case _ if 26 <= opcode <= 45:
+                self.load((opcode - 26) % 4, (INT, LONG, FLOAT, DOUBLE, REFERENCE)[(opcode - 26) // 4])
+            case 54: self.store(operands[0], INT)
+            case 55: self.store(operands[0], LONG)
+            case 56: self.store(operands[0], FLOAT)
+            case 57: self.store(operands[0], DOUBLE)
+            case 58: self.store(operands[0], REFERENCE)
+            case _ if 59 <= opcode <= 78:
+                self.store((opcode - 59) % 4, (INT, LONG, FLOAT, DOUBLE, REFERENCE)[(opcode - 59) // 4])
+
+            # ARRAYS
+
+            case 46 | 47 | 48 | 49 | 51 | 52 | 53:
+                pop(INT)
+                array = pop(OBJECT)
+                component = {46: INT, 47: LONG, 48: FLOAT, 49: DOUBLE, 51: INT, 52: INT, 53: INT}[opcode]
+                self.check_primitive_array(array, opcode - 46)
+                push(component)
+            case 50:
+                pop(INT)
+                array = pop(OBJECT)
+                if array != NULL and (array[0] != "[" or not is_object(array[1:])):
+                    self.fail(f"aaload on {array}")
+                push(NULL if array == NULL else array[1:])
+            case 79 | 80 | 81 | 82 | 84 | 85 | 86:
+                pop({79: INT, 80: LONG, 81: FLOAT, 82: DOUBLE, 84: INT, 85: INT, 86: INT}[opcode])
+                pop(INT)
+                self.check_primitive_array(pop(OBJECT), opcode - 79)
+            case 83:
+                pop(OBJECT)
+                pop(INT)
+                array = pop(OBJECT)
+                if array != NULL and (array[0] != "[" or not is_object(array[1:])):
+                    self.fail(f"aastore on {array}")
+            case 188:
+                pop(INT)
+                if operands[0] not in PRIMITIVE_ARRAYS:
+                    self.fail(f"invalid newarray type {operands[0]}")
+                push(PRIMITIVE_ARRAYS[operands[0]])
+            case 189:
+                pop(INT)
+                push("[" + self.class_constant(operands[0]))
+            case 190:
+                array = pop(OBJECT)
+                if array != NULL and array[0] != "[":
+                    self.fail(f"arraylength on {array}")
+                push(INT)
+            case 197:
+                array = self.class_constant(operands[0])
+                dimensions = operands[1]
+                if dimensions < 1 or not array.startswith("[" * dimensions):
+                    self.fail(f"multianewarray of {dimensions} dimensions on {array}")
+                for _ in range(dimensions):
+                    pop(INT)
+                push(array)
+
+            # STACK
+
+            case 87: self.pop_category_1()
+            case 88: self.pop_slots(2)
+            case 89:
+                value = self.pop_category_1()
+                self.push_slots([value, value])
+            case 90:
+                value1 = self.pop_category_1()
+                value2 = self.pop_category_1()
+                self.push_slots([value1, value2, value1])
+            case 91:
+                value1 = self.pop_category_1()
+                below = self.pop_slots(2)
+                self.push_slots([value1, *below, value1])
+            case 92:
+                top = self.pop_slots(2)
+                self.push_slots(top + top)
+            case 93:
+                top = self.pop_slots(2)
+                value3 = self.pop_category_1()
+                self.push_slots([*top, value3, *top])
+            case 94:
+                top = self.pop_slots(2)
+                below = self.pop_slots(2)
+                self.push_slots(top + below + top)
+            case 95:
+                value1 = self.pop_category_1()
+                value2 = self.pop_category_1()
+                self.push_slots([value1, value2])
+
+            # ARITHMETIC
+
+            case _ if 96 <= opcode <= 115:
+                type_ = (INT, LONG, FLOAT, DOUBLE)[(opcode - 96) % 4]
+                pop(type_)
+                pop(type_)
+                push(type_)
+            case _ if 116 <= opcode <= 119:
+                type_ = (INT, LONG, FLOAT, DOUBLE)[opcode - 116]
+                pop(type_)
+                push(type_)
+            case 120 | 122 | 124:
+                pop(INT)
+                pop(INT)
+                push(INT)
+            case 121 | 123 | 125:
+                pop(INT)
+                pop(LONG)
+                push(LONG)
+            case 126 | 128 | 130:
+                pop(INT)
+                pop(INT)
+                push(INT)
+            case 127 | 129 | 131:
+                pop(LONG)
+                pop(LONG)
+                push(LONG)
+            case 132:
+                self.check_iinc(operands[0])
+
+            # CONVERSIONS & COMPARISONS
+
+            case _ if 133 <= opcode <= 147:
+                source, result = CONVERSIONS[opcode]
+                pop(source)
+                push(result)
+            case 148 | 149 | 150 | 151 | 152:
+                type_ = {148: LONG, 149: FLOAT, 150: FLOAT, 151: DOUBLE, 152: DOUBLE}[opcode]
+                pop(type_)
+                pop(type_)
+                push(INT)
+
+            # CONTROL
+
+            case _ if 153 <= opcode <= 158:
+                pop(INT)
+                self.check_frame(operands[0], self.locals, self.stack)
+            case _ if 159 <= opcode <= 164:
+                pop(INT)
+                pop(INT)
+                self.check_frame(operands[0], self.locals, self.stack)
+            case 165 | 166:
+                pop()
+                pop()
+                self.check_frame(operands[0], self.locals, self.stack)
+            case 198 | 199:
+                pop()
+                self.check_frame(operands[0], self.locals, self.stack)
+            case 167 | 200:
+                self.check_frame(operands[0], self.locals, self.stack)
+                return True
+            case 168 | 169 | 201:
+                self.fail("jsr and ret are not allowed in version 50+ class files")
+            case 170:
+                pop(INT)
+                for target in (operands[0], *operands[3:]):
+                    self.check_frame(target, self.locals, self.stack)
+                return True
+            case 171:
+                pop(INT)
+                for target in (operands[0], *operands[3::2]):
+                    self.check_frame(target, self.locals, self.stack)
+                return True
+            case _ if 172 <= opcode <= 175:
+                expected = (INT, LONG, FLOAT, DOUBLE)[opcode - 172]
+                if self.return_type != expected:
+                    self.fail(f"return of {expected} from a method returning {self.return_type or 'void'}")
+                pop(expected)
+                return True
+            case 176:
+                if self.return_type is None or not is_object(self.return_type):
+                    self.fail(f"return of a reference from a method returning {self.return_type or 'void'}")
+                pop(self.return_type)
+                return True
+            case 177:
+                if self.return_type is not None:
+                    self.fail(f"void return from a method returning {self.return_type}")
+                if self.is_init and UNINITIALIZED_THIS in self.locals:
+                    self.fail("constructor returns before calling super() or this()")
+                return True
+            case 191:
+                pop(THROWABLE)
+                return True
+
+            # FIELDS
+
+            case 178:
+                push(self.field_constant(operands[0])[1])
+            case 179:
+                pop(self.field_constant(operands[0])[1])
+            case 180:
+                owner, type_ = self.field_constant(operands[0])
+                pop(owner)
+                push(type_)
+            case 181:
+                owner, type_ = self.field_constant(operands[0])
+                pop(type_)
+                # Constructors may assign their own fields before calling super()
+                if self.stack and self.stack[-1] == UNINITIALIZED_THIS and owner == self.this_type:
+                    self.stack.pop()
+                else:
+                    pop(owner)
+
+            # INVOCATION
+
+            case 182 | 183 | 184 | 185 | 186:
+                self.invoke(opcode, operands[0])
+
+            # OBJECTS
+
+            case 187:
+                type_ = self.class_constant(operands[0])
+                if type_[0] == "[":
+                    self.fail(f"new of array type {type_}")
+                push(("uninitialized", self.pc))
+            case 192:
+                pop(OBJECT)
+                push(self.class_constant(operands[0]))
+            case 193:
+                pop(OBJECT)
+                push(INT)
+            case 194 | 195:
+                pop(OBJECT)
+
+            # wide
+            case 196:
+                match operands[0]:
+                    case 21 | 22 | 23 | 24 | 25:
+                        self.load(operands[1], (INT, LONG, FLOAT, DOUBLE, REFERENCE)[operands[0] - 21])
+                    case 54 | 55 | 56 | 57 | 58:
+                        self.store(operands[1], (INT, LONG, FLOAT, DOUBLE, REFERENCE)[operands[0] - 54])
+                    case 132:
+                        self.check_iinc(operands[1])
+                    case _:
+                        self.fail(f"wide applied to opcode {operands[0]}")
+
+            case _:
+                self.fail(f"opcode {opcode} is not allowed in method bodies")
+
+        return False
+
+    def check_primitive_array(self, array, kind):
+        # kind: 0 int, 1 long, 2 float, 3 double, 5 byte or boolean, 6 char, 7 short
+        if array == NULL:
+            return
+
+        allowed = {0: ("[I",), 1: ("[J",), 2: ("[F",), 3: ("[D",), 5: ("[B", "[Z"), 6: ("[C",), 7: ("[S",)}[kind]
+        if array not in allowed:
+            self.fail(f"{'/'.join(allowed)} array expected, found {array}")
+
+    def check_iinc(self, index):
+        if index >= self.max_locals or self.locals[index] != INT:
+            self.fail(f"iinc on non-int local {index}")
+
+    def invoke(self, opcode, index):
+        entry = self.constant_pool[index]
+
+        match opcode, entry:
+            case 186, PConstantInvokeDynamicInfo(): owner = None
+            case 185, PConstantInterfaceMethodrefInfo(): owner = OBJECT
+            case 183 | 184, PConstantMethodrefInfo() | PConstantInterfaceMethodrefInfo():
+                owner = class_type(entry.clazz.name)
+            case 182, PConstantMethodrefInfo(): owner = class_type(entry.clazz.name)
+            case _: self.fail(f"constant {index} cannot be invoked by opcode {opcode}")
+
+        name = entry.name_and_type.name
+        arguments, return_type = method_types(entry.name_and_type.descriptor)
+
+        if name[0] == "<" and (name != "<init>" or opcode != 183):
+            self.fail(f"{name} cannot be invoked by opcode {opcode}")
+
+        for argument in reversed(arguments):
+            self.pop(argument)
+
+        if name == "<init>":
+            receiver = self.pop()
+            if receiver == UNINITIALIZED_THIS:
+                self.replace_uninitialized(receiver, self.this_type)
+            elif type(receiver) is tuple:
+                # The class named by the `new` instruction that created the object
+                new = self.code.index_of(receiver[1]) if receiver[1] in self.code else None
+                if new is None or self.code.opcodes[new] != 187:
+                    self.fail(f"uninitialized object from pc {receiver[1]} was not created by new")
+                self.replace_uninitialized(receiver, self.class_constant(self.code.operands_at(new)[0]))
+            else:
+                self.fail(f"<init> invoked on initialized {receiver}")
+        elif opcode != 184 and opcode != 186:
+            self.pop(owner)
+
+        if return_type is not None:
+            self.push(return_type)
+
+
+# Conversion opcode -> (operand type, result type)
+CONVERSIONS = {
+    133: (INT, LONG), 134: (INT, FLOAT), 135: (INT, DOUBLE),
+    136: (LONG, INT), 137: (LONG, FLOAT), 138: (LONG, DOUBLE),
+    139: (FLOAT, INT), 140: (FLOAT, LONG), 141: (FLOAT, DOUBLE),
+    142: (DOUBLE, INT), 143: (DOUBLE, LONG), 144: (DOUBLE, FLOAT),
+    145: (INT, INT), 146: (INT, INT), 147: (INT, INT)
+}
@@ -0,0 +1,224 @@
+import json
+import os
+import tempfile
+from collections import defaultdict
+from hashlib import sha256
+from threading import Lock
+
+from objects.classes import Class
+from parser.class_parser import parse_class
+from parser.jar_reader import JarFile
+
+
+INDEX_VERSION = 1
+
+
+# --------------------------------------------------
+# SHARED CLASS DATA
+# --------------------------------------------------
+
+
+# Parsed classes are immutable once defined, so every JVM in the process shares them. Keyed by
+# content hash; entries live for the rest of the process. Verification depends on the classes a VM
+# can see, so it happens when a VM links the class (see runtime/pyjvm.py).
+shared_classes = dict[bytes, Class]()
+shared_lock = Lock()
+
+
+def shared_class(source) -> Class:
+    # Accepts a filename or the class file bytes
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            source = file.read()
+
+    digest = sha256(source).digest()
+    clazz = shared_classes.get(digest)
+    if clazz is None:
+        # Parsed outside the lock; a class raced in by another thread wins
+        clazz = parse_class(source)
+        with shared_lock:
+            clazz = shared_classes.setdefault(digest, clazz)
+
+    return clazz
+
+
+# --------------------------------------------------
+# CLASSPATH INDEX
+# --------------------------------------------------
+
+
+def entry_signature(entry: str, directories=()) -> dict:
+    # What has to stay unchanged for an entry's index to remain valid. Adding or removing a file
+    # changes the modification time of its directory, so directories record every subdirectory.
+    if os.path.isdir(entry):
+        return {
+            directory: os.stat(os.path.join(entry, directory)).st_mtime_ns
+            for directory in directories
+        }
+
+    stat = os.stat(entry)
+    return {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def scan_entry(entry: str) -> dict:
+    # {"signature": ..., "packages": {package: [simple class names]}} for one classpath entry
+    packages = defaultdict(list)
+
+    if os.path.isdir(entry):
+        directories = list()
+        for root, dirs, files in os.walk(entry):
+            dirs.sort()
+            directory = os.path.relpath(root, entry)
+            directories.append(directory)
+
+            package = "" if directory == "." else directory.replace(os.sep, "/")
+            for name in sorted(files):
+                if name.endswith(".class"):
+                    packages[package].append(name[:-len(".class")])
+
+        signature = entry_signature(entry, directories)
+    else:
+        with JarFile(entry) as jar:
+            for name in jar.names():
+                package, _, simple_name = name.rpartition("/")
+                packages[package].append(simple_name)
+
+        signature = entry_signature(entry)
+
+    return {"signature": signature, "packages": dict(packages)}
+
+
+def load_index(path) -> dict[str, dict]:
+    try:
+        with open(path) as file:
+            index = json.load(file)
+    except (OSError, ValueError):
+        return dict()
+
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return dict()
+    return index.get("entries", dict())
+
+
+def save_index(path, entries: dict[str, dict]):
+    # Written atomically, so concurrent loaders never read a partial index
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as file:
+            json.dump({"version": INDEX_VERSION, "entries": entries}, file)
+        os.replace(temp_path, path)
+    except OSError:
+        # The index is only an optimization
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+# --------------------------------------------------
+# CLASS LOADER
+# --------------------------------------------------
+
+
+# Finds classes on a classpath of directories and JAR files. Every entry is indexed once by package,
+# with the class names it holds, so finding a class is a dict lookup and a miss never touches the
+# filesystem. With `index_path`, the index is kept in a JSON file shared by later loaders and only
+# entries that changed since are scanned again.
+class ClassLoader:
+    def __init__(self, classpath=(), index_path=None):
+        if isinstance(classpath, (str, os.PathLike)):
+            classpath = [classpath]
+
+        self.entries = [
+            os.path.abspath(entry)
+            for path in classpath
+            for entry in str(path).split(os.pathsep)
+            if entry
+        ]
+        self.index_path = index_path
+        self.scanned = 0
+
+        # package -> [(entry, class names)], in classpath order
+        self.packages = dict[str, list[tuple[str, frozenset[str]]]]()
+        self.directories = set[str]()
+        # Open archives by entry, filled on first read; the loader may be shared by VMs on several
+        # threads, so each archive is opened under the lock, once
+        self.__jars = dict[str, JarFile]()
+        self.__jars_lock = Lock()
+        self.__index()
+
+    def __index(self):
+        stored = load_index(self.index_path) if self.index_path is not None else dict()
+
+        changed = False
+        for entry in self.entries:
+            if os.path.isdir(entry):
+                self.directories.add(entry)
+
+            indexed = stored.get(entry)
+            if indexed is None or not self.__valid(entry, indexed["signature"]):
+                try:
+                    indexed = stored[entry] = scan_entry(entry)
+                except OSError:
+                    # Missing entries are skipped, as the JVM does
+                    continue
+                self.scanned += 1
+                changed = True
+
+            for package, names in indexed["packages"].items():
+                self.packages.setdefault(package, []).append((entry, frozenset(names)))
+
+        if changed and self.index_path is not None:
+            save_index(self.index_path, stored)
+
+    def __valid(self, entry, signature) -> bool:
+        try:
+            return entry_signature(entry, signature if entry in self.directories else ()) == signature
+        except OSError:
+            return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, name):
+        return self.locate(name) is not None
+
+    def locate(self, name: str) -> str | None:
+        # Classpath entry holding binary class name `name`
+        package, _, simple_name = name.rpartition("/")
+        for entry, names in self.packages.get(package, ()):
+            if simple_name in names:
+                return entry
+        return None
+
+    def read(self, name: str) -> bytes | None:
+        entry = self.locate(name)
+        if entry is None:
+            return None
+
+        if entry in self.directories:
+            with open(os.path.join(entry, *name.split("/")) + ".class", "rb") as file:
+                return file.read()
+
+        jar = self.__jars.get(entry)
+        if jar is None:
+            with self.__jars_lock:
+                jar = self.__jars.get(entry)
+                if jar is None:
+                    jar = self.__jars[entry] = JarFile(entry)
+        # Copied out of the mapping, since the parsed class outlives the open archive
+        return bytes(jar.read(name))
+
+    def load(self, name: str) -> Class | None:
+        data = self.read(name)
+        return shared_class(data) if data is not None else None
+
+    def close(self):
+        with self.__jars_lock:
+            for jar in self.__jars.values():
+                jar.close()
+            self.__jars.clear()
@@ -0,0 +1,215 @@
+from objects.attributes import AttributeCode
+from objects.constant_pool import *
+from objects.errors import ClassFormatError, VerifyError
+from objects.runtime import Executable, Frame, JavaException
+from parser.verifier import CATEGORY_2, method_types
+from runtime.opcodes import LDC_CLASS, LDC_UNSUPPORTED, handlers, illegal, opcodes as opcode_table
+
+
+# newarray atype -> array descriptor
+NEWARRAY_TYPES = {4: "[Z", 5: "[C", 6: "[F", 7: "[D", 8: "[B", 9: "[S", 10: "[I", 11: "[J"}
+
+# Python errors raised on behalf of the JVM -> (Java exception, message). Handlers throw everything
+# else explicitly; any other Python error is a bug and propagates as such.
+RUNTIME_ERRORS = {
+    RecursionError: ("java/lang/StackOverflowError", None)
+}
+RUNTIME_ERROR_TYPES = tuple(RUNTIME_ERRORS)
+
+# Opcodes a method body may not contain: jsr, ret and jsr_w in version 50+ class files (JVMS §4.9.1)
+# and the reserved opcodes (§6.2)
+REJECTED_OPCODES = {168: "jsr", 169: "ret", 201: "jsr_w", 202: "breakpoint", 254: "impdep1", 255: "impdep2"}
+
+# Loadable constants the VM has no objects for, by constant pool tag
+UNSUPPORTED_CONSTANTS = {15: "MethodHandle", 16: "MethodType"}
+
+
+# --------------------------------------------------
+# PREPARATION
+# --------------------------------------------------
+
+
+def field_category(descriptor: str) -> int:
+    return 2 if descriptor[0] in "JD" else 1
+
+
+def invocation_slots(descriptor: str, static: bool) -> tuple[int, int]:
+    # (argument slots including the receiver, return category)
+    arguments, return_type = method_types(descriptor)
+    slots = sum(2 if argument in CATEGORY_2 else 1 for argument in arguments) + (0 if static else 1)
+
+    if return_type is None:
+        return slots, 0
+    return slots, 2 if return_type in CATEGORY_2 else 1
+
+
+def constant_value(entry):
+    match entry:
+        case PConstantIntegerInfo() | PConstantFloatInfo() | PConstantLongInfo() | PConstantDoubleInfo():
+            return entry.value
+        case PConstantStringInfo():
+            return entry.string
+        case _:
+            raise ClassFormatError(f"Failed to prepare class: {type(entry).__name__.removeprefix('PConstant')} is not a loadable constant")
+
+
+def prepare_arg(opcode, operands, code, constant_pool):
+    if opcode_table[opcode].branch:
+        return code.index_of(operands[0])
+
+    match opcode:
+        # ldc, ldc_w, ldc2_w
+        case 18 | 19 | 20:
+            return constant_value(constant_pool[operands[0]])
+
+        # getstatic, putstatic, getfield, putfield
+        case 178 | 179 | 180 | 181:
+            entry = constant_pool[operands[0]]
+            descriptor = entry.name_and_type.descriptor
+            return entry.clazz.name, entry.name_and_type.name, field_category(descriptor)
+
+        # invokevirtual, invokespecial, invokestatic, invokeinterface
+        case 182 | 183 | 184 | 185:
+            entry = constant_pool[operands[0]]
+            key = (entry.clazz.name, entry.name_and_type.name, entry.name_and_type.descriptor)
+            return key, *invocation_slots(key[2], opcode == 184)
+
+        case 186:
+            name_and_type = constant_pool[operands[0]].name_and_type
+            return name_and_type.name, name_and_type.descriptor
+
+        # new, checkcast, instanceof
+        case 187 | 192 | 193:
+            return constant_pool[operands[0]].name
+
+        case 188:
+            return NEWARRAY_TYPES[operands[0]]
+
+        case 189:
+            component = constant_pool[operands[0]].name
+            return "[" + (component if component[0] == "[" else f"L{component};")
+
+        case 197:
+            return constant_pool[operands[0]].name, operands[1]
+
+        case 132:
+            return operands[0], operands[1]
+
+        case 170:
+            default, low, high, *targets = operands
+            return code.index_of(default), low, high, [code.index_of(target) for target in targets]
+
+        case 171:
+            default, _, *pairs = operands
+            return code.index_of(default), {match: code.index_of(target) for match, target in zip(pairs[::2], pairs[1::2])}
+
+        case _:
+            return operands[0] if operands else None
+
+
+def prepare(clazz, attribute: AttributeCode) -> Executable:
+    code = attribute.code
+    constant_pool = clazz.constant_pool
+
+    prepared_opcodes = list[int]()
+    args = list()
+    for index in range(len(code)):
+        opcode = code.opcode_at(index)
+        operands = code.operands_at(index)
+
+        # wide is folded into the instruction it modifies; the handlers take any local index
+        if opcode == 196:
+            opcode, *operands = operands
+
+        if opcode in REJECTED_OPCODES or handlers[opcode] is illegal:
+            name = REJECTED_OPCODES.get(opcode, f"opcode {opcode}")
+            raise VerifyError(f"Failed to prepare {clazz.this_class}: {name} at pc {code.pcs[index]} is not allowed")
+
+        # ldc and ldc_w of a Class load the mirror of the running VM; those of constants the VM has
+        # no objects for throw when executed
+        if opcode == 18 or opcode == 19:
+            tag = constant_pool.tag(operands[0])
+            if tag == 7:
+                prepared_opcodes.append(LDC_CLASS)
+                args.append(constant_pool[operands[0]].name)
+                continue
+            if tag in UNSUPPORTED_CONSTANTS:
+                prepared_opcodes.append(LDC_UNSUPPORTED)
+                args.append(UNSUPPORTED_CONSTANTS[tag])
+                continue
+
+        prepared_opcodes.append(opcode)
+        args.append(prepare_arg(opcode, operands, code, constant_pool))
+
+    exception_table = list()
+    for handler in attribute.exception_table:
+        end = code.index_of(handler.end_pc) if handler.end_pc < code.code_length else len(code)
+        catch_type = constant_pool[handler.catch_type].name if handler.catch_type else None
+        exception_table.append((code.index_of(handler.start_pc), end, code.index_of(handler.handler_pc), catch_type))
+
+    return Executable(prepared_opcodes, args, attribute.max_stack, attribute.max_locals, exception_table, code.pcs)
+
+
+# --------------------------------------------------
+# EXECUTION
+# --------------------------------------------------
+
+
+def find_handler(frame, index, instance) -> int:
+    vm = frame.vm
+    for start, end, handler, catch_type in frame.code.exception_table:
+        if start <= index < end and (catch_type is None or vm.is_instance(instance, catch_type)):
+            return handler
+    return -1
+
+
+def execute(frame: Frame):
+    code = frame.code
+    opcodes = code.opcodes
+    args = code.args
+    table = handlers
+
+    index = 0
+    while True:
+        try:
+            # One Python call per instruction: the handler applies the instruction to the frame and
+            # returns the index of the next one
+            while index >= 0:
+                index = table[opcodes[index]](frame, args[index], index)
+            return frame.result
+
+        except JavaException as exception:
+            instance = exception.instance
+            error = exception
+
+        except RUNTIME_ERROR_TYPES as python_error:
+            class_name, message = RUNTIME_ERRORS[type(python_error)]
+            instance = frame.vm.new_throwable(class_name, message)
+            error = JavaException(instance)
+
+        # `index` still holds the instruction that raised
+        handler = find_handler(frame, index, instance)
+        if handler < 0:
+            raise error
+
+        frame.stack[0] = instance
+        frame.sp = 1
+        index = handler
+
+
+class BytecodeMethod:
+    __slots__ = ("clazz", "method", "code")
+
+    def __init__(self, clazz, method, attribute: AttributeCode):
+        self.clazz = clazz
+        self.method = method
+        self.code = prepare(clazz, attribute)
+
+    def __repr__(self):
+        return f"BytecodeMethod({self.clazz.this_class}.{self.method.name}{self.method.descriptor})"
+
+    # Called with a fresh list of the argument slots, which is extended into the locals
+    def __call__(self, vm, arguments):
+        code = self.code
+        arguments += [None] * (code.max_locals - len(arguments))
+        return execute(Frame(vm, self.clazz, code, arguments, [None] * code.max_stack))
@@ -0,0 +1,307 @@
+from decimal import Decimal
+from math import isinf, isnan
+
+from objects.classes import ArrayInstance, ClassInstance
+from objects.runtime import JavaException
+from runtime.opcodes import float32
+
+
+# --------------------------------------------------
+# BUILTIN CLASSES
+# --------------------------------------------------
+
+
+# Classes the VM provides without a class file: binary name -> (superclass, interfaces)
+builtin_classes = {
+    "java/lang/Object": (None, ()),
+    "java/lang/String": ("java/lang/Object", ("java/lang/CharSequence", "java/lang/Comparable")),
+    "java/lang/CharSequence": ("java/lang/Object", ()),
+    "java/lang/Comparable": ("java/lang/Object", ()),
+    "java/lang/StringBuilder": ("java/lang/Object", ("java/lang/CharSequence",)),
+    "java/lang/System": ("java/lang/Object", ()),
+    "java/lang/Class": ("java/lang/Object", ()),
+    "java/io/PrintStream": ("java/lang/Object", ()),
+    "java/lang/Throwable": ("java/lang/Object", ()),
+    "java/lang/Exception": ("java/lang/Throwable", ()),
+    "java/lang/Error": ("java/lang/Throwable", ()),
+    "java/lang/RuntimeException": ("java/lang/Exception", ()),
+    "java/lang/ArithmeticException": ("java/lang/RuntimeException", ()),
+    "java/lang/ArrayStoreException": ("java/lang/RuntimeException", ()),
+    "java/lang/ClassCastException": ("java/lang/RuntimeException", ()),
+    "java/lang/IllegalArgumentException": ("java/lang/RuntimeException", ()),
+    "java/lang/IllegalStateException": ("java/lang/RuntimeException", ()),
+    "java/lang/IndexOutOfBoundsException": ("java/lang/RuntimeException", ()),
+    "java/lang/ArrayIndexOutOfBoundsException": ("java/lang/IndexOutOfBoundsException", ()),
+    "java/lang/StringIndexOutOfBoundsException": ("java/lang/IndexOutOfBoundsException", ()),
+    "java/lang/NegativeArraySizeException": ("java/lang/RuntimeException", ()),
+    "java/lang/NullPointerException": ("java/lang/RuntimeException", ()),
+    "java/lang/UnsupportedOperationException": ("java/lang/RuntimeException", ()),
+    "java/lang/LinkageError": ("java/lang/Error", ()),
+    "java/lang/NoClassDefFoundError": ("java/lang/LinkageError", ()),
+    "java/lang/VerifyError": ("java/lang/LinkageError", ()),
+    "java/lang/ClassFormatError": ("java/lang/LinkageError", ()),
+    "java/lang/BootstrapMethodError": ("java/lang/LinkageError", ()),
+    "java/lang/ExceptionInInitializerError": ("java/lang/LinkageError", ()),
+    "java/lang/IncompatibleClassChangeError": ("java/lang/LinkageError", ()),
+    "java/lang/NoSuchFieldError": ("java/lang/IncompatibleClassChangeError", ()),
+    "java/lang/NoSuchMethodError": ("java/lang/IncompatibleClassChangeError", ()),
+    "java/lang/AbstractMethodError": ("java/lang/IncompatibleClassChangeError", ()),
+    "java/lang/UnsatisfiedLinkError": ("java/lang/LinkageError", ()),
+    "java/lang/VirtualMachineError": ("java/lang/Error", ()),
+    "java/lang/StackOverflowError": ("java/lang/VirtualMachineError", ()),
+}
+
+# Instance fields of builtin classes, in slot order after those of the superclass; only natives use
+# them. Binary name -> (name, ...)
+builtin_fields = {
+    "java/lang/Throwable": ("message", "cause"),
+    "java/lang/StringBuilder": ("value",),
+    "java/io/PrintStream": ("fd",),
+    "java/lang/Class": ("name",),
+}
+
+# Their slots
+THROWABLE_MESSAGE = 0
+THROWABLE_CAUSE = 1
+STRING_BUILDER_VALUE = 0
+PRINT_STREAM_FD = 0
+CLASS_NAME = 0
+
+# Methods of the builtin interfaces: binary name -> ((name, descriptor), ...)
+builtin_interfaces = {
+    "java/lang/CharSequence": (("length", "()I"), ("charAt", "(I)C"), ("toString", "()Ljava/lang/String;")),
+    "java/lang/Comparable": (("compareTo", "(Ljava/lang/Object;)I"),),
+}
+
+
+# --------------------------------------------------
+# NATIVE METHODS
+# --------------------------------------------------
+
+
+# (class, name, descriptor) -> callable(vm, arguments). Natives are called like bytecode methods,
+# with the receiver (if any) and the argument slots, including the unused second slot of longs
+# and doubles.
+natives = dict[tuple[str, str, str], callable]()
+# Natives implementing static methods; the rest are instance methods
+static_natives = set[tuple[str, str, str]]()
+
+
+def native(class_name, name, *descriptors, static=False):
+    def decorator(func):
+        for descriptor in descriptors:
+            natives[(class_name, name, descriptor)] = func
+            if static:
+                static_natives.add((class_name, name, descriptor))
+        return func
+
+    return decorator
+
+
+# Formats a value the way String.valueOf would, given its field descriptor
+def java_string(vm, value, descriptor="Ljava/lang/Object;") -> str:
+    match descriptor:
+        case "Z":
+            return "true" if value else "false"
+        case "C":
+            return chr(value)
+        case "F" | "D":
+            return java_float_string(value, descriptor == "F")
+        case _ if value is None:
+            return "null"
+        case _ if descriptor[0] in "BSIJ":
+            return str(value)
+        case _ if isinstance(value, str):
+            return value
+        case _ if isinstance(value, ClassInstance) and value.identifier == "java/lang/StringBuilder":
+            return "".join(value.fields[STRING_BUILDER_VALUE])
+        case _ if isinstance(value, ClassInstance) and vm.is_instance(value, "java/lang/Throwable"):
+            message = value.fields[THROWABLE_MESSAGE]
+            name = value.identifier.replace("/", ".")
+            return f"{name}: {message}" if message is not None else name
+        case _ if isinstance(value, ClassInstance):
+            return f"{value.identifier.replace('/', '.')}@{id(value) & 0xFFFFFFFF:x}"
+        case _ if isinstance(value, ArrayInstance):
+            return f"{value.descriptor}@{id(value) & 0xFFFFFFFF:x}"
+        case _:
+            return str(value)
+
+
+def java_float_string(value, single) -> str:
+    if isnan(value):
+        return "NaN"
+    if isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+
+    # Shortest digits that read back as the same value
+    if single:
+        for precision in range(1, 10):
+            digits = f"{value:.{precision}g}"
+            if float32(float(digits)) == value:
+                break
+        value = float(digits)
+
+    if value == 0 or 1e-3 <= abs(value) < 1e7:
+        return repr(value)
+
+    # Computerized scientific notation, e.g. 1.0E10
+    sign, digits, exponent = Decimal(repr(value)).as_tuple()
+    exponent += len(digits) - 1
+    digits = "".join(map(str, digits)).rstrip("0")
+    return f"{'-' if sign else ''}{digits[0]}.{digits[1:] or '0'}E{exponent}"
+
+
+# java/lang/Object
+
+@native("java/lang/Object", "<init>", "()V")
+def object_init(vm, arguments):
+    return None
+
+
+@native("java/lang/Object", "hashCode", "()I")
+def object_hash_code(vm, arguments):
+    return id(arguments[0]) & 0x7FFFFFFF
+
+
+@native("java/lang/Object", "equals", "(Ljava/lang/Object;)Z")
+def object_equals(vm, arguments):
+    return 1 if arguments[0] is arguments[1] else 0
+
+
+@native("java/lang/Object", "toString", "()Ljava/lang/String;")
+def object_to_string(vm, arguments):
+    return java_string(vm, arguments[0])
+
+
+# java/lang/String
+
+@native("java/lang/String", "length", "()I")
+def string_length(vm, arguments):
+    return len(arguments[0])
+
+
+@native("java/lang/String", "charAt", "(I)C")
+def string_char_at(vm, arguments):
+    string, index = arguments
+    if not 0 <= index < len(string):
+        raise JavaException(vm.new_throwable("java/lang/StringIndexOutOfBoundsException", f"index {index}, length {len(string)}"))
+    return ord(string[index])
+
+
+@native("java/lang/String", "equals", "(Ljava/lang/Object;)Z")
+def string_equals(vm, arguments):
+    return 1 if arguments[0] == arguments[1] else 0
+
+
+@native("java/lang/String", "hashCode", "()I")
+def string_hash_code(vm, arguments):
+    hash_ = 0
+    for character in arguments[0]:
+        hash_ = (31 * hash_ + ord(character)) & 0xFFFFFFFF
+    return hash_ - 0x100000000 if hash_ & 0x80000000 else hash_
+
+
+@native("java/lang/String", "toString", "()Ljava/lang/String;")
+def string_to_string(vm, arguments):
+    return arguments[0]
+
+
+def string_value_of(descriptor):
+    def value_of(vm, arguments):
+        return java_string(vm, arguments[0], descriptor)
+
+    native("java/lang/String", "valueOf", f"({descriptor})Ljava/lang/String;", static=True)(value_of)
+
+
+for value_of_descriptor in ("Ljava/lang/Object;", "I", "J", "C", "Z", "F", "D"):
+    string_value_of(value_of_descriptor)
+
+
+# java/lang/StringBuilder
+
+@native("java/lang/StringBuilder", "<init>", "()V")
+def string_builder_init(vm, arguments):
+    arguments[0].fields[STRING_BUILDER_VALUE] = list()
+
+
+@native("java/lang/StringBuilder", "<init>", "(Ljava/lang/String;)V")
+def string_builder_init_string(vm, arguments):
+    arguments[0].fields[STRING_BUILDER_VALUE] = [arguments[1]]
+
+
+def string_builder_append(descriptor):
+    def append(vm, arguments):
+        builder = arguments[0]
+        builder.fields[STRING_BUILDER_VALUE].append(java_string(vm, arguments[1], descriptor))
+        return builder
+
+    native("java/lang/StringBuilder", "append", f"({descriptor})Ljava/lang/StringBuilder;")(append)
+
+
+for append_descriptor in ("Ljava/lang/String;", "Ljava/lang/Object;", "Ljava/lang/CharSequence;", "I", "J", "C", "Z", "F", "D"):
+    string_builder_append(append_descriptor)
+
+
+@native("java/lang/StringBuilder", "length", "()I")
+def string_builder_length(vm, arguments):
+    return sum(map(len, arguments[0].fields[STRING_BUILDER_VALUE]))
+
+
+@native("java/lang/StringBuilder", "toString", "()Ljava/lang/String;")
+def string_builder_to_string(vm, arguments):
+    return "".join(arguments[0].fields[STRING_BUILDER_VALUE])
+
+
+# java/io/PrintStream
+
+def print_stream(descriptor, newline):
+    def write(vm, arguments):
+        stream = vm.stdout if arguments[0].fields[PRINT_STREAM_FD] == 1 else vm.stderr
+        text = java_string(vm, arguments[1], descriptor) if descriptor else ""
+        stream.write(text + "\n" if newline else text)
+
+    name = "println" if newline else "print"
+    native("java/io/PrintStream", name, f"({descriptor})V")(write)
+
+
+print_stream("", True)
+for print_descriptor in ("Ljava/lang/String;", "Ljava/lang/Object;", "I", "J", "C", "Z", "F", "D"):
+    print_stream(print_descriptor, True)
+    print_stream(print_descriptor, False)
+
+
+# java/lang/Throwable
+
+@native("java/lang/Throwable", "<init>", "()V")
+def throwable_init(vm, arguments):
+    arguments[0].fields[THROWABLE_MESSAGE] = None
+
+
+@native("java/lang/Throwable", "<init>", "(Ljava/lang/String;)V")
+def throwable_init_message(vm, arguments):
+    arguments[0].fields[THROWABLE_MESSAGE] = arguments[1]
+
+
+@native("java/lang/Throwable", "getMessage", "()Ljava/lang/String;")
+def throwable_get_message(vm, arguments):
+    return arguments[0].fields[THROWABLE_MESSAGE]
+
+
+@native("java/lang/Throwable", "toString", "()Ljava/lang/String;")
+def throwable_to_string(vm, arguments):
+    return java_string(vm, arguments[0])
+
+
+# --------------------------------------------------
+# NATIVE STATIC FIELDS
+# --------------------------------------------------
+
+
+# Static fields of builtin classes for a new VM: class -> {field: value}
+def builtin_statics() -> dict[str, dict[str, any]]:
+    return {
+        "java/lang/System": {
+            "out": ClassInstance("java/io/PrintStream", [1]),
+            "err": ClassInstance("java/io/PrintStream", [2])
+        }
+    }
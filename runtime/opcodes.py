@@ -1,4 +1,8 @@
 from dataclasses import dataclass
+from math import copysign, fmod, inf, isnan, nan
+from struct import Struct
+
+from objects.runtime import JavaException
 
 
 # --------------------------------------------------
@@ -6,33 +10,132 @@ from dataclasses import dataclass
 # --------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Opcode:
     func_ref: callable
     param_count: int
+    # Decodes the operand bytes following the opcode
+    operand_layout: Struct
+    # Operand is a branch offset, decoded to an absolute pc
+    branch: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedOpcode:
     func_ref: callable
+    # Decoded operands: constant pool indices, sign-extended immediates and absolute branch targets
     params: tuple[any, ...]
 
 
 opcodes = {}
 
 
-def opcode(code, param_bytes=0):
-    def decorator(func):
-        opcodes[code] = Opcode(func, param_bytes)
+# Handler of opcodes no prepared method can contain (see REJECTED_OPCODES in runtime/interpreter.py)
+def illegal(frame, arg, index):
+    throw(frame, "java/lang/VerifyError", f"illegal opcode at instruction {index}")
+
 
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+# Flat dispatch table indexed by opcode byte. Every handler is called as handler(frame, arg, index),
+# where `arg` is the instruction's prepared argument (see runtime/interpreter.py) and `index` its
+# instruction index, and returns the index of the next instruction, or -1 to return from the method.
+handlers = [illegal] * 256
 
-        return wrapper
+
+# `operands` is a struct format for the operand bytes; unsigned bytes by default
+def opcode(code, param_bytes=0, operands=None, branch=False):
+    def decorator(func):
+        operand_layout = Struct(">" + (operands if operands is not None else "B" * param_bytes))
+        opcodes[code] = Opcode(func, param_bytes, operand_layout, branch)
+        handlers[code] = func
+
+        # Registered unwrapped so parsed code can be pickled by reference
+        return func
 
     return decorator
 
 
+# --------------------------------------------------
+# ARITHMETIC HELPERS
+# --------------------------------------------------
+
+
+FLOAT32 = Struct("f")
+
+
+def int32(value) -> int:
+    return ((value + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+
+def int64(value) -> int:
+    return ((value + 0x8000000000000000) & 0xFFFFFFFFFFFFFFFF) - 0x8000000000000000
+
+
+def float32(value) -> float:
+    return FLOAT32.unpack(FLOAT32.pack(value))[0]
+
+
+def java_div(a, b) -> int:
+    # Java rounds toward zero; callers check for division by zero
+    quotient = a // b
+    if quotient < 0 and quotient * b != a:
+        quotient += 1
+    return quotient
+
+
+def java_fdiv(a, b) -> float:
+    try:
+        return a / b
+    except ZeroDivisionError:
+        if a == 0 or isnan(a):
+            return nan
+        return copysign(inf, a) * copysign(1, b)
+
+
+def java_frem(a, b) -> float:
+    try:
+        return fmod(a, b)
+    except ValueError:
+        return nan
+
+
+def java_f2i(value, low, high) -> int:
+    # NaN converts to 0; out of range values saturate
+    if isnan(value):
+        return 0
+    if value <= low:
+        return low
+    if value >= high:
+        return high
+    return int(value)
+
+
+def java_fcmp(a, b, nan_result) -> int:
+    if isnan(a) or isnan(b):
+        return nan_result
+    return (a > b) - (a < b)
+
+
+def throw(frame, class_name, message=None):
+    raise JavaException(frame.vm.new_throwable(class_name, message))
+
+
+def array_access_error(frame, array, i):
+    # Array loads and stores check the array and index before touching either
+    if array is None:
+        throw(frame, "java/lang/NullPointerException")
+    throw(frame, "java/lang/ArrayIndexOutOfBoundsException", f"Index {i} out of bounds for length {len(array)}")
+
+
+def quicken(frame, index, quick, arg) -> int:
+    # Rewrites a resolved instruction into its quick form and argument, then executes it. The argument
+    # is written first and only ever extends the original one, so a VM sharing the code and still
+    # running the original handler reads an argument it understands.
+    code = frame.code
+    code.args[index] = arg
+    code.opcodes[index] = quick
+    return handlers[quick](frame, arg, index)
+
+
 # --------------------------------------------------
 # OPCODES
 # Ordered by JVM spec; automatically sorted by decimal representation of opcode byte when inserted to dict
@@ -40,1028 +143,1934 @@ def opcode(code, param_bytes=0):
 
 
 @opcode(50)
-def aaload():
-    pass
+def aaload(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    array = stack[sp - 1]
+    i = stack[sp]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    stack[sp - 1] = array[i]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(83)
-def aastore():
-    pass
+def aastore(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    array = stack[sp]
+    i = stack[sp + 1]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+
+    # The value must be assignable to the component type the array was created with (JVMS §6.5)
+    value = stack[sp + 2]
+    descriptor = array.descriptor
+    if value is not None and descriptor != "[Ljava/lang/Object;":
+        component = descriptor[1:] if descriptor[1] == "[" else descriptor[2:-1]
+        if not frame.vm.is_instance(value, component):
+            throw(frame, "java/lang/ArrayStoreException", frame.vm.class_name_of(value).replace("/", "."))
+
+    array[i] = value
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(1)
-def aconst_null():
-    pass
+def aconst_null(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = None
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(25, 1)
-def aload():
-    pass
+def aload(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[arg]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(42)
-def aload_0():
-    pass
+def aload_0(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[0]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(43)
-def aload_1():
-    pass
+def aload_1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[1]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(44)
-def aload_2():
-    pass
+def aload_2(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[2]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(45)
-def aload_3():
-    pass
+def aload_3(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[3]
+    frame.sp = sp + 1
+    return index + 1
 
 
-@opcode(189, 2)
-def anewarray():
-    pass
+@opcode(189, 2, "H")
+def anewarray(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp] = frame.vm.new_array(arg, stack[sp])
+    return index + 1
 
 
 @opcode(176)
-def areturn():
-    pass
+def areturn(frame, arg, index):
+    frame.result = frame.stack[frame.sp - 1]
+    return -1
 
 
 @opcode(190)
-def arraylength():
-    pass
+def arraylength(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    array = stack[sp]
+    if array is None:
+        throw(frame, "java/lang/NullPointerException")
+    stack[sp] = len(array)
+    return index + 1
 
 
 @opcode(58, 1)
-def astore():
-    pass
+def astore(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[arg] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(75)
-def astore_0():
-    pass
+def astore_0(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[0] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(76)
-def astore_1():
-    pass
+def astore_1(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[1] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(77)
-def astore_2():
-    pass
+def astore_2(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[2] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(78)
-def astore_3():
-    pass
+def astore_3(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[3] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(191)
-def athrow():
-    pass
+def athrow(frame, arg, index):
+    instance = frame.stack[frame.sp - 1]
+    if instance is None:
+        throw(frame, "java/lang/NullPointerException")
+    raise JavaException(instance)
 
 
 @opcode(51)
-def baload():
-    pass
+def baload(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    array = stack[sp - 1]
+    i = stack[sp]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    stack[sp - 1] = array[i]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(84)
-def bastore():
-    pass
-
-
-@opcode(16, 1)
-def bipush():
-    pass
+def bastore(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    array = stack[sp]
+    i = stack[sp + 1]
+    value = stack[sp + 2]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    # Shared by byte and boolean arrays
+    array[i] = value & 1 if array.descriptor == "[Z" else ((value + 0x80) & 0xFF) - 0x80
+    frame.sp = sp
+    return index + 1
+
+
+@opcode(16, 1, "b")
+def bipush(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = arg
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(52)
-def caload():
-    pass
+def caload(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    array = stack[sp - 1]
+    i = stack[sp]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    stack[sp - 1] = array[i]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(85)
-def castore():
-    pass
-
-
-@opcode(192, 2)
-def checkcast():
-    pass
+def castore(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    array = stack[sp]
+    i = stack[sp + 1]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    array[i] = stack[sp + 2] & 0xFFFF
+    frame.sp = sp
+    return index + 1
+
+
+@opcode(192, 2, "H")
+def checkcast(frame, arg, index):
+    instance = frame.stack[frame.sp - 1]
+    if instance is not None and not frame.vm.is_instance(instance, arg):
+        throw(frame, "java/lang/ClassCastException", f"{frame.vm.class_name_of(instance)} cannot be cast to {arg}")
+    return index + 1
 
 
 @opcode(144)
-def d2f():
-    pass
+def d2f(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = float32(stack[sp - 1])
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(142)
-def d2i():
-    pass
+def d2i(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = java_f2i(stack[sp - 1], -0x80000000, 0x7FFFFFFF)
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(143)
-def d2l():
-    pass
+def d2l(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp] = java_f2i(stack[sp], -0x8000000000000000, 0x7FFFFFFFFFFFFFFF)
+    return index + 1
 
 
 @opcode(99)
-def dadd():
-    pass
+def dadd(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] += stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(49)
-def daload():
-    pass
+def daload(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    array = stack[sp - 2]
+    i = stack[sp - 1]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    stack[sp - 2] = array[i]
+    return index + 1
 
 
 @opcode(82)
-def dastore():
-    pass
+def dastore(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 4
+    array = stack[sp]
+    i = stack[sp + 1]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    array[i] = stack[sp + 2]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(152)
-def dcmpg():
-    pass
+def dcmpg(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    stack[sp - 1] = java_fcmp(stack[sp - 1], stack[sp + 1], 1)
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(151)
-def dcmpl():
-    pass
+def dcmpl(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    stack[sp - 1] = java_fcmp(stack[sp - 1], stack[sp + 1], -1)
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(14)
-def dconst_0():
-    pass
+def dconst_0(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 0.0
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(15)
-def dconst_1():
-    pass
+def dconst_1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 1.0
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(111)
-def ddiv():
-    pass
+def ddiv(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] = java_fdiv(stack[sp - 2], stack[sp])
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(24, 1)
-def dload():
-    pass
+def dload(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[arg]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(38)
-def dload_0():
-    pass
+def dload_0(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[0]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(39)
-def dload_1():
-    pass
+def dload_1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[1]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(40)
-def dload_2():
-    pass
+def dload_2(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[2]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(41)
-def dload_3():
-    pass
+def dload_3(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[3]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(107)
-def dmul():
-    pass
+def dmul(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] *= stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(119)
-def dneg():
-    pass
+def dneg(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp] = -stack[sp]
+    return index + 1
 
 
 @opcode(115)
-def drem():
-    pass
+def drem(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] = java_frem(stack[sp - 2], stack[sp])
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(175)
-def dreturn():
-    pass
+def dreturn(frame, arg, index):
+    frame.result = frame.stack[frame.sp - 2]
+    return -1
 
 
 @opcode(57, 1)
-def dstore():
-    pass
+def dstore(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[arg] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(71)
-def dstore_0():
-    pass
+def dstore_0(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[0] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(72)
-def dstore_1():
-    pass
+def dstore_1(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[1] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(73)
-def dstore_2():
-    pass
+def dstore_2(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[2] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(74)
-def dstore_3():
-    pass
+def dstore_3(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[3] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(103)
-def dsub():
-    pass
+def dsub(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] -= stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(89)
-def dup():
-    pass
+def dup(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    stack[sp] = stack[sp - 1]
+    frame.sp = sp + 1
+    return index + 1
+
+
+# The stack manipulation instructions rewrite the affected window in place; a slice assignment of
+# equal length never resizes the list
 
 
 @opcode(90)
-def dup_x1():
-    pass
+def dup_x1(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    stack[sp - 2:sp + 1] = stack[sp - 1], stack[sp - 2], stack[sp - 1]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(91)
-def dup_x2():
-    pass
+def dup_x2(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    stack[sp - 3:sp + 1] = stack[sp - 1], stack[sp - 3], stack[sp - 2], stack[sp - 1]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(92)
-def dup2():
-    pass
+def dup2(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    stack[sp:sp + 2] = stack[sp - 2:sp]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(93)
-def dup2_x1():
-    pass
+def dup2_x1(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    stack[sp - 3:sp + 2] = stack[sp - 2], stack[sp - 1], stack[sp - 3], stack[sp - 2], stack[sp - 1]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(94)
-def dup2_x2():
-    pass
+def dup2_x2(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    stack[sp - 4:sp + 2] = stack[sp - 2], stack[sp - 1], stack[sp - 4], stack[sp - 3], stack[sp - 2], stack[sp - 1]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(141)
-def f2d():
-    pass
+def f2d(frame, arg, index):
+    frame.sp += 1
+    return index + 1
 
 
 @opcode(139)
-def f2i():
-    pass
+def f2i(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp] = java_f2i(stack[sp], -0x80000000, 0x7FFFFFFF)
+    return index + 1
 
 
 @opcode(140)
-def f2l():
-    pass
+def f2l(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    stack[sp - 1] = java_f2i(stack[sp - 1], -0x8000000000000000, 0x7FFFFFFFFFFFFFFF)
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(98)
-def fadd():
-    pass
+def fadd(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = float32(stack[sp - 1] + stack[sp])
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(48)
-def faload():
-    pass
+def faload(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    array = stack[sp - 1]
+    i = stack[sp]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    stack[sp - 1] = array[i]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(81)
-def fastore():
-    pass
+def fastore(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    array = stack[sp]
+    i = stack[sp + 1]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    array[i] = stack[sp + 2]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(150)
-def fcmpg():
-    pass
+def fcmpg(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = java_fcmp(stack[sp - 1], stack[sp], 1)
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(149)
-def fcmpl():
-    pass
+def fcmpl(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = java_fcmp(stack[sp - 1], stack[sp], -1)
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(11)
-def fconst_0():
-    pass
+def fconst_0(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 0.0
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(12)
-def fconst_1():
-    pass
+def fconst_1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 1.0
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(13)
-def fconst_2():
-    pass
+def fconst_2(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 2.0
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(110)
-def fdiv():
-    pass
+def fdiv(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = float32(java_fdiv(stack[sp - 1], stack[sp]))
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(23, 1)
-def fload():
-    pass
+def fload(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[arg]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(34)
-def fload_0():
-    pass
+def fload_0(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[0]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(35)
-def fload_1():
-    pass
+def fload_1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[1]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(36)
-def fload_2():
-    pass
+def fload_2(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[2]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(37)
-def fload_3():
-    pass
+def fload_3(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[3]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(106)
-def fmul():
-    pass
+def fmul(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = float32(stack[sp - 1] * stack[sp])
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(118)
-def fneg():
-    pass
+def fneg(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp] = -stack[sp]
+    return index + 1
 
 
 @opcode(114)
-def frem():
-    pass
+def frem(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = float32(java_frem(stack[sp - 1], stack[sp]))
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(174)
-def freturn():
-    pass
+def freturn(frame, arg, index):
+    frame.result = frame.stack[frame.sp - 1]
+    return -1
 
 
 @opcode(56, 1)
-def fstore():
-    pass
+def fstore(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[arg] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(67)
-def fstore_0():
-    pass
+def fstore_0(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[0] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(68)
-def fstore_1():
-    pass
+def fstore_1(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[1] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(69)
-def fstore_2():
-    pass
+def fstore_2(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[2] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(70)
-def fstore_3():
-    pass
+def fstore_3(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[3] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(102)
-def fsub():
-    pass
+def fsub(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = float32(stack[sp - 1] - stack[sp])
+    frame.sp = sp
+    return index + 1
 
 
-@opcode(180, 2)
-def getfield():
-    pass
+# arg: (class name, field name, category); once quickened, followed by the field's slot
+@opcode(180, 2, "H")
+def getfield(frame, arg, index):
+    slot = frame.vm.field_slot(arg[0], arg[1])
+    return quicken(frame, index, GETFIELD_QUICK[arg[2]], (*arg[:3], slot))
 
 
-@opcode(178, 2)
-def getstatic():
-    pass
+# arg: (class name, field name, category); once quickened, followed by the declaring class and the
+# field's slot in its static storage
+@opcode(178, 2, "H")
+def getstatic(frame, arg, index):
+    owner, slot = frame.vm.static_field(arg[0], arg[1])
+    return quicken(frame, index, GETSTATIC_QUICK[arg[2]], (*arg[:3], owner, slot))
 
 
-@opcode(167, 2)
-def goto():
-    pass
+@opcode(167, 2, "h", branch=True)
+def goto(frame, arg, index):
+    return arg
 
 
-@opcode(200, 4)
-def goto_w():
-    pass
+@opcode(200, 4, "i", branch=True)
+def goto_w(frame, arg, index):
+    return arg
 
 
 @opcode(145)
-def i2b():
-    pass
+def i2b(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp] = ((stack[sp] + 0x80) & 0xFF) - 0x80
+    return index + 1
 
 
-@opcode(145)
-def i2c():
-    pass
+@opcode(146)
+def i2c(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp] &= 0xFFFF
+    return index + 1
 
 
 @opcode(135)
-def i2d():
-    pass
+def i2d(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    stack[sp - 1] = float(stack[sp - 1])
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(134)
-def i2f():
-    pass
+def i2f(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp] = float32(stack[sp])
+    return index + 1
 
 
 @opcode(133)
-def i2l():
-    pass
+def i2l(frame, arg, index):
+    frame.sp += 1
+    return index + 1
 
 
 @opcode(147)
-def i2s():
-    pass
+def i2s(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp] = ((stack[sp] + 0x8000) & 0xFFFF) - 0x8000
+    return index + 1
 
 
 @opcode(96)
-def iadd():
-    pass
+def iadd(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = ((stack[sp - 1] + stack[sp] + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(46)
-def iaload():
-    pass
+def iaload(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    array = stack[sp - 1]
+    i = stack[sp]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    stack[sp - 1] = array[i]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(126)
-def iand():
-    pass
+def iand(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] &= stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(79)
-def iastore():
-    pass
+def iastore(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    array = stack[sp]
+    i = stack[sp + 1]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    array[i] = stack[sp + 2]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(2)
-def iconst_m1():
-    pass
+def iconst_m1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = -1
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(3)
-def iconst_0():
-    pass
+def iconst_0(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 0
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(4)
-def iconst_1():
-    pass
+def iconst_1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 1
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(5)
-def iconst_2():
-    pass
+def iconst_2(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 2
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(6)
-def iconst_3():
-    pass
+def iconst_3(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 3
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(7)
-def iconst_4():
-    pass
+def iconst_4(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 4
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(8)
-def iconst_5():
-    pass
+def iconst_5(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 5
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(108)
-def idiv():
-    pass
+def idiv(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    b = stack[sp]
+    if b == 0:
+        throw(frame, "java/lang/ArithmeticException", "/ by zero")
+    stack[sp - 1] = int32(java_div(stack[sp - 1], b))
+    frame.sp = sp
+    return index + 1
 
 
-@opcode(165, 2)
-def if_acmpeq():
-    pass
+@opcode(165, 2, "h", branch=True)
+def if_acmpeq(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    frame.sp = sp
+    return arg if stack[sp] is stack[sp + 1] else index + 1
 
 
-@opcode(166, 2)
-def if_acmpne():
-    pass
+@opcode(166, 2, "h", branch=True)
+def if_acmpne(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    frame.sp = sp
+    return arg if stack[sp] is not stack[sp + 1] else index + 1
 
 
-@opcode(159, 2)
-def if_icmpeq():
-    pass
+@opcode(159, 2, "h", branch=True)
+def if_icmpeq(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    frame.sp = sp
+    return arg if stack[sp] == stack[sp + 1] else index + 1
 
 
-@opcode(160, 2)
-def if_icmpne():
-    pass
+@opcode(160, 2, "h", branch=True)
+def if_icmpne(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    frame.sp = sp
+    return arg if stack[sp] != stack[sp + 1] else index + 1
 
 
-@opcode(161, 2)
-def if_icmplt():
-    pass
+@opcode(161, 2, "h", branch=True)
+def if_icmplt(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    frame.sp = sp
+    return arg if stack[sp] < stack[sp + 1] else index + 1
 
 
-@opcode(162, 2)
-def if_icmpge():
-    pass
+@opcode(162, 2, "h", branch=True)
+def if_icmpge(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    frame.sp = sp
+    return arg if stack[sp] >= stack[sp + 1] else index + 1
 
 
-@opcode(163, 2)
-def if_icmpgt():
-    pass
+@opcode(163, 2, "h", branch=True)
+def if_icmpgt(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    frame.sp = sp
+    return arg if stack[sp] > stack[sp + 1] else index + 1
 
 
-@opcode(164, 2)
-def if_icmple():
-    pass
+@opcode(164, 2, "h", branch=True)
+def if_icmple(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    frame.sp = sp
+    return arg if stack[sp] <= stack[sp + 1] else index + 1
 
 
-@opcode(153, 2)
-def ifeq():
-    pass
+@opcode(153, 2, "h", branch=True)
+def ifeq(frame, arg, index):
+    sp = frame.sp - 1
+    frame.sp = sp
+    return arg if frame.stack[sp] == 0 else index + 1
 
 
-@opcode(154, 2)
-def ifne():
-    pass
+@opcode(154, 2, "h", branch=True)
+def ifne(frame, arg, index):
+    sp = frame.sp - 1
+    frame.sp = sp
+    return arg if frame.stack[sp] != 0 else index + 1
 
 
-@opcode(155, 2)
-def iflt():
-    pass
+@opcode(155, 2, "h", branch=True)
+def iflt(frame, arg, index):
+    sp = frame.sp - 1
+    frame.sp = sp
+    return arg if frame.stack[sp] < 0 else index + 1
 
 
-@opcode(156, 2)
-def ifge():
-    pass
+@opcode(156, 2, "h", branch=True)
+def ifge(frame, arg, index):
+    sp = frame.sp - 1
+    frame.sp = sp
+    return arg if frame.stack[sp] >= 0 else index + 1
 
 
-@opcode(157, 2)
-def ifgt():
-    pass
+@opcode(157, 2, "h", branch=True)
+def ifgt(frame, arg, index):
+    sp = frame.sp - 1
+    frame.sp = sp
+    return arg if frame.stack[sp] > 0 else index + 1
 
 
-@opcode(158, 2)
-def ifle():
-    pass
+@opcode(158, 2, "h", branch=True)
+def ifle(frame, arg, index):
+    sp = frame.sp - 1
+    frame.sp = sp
+    return arg if frame.stack[sp] <= 0 else index + 1
 
 
-@opcode(199, 2)
-def ifnonnull():
-    pass
+@opcode(199, 2, "h", branch=True)
+def ifnonnull(frame, arg, index):
+    sp = frame.sp - 1
+    frame.sp = sp
+    return arg if frame.stack[sp] is not None else index + 1
 
 
-@opcode(198, 2)
-def ifnull():
-    pass
+@opcode(198, 2, "h", branch=True)
+def ifnull(frame, arg, index):
+    sp = frame.sp - 1
+    frame.sp = sp
+    return arg if frame.stack[sp] is None else index + 1
 
 
-@opcode(132, 2)
-def iinc():
-    pass
+# arg: (local, increment)
+@opcode(132, 2, "Bb")
+def iinc(frame, arg, index):
+    locals_ = frame.locals
+    local, increment = arg
+    locals_[local] = ((locals_[local] + increment + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+    return index + 1
 
 
 @opcode(21, 1)
-def iload():
-    pass
+def iload(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[arg]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(26)
-def iload_0():
-    pass
+def iload_0(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[0]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(27)
-def iload_1():
-    pass
+def iload_1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[1]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(28)
-def iload_2():
-    pass
+def iload_2(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[2]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(29)
-def iload_3():
-    pass
+def iload_3(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[3]
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(104)
-def imul():
-    pass
+def imul(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = ((stack[sp - 1] * stack[sp] + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(116)
-def ineg():
-    pass
-
-
-@opcode(193, 2)
-def instanceof():
-    pass
-
-
-@opcode(186, 4)
-def invokedynamic():
-    pass
-
-
-@opcode(185, 4)
-def invokeinterface():
-    pass
-
-
-@opcode(183, 2)
-def invokespecial():
-    pass
-
-
-@opcode(184, 2)
-def invokestatic():
-    pass
-
-
-@opcode(182, 2)
-def invokevirtual():
-    pass
+def ineg(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp] = ((0x80000000 - stack[sp]) & 0xFFFFFFFF) - 0x80000000
+    return index + 1
+
+
+@opcode(193, 2, "H")
+def instanceof(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    instance = stack[sp]
+    stack[sp] = 1 if instance is not None and frame.vm.is_instance(instance, arg) else 0
+    return index + 1
+
+
+# arg: (call site name, descriptor). No bootstrap method can run here, so call sites never link.
+@opcode(186, 4, "Hxx")
+def invokedynamic(frame, arg, index):
+    throw(frame, "java/lang/BootstrapMethodError", f"call site {arg[0]}{arg[1]} cannot be linked: invokedynamic is not supported")
+
+
+# arg for all invocations: ((class name, method name, descriptor), argument slots, return category).
+# The argument slots are copied off the operand stack and become the start of the callee's locals.
+@opcode(185, 4, "HBx")
+def invokeinterface(frame, arg, index):
+    stack = frame.stack
+    key, slots, category = arg
+    sp = frame.sp - slots
+    arguments = stack[sp:sp + slots]
+
+    receiver = arguments[0]
+    if receiver is None:
+        throw(frame, "java/lang/NullPointerException")
+
+    vm = frame.vm
+    stack[sp] = vm.dispatch_interface(receiver, key)(vm, arguments)
+    frame.sp = sp + category
+    return index + 1
+
+
+@opcode(183, 2, "H")
+def invokespecial(frame, arg, index):
+    stack = frame.stack
+    key, slots, category = arg
+    sp = frame.sp - slots
+    arguments = stack[sp:sp + slots]
+
+    if arguments[0] is None:
+        throw(frame, "java/lang/NullPointerException")
+
+    vm = frame.vm
+    stack[sp] = vm.resolve_method(key)(vm, arguments)
+    frame.sp = sp + category
+    return index + 1
+
+
+@opcode(184, 2, "H")
+def invokestatic(frame, arg, index):
+    stack = frame.stack
+    key, slots, category = arg
+    sp = frame.sp - slots
+
+    vm = frame.vm
+    result = vm.resolve_static(key)(vm, stack[sp:sp + slots])
+    if category:
+        stack[sp] = result
+    frame.sp = sp + category
+    return index + 1
+
+
+@opcode(182, 2, "H")
+def invokevirtual(frame, arg, index):
+    stack = frame.stack
+    key, slots, category = arg
+    sp = frame.sp - slots
+    arguments = stack[sp:sp + slots]
+
+    receiver = arguments[0]
+    if receiver is None:
+        throw(frame, "java/lang/NullPointerException")
+
+    vm = frame.vm
+    stack[sp] = vm.dispatch_virtual(receiver, key)(vm, arguments)
+    frame.sp = sp + category
+    return index + 1
 
 
 @opcode(128)
-def ior():
-    pass
+def ior(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] |= stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(112)
-def irem():
-    pass
+def irem(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    a = stack[sp - 1]
+    b = stack[sp]
+    if b == 0:
+        throw(frame, "java/lang/ArithmeticException", "/ by zero")
+    stack[sp - 1] = a - b * java_div(a, b)
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(172)
-def ireturn():
-    pass
+def ireturn(frame, arg, index):
+    frame.result = frame.stack[frame.sp - 1]
+    return -1
 
 
 @opcode(120)
-def ishl():
-    pass
+def ishl(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = int32(stack[sp - 1] << (stack[sp] & 31))
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(122)
-def ishr():
-    pass
+def ishr(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] >>= stack[sp] & 31
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(54, 1)
-def istore():
-    pass
+def istore(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[arg] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(59)
-def istore_0():
-    pass
+def istore_0(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[0] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(60)
-def istore_1():
-    pass
+def istore_1(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[1] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(61)
-def istore_2():
-    pass
+def istore_2(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[2] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(62)
-def istore_3():
-    pass
+def istore_3(frame, arg, index):
+    sp = frame.sp - 1
+    frame.locals[3] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(100)
-def isub():
-    pass
+def isub(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = ((stack[sp - 1] - stack[sp] + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(124)
-def iushr():
-    pass
+def iushr(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = int32((stack[sp - 1] & 0xFFFFFFFF) >> (stack[sp] & 31))
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(130)
-def ixor():
-    pass
+def ixor(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] ^= stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
-@opcode(168, 2)
-def jsr():
-    pass
+# Not allowed in version 50+ class files; rejected when methods are prepared
+@opcode(168, 2, "h", branch=True)
+def jsr(frame, arg, index):
+    return illegal(frame, arg, index)
 
 
-@opcode(201, 4)
-def jsr_w():
-    pass
+@opcode(201, 4, "i", branch=True)
+def jsr_w(frame, arg, index):
+    return illegal(frame, arg, index)
 
 
 @opcode(138)
-def l2d():
-    pass
+def l2d(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp] = float(stack[sp])
+    return index + 1
 
 
 @opcode(137)
-def l2f():
-    pass
+def l2f(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = float32(stack[sp - 1])
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(136)
-def l2i():
-    pass
+def l2i(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 1] = int32(stack[sp - 1])
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(97)
-def ladd():
-    pass
+def ladd(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] = ((stack[sp - 2] + stack[sp] + 0x8000000000000000) & 0xFFFFFFFFFFFFFFFF) - 0x8000000000000000
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(47)
-def laload():
-    pass
+def laload(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    array = stack[sp - 2]
+    i = stack[sp - 1]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    stack[sp - 2] = array[i]
+    return index + 1
 
 
 @opcode(127)
-def land():
-    pass
+def land(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] &= stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(80)
-def lastore():
-    pass
+def lastore(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 4
+    array = stack[sp]
+    i = stack[sp + 1]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    array[i] = stack[sp + 2]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(148)
-def lcmp():
-    pass
+def lcmp(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    a = stack[sp - 1]
+    b = stack[sp + 1]
+    stack[sp - 1] = (a > b) - (a < b)
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(9)
-def lconst_0():
-    pass
+def lconst_0(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 0
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(10)
-def lconst_1():
-    pass
+def lconst_1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = 1
+    frame.sp = sp + 2
+    return index + 1
 
 
+# arg: the resolved constant
 @opcode(18, 1)
-def ldc():
-    pass
+def ldc(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = arg
+    frame.sp = sp + 1
+    return index + 1
 
 
-@opcode(19, 2)
-def ldc_w():
-    pass
+@opcode(19, 2, "H")
+def ldc_w(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = arg
+    frame.sp = sp + 1
+    return index + 1
 
 
-@opcode(20, 2)
-def ldc2_w():
-    pass
+@opcode(20, 2, "H")
+def ldc2_w(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = arg
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(109)
-def ldiv():
-    pass
+def ldiv(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    b = stack[sp]
+    if b == 0:
+        throw(frame, "java/lang/ArithmeticException", "/ by zero")
+    stack[sp - 2] = int64(java_div(stack[sp - 2], b))
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(22, 1)
-def lload():
-    pass
+def lload(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[arg]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(30)
-def lload_0():
-    pass
+def lload_0(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[0]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(31)
-def lload_1():
-    pass
+def lload_1(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[1]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(32)
-def lload_2():
-    pass
+def lload_2(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[2]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(33)
-def lload_3():
-    pass
+def lload_3(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.locals[3]
+    frame.sp = sp + 2
+    return index + 1
 
 
 @opcode(105)
-def lmul():
-    pass
+def lmul(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] = ((stack[sp - 2] * stack[sp] + 0x8000000000000000) & 0xFFFFFFFFFFFFFFFF) - 0x8000000000000000
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(117)
-def lneg():
-    pass
+def lneg(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp] = ((0x8000000000000000 - stack[sp]) & 0xFFFFFFFFFFFFFFFF) - 0x8000000000000000
+    return index + 1
 
 
 # Variable parameters handled in class_parser
+# arg: (default index, {match: index})
 @opcode(171)
-def lookupswitch():
-    pass
+def lookupswitch(frame, arg, index):
+    default, targets = arg
+    sp = frame.sp - 1
+    frame.sp = sp
+    return targets.get(frame.stack[sp], default)
 
 
 @opcode(129)
-def lor():
-    pass
+def lor(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] |= stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(113)
-def lrem():
-    pass
+def lrem(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    a = stack[sp - 2]
+    b = stack[sp]
+    if b == 0:
+        throw(frame, "java/lang/ArithmeticException", "/ by zero")
+    stack[sp - 2] = a - b * java_div(a, b)
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(173)
-def lreturn():
-    pass
+def lreturn(frame, arg, index):
+    frame.result = frame.stack[frame.sp - 2]
+    return -1
 
 
 @opcode(121)
-def lshl():
-    pass
+def lshl(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 2] = int64(stack[sp - 2] << (stack[sp] & 63))
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(123)
-def lshr():
-    pass
+def lshr(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 2] >>= stack[sp] & 63
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(55, 1)
-def lstore():
-    pass
+def lstore(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[arg] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(63)
-def lstore_0():
-    pass
+def lstore_0(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[0] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(64)
-def lstore_1():
-    pass
+def lstore_1(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[1] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(65)
-def lstore_2():
-    pass
+def lstore_2(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[2] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(66)
-def lstore_3():
-    pass
+def lstore_3(frame, arg, index):
+    sp = frame.sp - 2
+    frame.locals[3] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(101)
-def lsub():
-    pass
+def lsub(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] = ((stack[sp - 2] - stack[sp] + 0x8000000000000000) & 0xFFFFFFFFFFFFFFFF) - 0x8000000000000000
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(125)
-def lushr():
-    pass
+def lushr(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp - 2] = int64((stack[sp - 2] & 0xFFFFFFFFFFFFFFFF) >> (stack[sp] & 63))
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(131)
-def lxor():
-    pass
+def lxor(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    stack[sp - 2] ^= stack[sp]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(194)
-def monitorenter():
-    pass
+def monitorenter(frame, arg, index):
+    # Threads never share a VM, so monitors have nothing to exclude
+    sp = frame.sp - 1
+    if frame.stack[sp] is None:
+        throw(frame, "java/lang/NullPointerException")
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(195)
-def monitorexit():
-    pass
-
-
-@opcode(197, 3)
-def multianewarray():
-    pass
-
-
-@opcode(187, 2)
-def new():
-    pass
-
-
+def monitorexit(frame, arg, index):
+    sp = frame.sp - 1
+    if frame.stack[sp] is None:
+        throw(frame, "java/lang/NullPointerException")
+    frame.sp = sp
+    return index + 1
+
+
+# arg: (array descriptor, dimensions)
+@opcode(197, 3, "HB")
+def multianewarray(frame, arg, index):
+    stack = frame.stack
+    descriptor, dimensions = arg
+    sp = frame.sp - dimensions
+    stack[sp] = frame.vm.new_multi_array(descriptor, stack[sp:sp + dimensions])
+    frame.sp = sp + 1
+    return index + 1
+
+
+@opcode(187, 2, "H")
+def new(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.vm.new(arg)
+    frame.sp = sp + 1
+    return index + 1
+
+
+# arg: array descriptor
 @opcode(188, 1)
-def newarray():
-    pass
+def newarray(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    stack[sp] = frame.vm.new_array(arg, stack[sp])
+    return index + 1
 
 
 @opcode(0)
-def nop():
-    pass
+def nop(frame, arg, index):
+    return index + 1
 
 
 @opcode(87)
-def pop():
-    pass
+def pop(frame, arg, index):
+    frame.sp -= 1
+    return index + 1
 
 
 @opcode(88)
-def pop2():
-    pass
+def pop2(frame, arg, index):
+    frame.sp -= 2
+    return index + 1
 
 
-@opcode(181, 2)
-def putfield():
-    pass
+# arg: (class name, field name, category); once quickened, followed by the field's slot
+@opcode(181, 2, "H")
+def putfield(frame, arg, index):
+    slot = frame.vm.field_slot(arg[0], arg[1])
+    return quicken(frame, index, PUTFIELD_QUICK[arg[2]], (*arg[:3], slot))
 
 
-@opcode(179, 2)
-def putstatic():
-    pass
+# arg: (class name, field name, category); once quickened, followed by the declaring class and the
+# field's slot in its static storage
+@opcode(179, 2, "H")
+def putstatic(frame, arg, index):
+    owner, slot = frame.vm.static_field(arg[0], arg[1])
+    return quicken(frame, index, PUTSTATIC_QUICK[arg[2]], (*arg[:3], owner, slot))
 
 
 @opcode(169, 1)
-def ret():
-    pass
+def ret(frame, arg, index):
+    return illegal(frame, arg, index)
 
 
 @opcode(177)
-def return_():
-    pass
+def return_(frame, arg, index):
+    return -1
 
 
 @opcode(53)
-def saload():
-    pass
+def saload(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    array = stack[sp - 1]
+    i = stack[sp]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    stack[sp - 1] = array[i]
+    frame.sp = sp
+    return index + 1
 
 
 @opcode(86)
-def sastore():
-    pass
-
-
-@opcode(17, 2)
-def sipush():
-    pass
+def sastore(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    array = stack[sp]
+    i = stack[sp + 1]
+    if array is None or not 0 <= i < len(array):
+        array_access_error(frame, array, i)
+    array[i] = ((stack[sp + 2] + 0x8000) & 0xFFFF) - 0x8000
+    frame.sp = sp
+    return index + 1
+
+
+@opcode(17, 2, "h")
+def sipush(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = arg
+    frame.sp = sp + 1
+    return index + 1
 
 
 @opcode(95)
-def swap():
-    pass
+def swap(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    stack[sp - 1], stack[sp - 2] = stack[sp - 2], stack[sp - 1]
+    return index + 1
 
 
 # Variable parameters handled in class_parser
+# arg: (default index, low, high, target indices)
 @opcode(170)
-def tableswitch():
-    pass
+def tableswitch(frame, arg, index):
+    default, low, high, targets = arg
+    sp = frame.sp - 1
+    frame.sp = sp
+    key = frame.stack[sp]
+    return targets[key - low] if low <= key <= high else default
 
 
 # Variable parameters handled in class_parser
+# Folded into the modified instruction when methods are prepared
 @opcode(196, 3)
-def wide():
-    pass
+def wide(frame, arg, index):
+    return illegal(frame, arg, index)
 
 
+# Reserved opcodes (JVMS §6.2); rejected when methods are prepared
 @opcode(202)
-def breakpoint_():
-    pass
+def breakpoint_(frame, arg, index):
+    return illegal(frame, arg, index)
 
 
 @opcode(254)
-def impdep1():
-    pass
+def impdep1(frame, arg, index):
+    return illegal(frame, arg, index)
 
 
 @opcode(255)
-def impdep2():
-    pass
+def impdep2(frame, arg, index):
+    return illegal(frame, arg, index)
+
+
+# --------------------------------------------------
+# QUICK OPCODES
+# Resolved forms of instructions, in the free opcode bytes above breakpoint. Only the handlers are
+# registered, so class files using these bytes are still rejected by the parser.
+# --------------------------------------------------
+
+
+def quick(code):
+    def decorator(func):
+        handlers[code] = func
+        return func
+
+    return decorator
+
+
+# Loads a constant of a kind the VM has no objects for (MethodHandle, MethodType); arg: its kind
+LDC_UNSUPPORTED = 211
+# Loads the Class object of a class, which belongs to each VM; arg: the binary name
+LDC_CLASS = 212
+
+
+# Quick opcode by field category
+GETFIELD_QUICK = (None, 203, 204)
+PUTFIELD_QUICK = (None, 205, 206)
+GETSTATIC_QUICK = (None, 207, 208)
+PUTSTATIC_QUICK = (None, 209, 210)
+
+
+# Instance fields are indexed by the slot resolved into the argument
+@quick(203)
+def getfield_quick(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 1
+    instance = stack[sp]
+    if instance is None:
+        throw(frame, "java/lang/NullPointerException")
+    stack[sp] = instance.fields[arg[3]]
+    return index + 1
+
+
+@quick(204)
+def getfield2_quick(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp
+    instance = stack[sp - 1]
+    if instance is None:
+        throw(frame, "java/lang/NullPointerException")
+    stack[sp - 1] = instance.fields[arg[3]]
+    frame.sp = sp + 1
+    return index + 1
+
+
+@quick(205)
+def putfield_quick(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 2
+    instance = stack[sp]
+    if instance is None:
+        throw(frame, "java/lang/NullPointerException")
+    instance.fields[arg[3]] = stack[sp + 1]
+    frame.sp = sp
+    return index + 1
+
+
+@quick(206)
+def putfield2_quick(frame, arg, index):
+    stack = frame.stack
+    sp = frame.sp - 3
+    instance = stack[sp]
+    if instance is None:
+        throw(frame, "java/lang/NullPointerException")
+    instance.fields[arg[3]] = stack[sp + 1]
+    frame.sp = sp
+    return index + 1
+
+
+# Static storage belongs to each VM while the code is shared, so the quick forms look the storage of
+# the declaring class up in the VM; a VM that has not initialized that class yet takes the slow path.
+@quick(207)
+def getstatic_quick(frame, arg, index):
+    vm = frame.vm
+    fields = vm.initialized_statics.get(arg[3])
+    if fields is None:
+        fields = vm.static_storage(arg)
+
+    sp = frame.sp
+    frame.stack[sp] = fields[arg[4]]
+    frame.sp = sp + 1
+    return index + 1
+
+
+@quick(208)
+def getstatic2_quick(frame, arg, index):
+    vm = frame.vm
+    fields = vm.initialized_statics.get(arg[3])
+    if fields is None:
+        fields = vm.static_storage(arg)
+
+    sp = frame.sp
+    frame.stack[sp] = fields[arg[4]]
+    frame.sp = sp + 2
+    return index + 1
+
+
+@quick(209)
+def putstatic_quick(frame, arg, index):
+    vm = frame.vm
+    fields = vm.initialized_statics.get(arg[3])
+    if fields is None:
+        fields = vm.static_storage(arg)
+
+    sp = frame.sp - 1
+    fields[arg[4]] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
+
+
+@quick(210)
+def putstatic2_quick(frame, arg, index):
+    vm = frame.vm
+    fields = vm.initialized_statics.get(arg[3])
+    if fields is None:
+        fields = vm.static_storage(arg)
+
+    sp = frame.sp - 2
+    fields[arg[4]] = frame.stack[sp]
+    frame.sp = sp
+    return index + 1
+
+
+@quick(LDC_UNSUPPORTED)
+def ldc_unsupported(frame, arg, index):
+    throw(frame, "java/lang/UnsupportedOperationException", f"ldc of a {arg} constant is not supported")
+
+
+@quick(LDC_CLASS)
+def ldc_class(frame, arg, index):
+    sp = frame.sp
+    frame.stack[sp] = frame.vm.class_mirror(arg)
+    frame.sp = sp + 1
+    return index + 1
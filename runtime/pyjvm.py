@@ -1,44 +1,207 @@
-from objects.classes import Class, ClassInstance
+import sys
+import threading
+from contextlib import contextmanager
+
+from objects.attributes import AttributeCode, AttributeConstantValue
+from objects.classes import ArrayInstance, Class, ClassFlags, ClassInstance
+from objects.errors import ClassFormatError, VerifyError
 from objects.fields import FieldFlags
-from objects.runtime import Frame
-from parser.class_parser import parse_class
+from objects.methods import MethodFlags
+from objects.runtime import FieldLayout, JavaException, MethodTables
+from parser.verifier import class_type, is_assignable, verify_class
+from runtime.class_loader import ClassLoader, shared_class, shared_lock
+from runtime.interpreter import BytecodeMethod, constant_value
+from runtime.natives import (
+    CLASS_NAME,
+    THROWABLE_CAUSE,
+    THROWABLE_MESSAGE,
+    builtin_classes,
+    builtin_fields,
+    builtin_interfaces,
+    builtin_statics,
+    natives,
+    static_natives
+)
 
 
 default_fields = {
-    "B": b"0",
-    "C": "\u0000",
+    "B": 0,
+    "C": 0,
     "D": 0.0,
     "F": 0.0,
     "I": 0,
     "J": 0,
     "L": None,
     "S": 0,
-    "Z": False,
+    "Z": 0,
     "[": None
 }
 
+# Each Java call nests a handful of Python frames, so the recursion limit is raised while any VM
+# runs code (see java_stack) and restored once none does
+JAVA_RECURSION_LIMIT = 20000
+
+recursion_lock = threading.Lock()
+# VMs running code, and the recursion limit to restore when the last returns
+running_vms = 0
+saved_recursion_limit = None
+
+
+@contextmanager
+def java_stack():
+    global running_vms, saved_recursion_limit
+    with recursion_lock:
+        if running_vms == 0:
+            saved_recursion_limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(max(saved_recursion_limit, JAVA_RECURSION_LIMIT))
+        running_vms += 1
+    try:
+        yield
+    finally:
+        with recursion_lock:
+            running_vms -= 1
+            if running_vms == 0:
+                sys.setrecursionlimit(saved_recursion_limit)
+
+
+# --------------------------------------------------
+# SHARED CLASS DATA
+# --------------------------------------------------
+
+
+# Prepared method bodies of shared classes (see runtime/class_loader.py), shared by the VMs of a
+# namespace (see JVM.__init__), (id(class), name, descriptor, namespace) -> BytecodeMethod
+shared_methods = dict[tuple[int, str, str, tuple], BytecodeMethod]()
+
+
+def shared_method(clazz: Class, method, attribute: AttributeCode, namespace: tuple) -> BytecodeMethod:
+    key = (id(clazz), method.name, method.descriptor, namespace)
+    prepared = shared_methods.get(key)
+    if prepared is None:
+        prepared = BytecodeMethod(clazz, method, attribute)
+        with shared_lock:
+            prepared = shared_methods.setdefault(key, prepared)
+
+    return prepared
+
+
+# Classes that passed verification, (id(class), namespace); see JVM.verify. Shared classes are unique
+# per class file content, so this records each verdict once per content hash and namespace.
+verified_classes = set[tuple[int, tuple]]()
+
+
+# Stands in for a method without a body: calling it raises `kind` (AbstractMethodError or
+# UnsatisfiedLinkError), as the JVM only does when such a method is invoked
+class MissingMethod:
+    __slots__ = ("kind", "key")
 
+    def __init__(self, kind: str, key: tuple[str, str, str]):
+        self.kind = kind
+        self.key = key
+
+    def __repr__(self):
+        return f"MissingMethod({self.kind}, {self.key[0]}.{self.key[1]}{self.key[2]})"
+
+    def __call__(self, vm, arguments):
+        class_name, name, descriptor = self.key
+        raise JavaException(vm.new_throwable(f"java/lang/{self.kind}", f"{class_name}.{name}{descriptor}"))
+
+
+# --------------------------------------------------
+# VIRTUAL MACHINE
+# --------------------------------------------------
+
+
+# All mutable state belongs to the instance; JVMs in the same process only share the read-only
+# class data above, so each can run on its own thread.
 class JVM:
-    method_area = list[Class]()
-    stack = list[Frame]()
-    heap = list[ClassInstance]()
-    pc = 0
+    # `classpath` lists directories and JARs searched for classes the initial class refers to; a
+    # ClassLoader passed as `loader` (and its index) can be shared by many VMs instead
+    def __init__(self, init_filename: str, stdout=None, stderr=None, classpath=(), loader=None):
+        self.stdout = stdout if stdout is not None else sys.stdout
+        self.stderr = stderr if stderr is not None else sys.stderr
+        self.loader = loader if loader is not None else ClassLoader(classpath)
+
+        # Loaded classes by binary name
+        self.method_area = dict[str, Class]()
+        self.heap = list[ClassInstance]()
+        # Static fields of loaded classes, class name -> ClassInstance whose fields are indexed by the
+        # slots in static_slots, class name -> {field name: slot}
+        self.statics = dict[str, ClassInstance]()
+        self.static_slots = dict[str, dict[str, int]]()
+        # Static fields of initialized classes, class name -> storage; what quickened static field
+        # instructions index
+        self.initialized_statics = dict[str, list]()
+        # Resolved invocation targets, (class, name, descriptor) -> callable(vm, arguments)
+        self.methods = dict[tuple[str, str, str], callable]()
+        # invokestatic targets, cached once their declaring class is initialized
+        self.static_methods = dict[tuple[str, str, str], callable]()
+        # Method tables of linked classes by binary name; arrays share those of Object
+        self.tables = dict[str, MethodTables]()
+        # Resolved invokevirtual sites, key -> vtable slot, and invokeinterface sites,
+        # key -> (interface, itable slot), or (None, vtable slot) for methods of Object
+        self.virtual_slots = dict[tuple[str, str, str], int]()
+        self.interface_slots = dict[tuple[str, str, str], tuple[str | None, int]]()
+        # Instance field layouts of classes by binary name
+        self.layouts = dict[str, FieldLayout]()
+        # java/lang/Class objects by binary name
+        self.mirrors = dict[str, ClassInstance]()
+        # Initialization state of classes (JVMS §5.5); classes not in any set are uninitialized
+        self.initializing = set[str]()
+        self.initialized = set[str]()
+        self.erroneous = set[str]()
 
-    def __init__(self, init_filename: str):
-        self.init_class = self.__cycle(parse_class(init_filename))
-        print(self.method_area)
-        print(self.heap)
+        # Builtin classes need no initialization
+        for class_name, fields in builtin_statics().items():
+            self.static_slots[class_name] = {name: slot for slot, name in enumerate(fields)}
+            self.statics[class_name] = ClassInstance(class_name, list(fields.values()))
+            self.initialized_statics[class_name] = self.statics[class_name].fields
+
+        init_class = shared_class(init_filename)
+        # Identifies the classes this VM can see, and so everything derived from them: verification
+        # and the field slots quickened into shared code
+        self.namespace = (tuple(self.loader.entries), id(init_class))
+        self.init_class = self.__prepare(self.__load(init_class))
+
+    def run(self, args=()) -> int:
+        # Runs main(String[]) of the initial class, initializing it first; returns the exit status
+        try:
+            self.invoke((self.init_class.this_class, "main", "([Ljava/lang/String;)V"), [
+                ArrayInstance("[Ljava/lang/String;", args)
+            ])
+        except JavaException as exception:
+            self.stderr.write(f'Exception in thread "main" {exception}\n')
+            return 1
+        return 0
+
+    def invoke(self, key: tuple[str, str, str], arguments: list):
+        # Calls a static method from the host as invokestatic would, with the argument slots as given;
+        # Java exceptions propagate as JavaException
+        with java_stack():
+            return self.resolve_static(key)(self, arguments)
 
     def __load(self, clazz: Class):
-        self.method_area.append(clazz)
+        self.method_area[clazz.this_class] = clazz
         return clazz
 
-    def __init(self, clazz: Class):
-        fields = dict[str, any]()
-        
+    def __prepare(self, clazz: Class):
+        # Static fields start at their default values, or their ConstantValue if they have one
+        slots = dict[str, int]()
+        fields = list()
+
         for field in clazz.fields:
             if FieldFlags.ACC_STATIC in field.access_flags:
-                fields[field.name] = default_fields[field.descriptor[0]]
+                value = default_fields[field.descriptor[0]]
+
+                for attribute in field.attribute_info:
+                    if isinstance(attribute, AttributeConstantValue):
+                        try:
+                            value = constant_value(clazz.constant_pool[attribute.constantvalue])
+                        except ClassFormatError as error:
+                            raise JavaException(self.new_throwable("java/lang/ClassFormatError", str(error)))
+
+                slots[field.name] = len(fields)
+                fields.append(value)
 
         instance = ClassInstance(
             clazz.this_class,
@@ -46,8 +209,494 @@ class JVM:
         )
 
         self.heap.append(instance)
-        return instance
-        
-    def __cycle(self, clazz: Class):
-        return self.__init(
-               self.__load(clazz))
\ No newline at end of file
+        self.statics[clazz.this_class] = instance
+        self.static_slots[clazz.this_class] = slots
+        return clazz
+
+    def initialize(self, class_name: str):
+        # Runs on first active use: new, getstatic/putstatic, invokestatic, subclass initialization
+        # and the initial class. Builtin classes need no initialization.
+        if class_name in self.initialized or class_name in self.initializing:
+            # Done, or in progress further up this VM's call stack (JVMS §5.5 step 3)
+            return
+        if class_name in self.erroneous:
+            raise JavaException(self.new_throwable("java/lang/NoClassDefFoundError", f"Could not initialize class {class_name}"))
+
+        clazz = self.find_class(class_name)
+        if clazz is None:
+            self.initialized.add(class_name)
+            return
+
+        self.initializing.add(class_name)
+        try:
+            if ClassFlags.ACC_INTERFACE not in clazz.access_flags and clazz.super_class is not None:
+                self.initialize(clazz.super_class)
+
+            initializer = self.find_method(clazz, "<clinit>", "()V")
+            if initializer is not None:
+                self.bind(clazz, initializer)(self, [])
+
+        except JavaException as exception:
+            self.initializing.discard(class_name)
+            self.erroneous.add(class_name)
+
+            if self.is_instance(exception.instance, "java/lang/Error"):
+                raise
+            error = self.new_throwable("java/lang/ExceptionInInitializerError")
+            error.fields[THROWABLE_CAUSE] = exception.instance
+            raise JavaException(error) from exception
+
+        self.initializing.discard(class_name)
+        self.initialized.add(class_name)
+        self.initialized_statics[class_name] = self.statics[class_name].fields
+
+    # --------------------------------------------------
+    # CLASSES
+    # --------------------------------------------------
+
+    def find_class(self, class_name: str) -> Class | None:
+        # Classes are loaded from the classpath the first time they are resolved
+        clazz = self.method_area.get(class_name)
+        if clazz is None:
+            clazz = self.loader.load(class_name)
+            if clazz is not None:
+                # A class file must declare the class it is found under
+                if clazz.this_class != class_name:
+                    raise JavaException(self.new_throwable("java/lang/NoClassDefFoundError", f"{class_name} (wrong name: {clazz.this_class})"))
+                self.__prepare(self.__load(clazz))
+        return clazz
+
+    def supertypes(self, class_name: str) -> tuple[str | None, tuple[str, ...]]:
+        # (superclass, interfaces) of a loaded or builtin class
+        clazz = self.find_class(class_name)
+        if clazz is not None:
+            return clazz.super_class, tuple(clazz.constant_pool[index].name for index in clazz.interfaces)
+        if class_name in builtin_classes:
+            return builtin_classes[class_name]
+
+        raise JavaException(self.new_throwable("java/lang/NoClassDefFoundError", class_name))
+
+    def is_subclass(self, source: str, target: str) -> bool:
+        if source == target or target == "java/lang/Object":
+            return True
+
+        super_class, interfaces = self.supertypes(source)
+        if any(self.is_subclass(interface, target) for interface in interfaces):
+            return True
+        return super_class is not None and self.is_subclass(super_class, target)
+
+    def class_name_of(self, instance) -> str:
+        # Binary name of an object's class; array classes are named by descriptor
+        if isinstance(instance, ClassInstance):
+            return instance.identifier
+        if isinstance(instance, str):
+            return "java/lang/String"
+        return instance.descriptor
+
+    def is_instance(self, instance, class_name: str) -> bool:
+        source = self.class_name_of(instance)
+        if source[0] != "[" and class_name[0] != "[":
+            return self.is_subclass(source, class_name)
+        return is_assignable(class_type(source), class_type(class_name), self.is_subclass)
+
+    def is_verifier_assignable(self, source: str, target: str) -> bool:
+        # Class type assignability as the verifier checks it: any class type passes for an interface
+        # type (JVMS §4.10.1.2)
+        if target in builtin_interfaces:
+            return True
+        clazz = self.find_class(target)
+        if clazz is not None and ClassFlags.ACC_INTERFACE in clazz.access_flags:
+            return True
+        return self.is_subclass(source, target)
+
+    def verify(self, clazz: Class):
+        # Type checks a class against this VM's class hierarchy before any of its code is bound.
+        # Done once per class and namespace in the process, since VMs seeing the same classes agree.
+        key = (id(clazz), self.namespace)
+        if key in verified_classes:
+            return
+
+        try:
+            verify_class(clazz, self.is_verifier_assignable)
+        except VerifyError as error:
+            raise JavaException(self.new_throwable("java/lang/VerifyError", str(error)))
+
+        with shared_lock:
+            verified_classes.add(key)
+
+    # --------------------------------------------------
+    # METHODS
+    # --------------------------------------------------
+
+    def find_method(self, clazz: Class, name: str, descriptor: str):
+        for method in clazz.methods:
+            if method.name == name and method.descriptor == descriptor:
+                return method
+        return None
+
+    def bind(self, clazz: Class, method):
+        # Callable for a declared method: natives by name, everything else through the interpreter
+        self.verify(clazz)
+
+        for attribute in method.attribute_info:
+            if isinstance(attribute, AttributeCode):
+                try:
+                    return shared_method(clazz, method, attribute, self.namespace)
+                except VerifyError as error:
+                    raise JavaException(self.new_throwable("java/lang/VerifyError", str(error)))
+                except ClassFormatError as error:
+                    raise JavaException(self.new_throwable("java/lang/ClassFormatError", str(error)))
+
+        key = (clazz.this_class, method.name, method.descriptor)
+        if MethodFlags.ACC_NATIVE in method.access_flags and key in natives:
+            return natives[key]
+
+        kind = "AbstractMethodError" if MethodFlags.ACC_ABSTRACT in method.access_flags else "UnsatisfiedLinkError"
+        return MissingMethod(kind, key)
+
+    def lookup(self, class_name: str, name: str, descriptor: str):
+        # Searches the class, then its superclasses, then its superinterfaces (JVMS §5.4.3.3)
+        key = (class_name, name, descriptor)
+        clazz = self.find_class(class_name)
+
+        if clazz is not None:
+            method = self.find_method(clazz, name, descriptor)
+            if method is not None and MethodFlags.ACC_ABSTRACT not in method.access_flags:
+                return self.bind(clazz, method)
+        elif key in natives:
+            return natives[key]
+
+        super_class, interfaces = self.supertypes(class_name)
+        for owner in ((super_class,) if super_class is not None else ()) + interfaces:
+            target = self.lookup(owner, name, descriptor)
+            if target is not None:
+                return target
+
+        return None
+
+    def resolve(self, class_name: str, name: str, descriptor: str):
+        key = (class_name, name, descriptor)
+        target = self.methods.get(key)
+        if target is None:
+            target = self.lookup(class_name, name, descriptor)
+            if target is None:
+                raise JavaException(self.new_throwable("java/lang/NoSuchMethodError", f"{class_name}.{name}{descriptor}"))
+            self.methods[key] = target
+
+        return target
+
+    # invokespecial
+    def resolve_method(self, key):
+        target = self.methods.get(key)
+        return target if target is not None else self.resolve(*key)
+
+    # invokestatic initializes the class declaring the method before the first call
+    def resolve_static(self, key):
+        target = self.static_methods.get(key)
+        if target is None:
+            target = self.resolve(*key)
+            if isinstance(target, BytecodeMethod):
+                self.initialize(target.clazz.this_class)
+            self.static_methods[key] = target
+
+        return target
+
+    # invokevirtual: the slot is resolved once in the referenced class, then every call indexes the
+    # vtable of the receiver's class
+    def resolve_virtual(self, key) -> int:
+        class_name, name, descriptor = key
+        tables = self.link(class_name)
+
+        slot = tables.private.get((name, descriptor))
+        if slot is None:
+            slot = tables.slots.get((name, descriptor))
+            if slot is None:
+                raise JavaException(self.new_throwable("java/lang/NoSuchMethodError", f"{class_name}.{name}{descriptor}"))
+
+        self.virtual_slots[key] = slot
+        return slot
+
+    def dispatch_virtual(self, receiver, key):
+        slot = self.virtual_slots.get(key)
+        if slot is None:
+            slot = self.resolve_virtual(key)
+
+        class_name = receiver.identifier if type(receiver) is ClassInstance else self.class_name_of(receiver)
+        tables = self.tables.get(class_name)
+        if tables is None:
+            tables = self.link(class_name)
+        return tables.vtable[slot]
+
+    # invokeinterface indexes the receiver class's itable for the interface declaring the method.
+    # Methods of Object can be invoked through any interface and go through the vtable.
+    def resolve_interface(self, key) -> tuple[str | None, int]:
+        class_name, name, descriptor = key
+        slot = self.link(class_name).slots.get((name, descriptor))
+        if slot is not None:
+            ref = (class_name, slot)
+        else:
+            slot = self.link("java/lang/Object").slots.get((name, descriptor))
+            if slot is None:
+                raise JavaException(self.new_throwable("java/lang/NoSuchMethodError", f"{class_name}.{name}{descriptor}"))
+            ref = (None, slot)
+
+        self.interface_slots[key] = ref
+        return ref
+
+    def dispatch_interface(self, receiver, key):
+        ref = self.interface_slots.get(key)
+        if ref is None:
+            ref = self.resolve_interface(key)
+        interface, slot = ref
+
+        class_name = receiver.identifier if type(receiver) is ClassInstance else self.class_name_of(receiver)
+        tables = self.tables.get(class_name)
+        if tables is None:
+            tables = self.link(class_name)
+        if interface is None:
+            return tables.vtable[slot]
+
+        itable = tables.itables.get(interface)
+        if itable is None:
+            raise JavaException(self.new_throwable(
+                "java/lang/IncompatibleClassChangeError",
+                f"{class_name} does not implement the requested interface {interface}"
+            ))
+        return itable[slot]
+
+    # --------------------------------------------------
+    # LINKING
+    # --------------------------------------------------
+
+    def link(self, class_name: str) -> MethodTables:
+        # Method tables of a class, built from those of its superclass and interfaces the first time
+        # a call resolves in it or is dispatched on one of its objects
+        tables = self.tables.get(class_name)
+        if tables is not None:
+            return tables
+
+        if class_name[0] == "[":
+            tables = self.link("java/lang/Object")
+        else:
+            super_class, interfaces = self.supertypes(class_name)
+            clazz = self.find_class(class_name)
+            declared = self.declared_methods(class_name, clazz)
+
+            if clazz is not None and ClassFlags.ACC_INTERFACE in clazz.access_flags or class_name in builtin_interfaces:
+                tables = self.__link_interface(class_name, interfaces, declared)
+            else:
+                tables = self.__link_class(super_class, interfaces, declared)
+
+        self.tables[class_name] = tables
+        return tables
+
+    def declared_methods(self, class_name: str, clazz: Class | None) -> dict[tuple[str, str], tuple[callable, bool]]:
+        # (name, descriptor) -> (callable, private) for the instance methods a class declares;
+        # builtin classes declare their instance natives
+        methods = dict()
+
+        if clazz is None:
+            for key, target in natives.items():
+                if key[0] == class_name and key[1][0] != "<" and key not in static_natives:
+                    methods[key[1:]] = (target, False)
+            for signature in builtin_interfaces.get(class_name, ()):
+                methods.setdefault(signature, (MissingMethod("AbstractMethodError", (class_name, *signature)), False))
+            return methods
+
+        for method in clazz.methods:
+            if method.name[0] == "<" or MethodFlags.ACC_STATIC in method.access_flags:
+                continue
+            private = MethodFlags.ACC_PRIVATE in method.access_flags
+            methods[(method.name, method.descriptor)] = (self.bind(clazz, method), private)
+
+        return methods
+
+    def __link_class(self, super_class, interfaces, declared) -> MethodTables:
+        if super_class is not None:
+            parent = self.link(super_class)
+            vtable = list(parent.vtable)
+            slots = dict(parent.slots)
+            implemented = dict.fromkeys(parent.interfaces)
+        else:
+            vtable = list()
+            slots = dict()
+            implemented = dict()
+
+        # Declared methods override the entry of the same signature, or take a new slot
+        private = dict()
+        for signature, (target, is_private) in declared.items():
+            if is_private:
+                private[signature] = len(vtable)
+                vtable.append(target)
+            elif signature in slots:
+                vtable[slots[signature]] = target
+            else:
+                slots[signature] = len(vtable)
+                vtable.append(target)
+
+        for interface in interfaces:
+            implemented.update(dict.fromkeys(self.link(interface).interfaces))
+
+        # Interface methods the class does not implement select a default method, the first in
+        # interface order, or raise AbstractMethodError
+        inherited = set()
+        for interface in implemented:
+            tables = self.link(interface)
+            for signature, slot in tables.slots.items():
+                target = tables.vtable[slot]
+                own = slots.get(signature)
+                if own is None:
+                    slots[signature] = len(vtable)
+                    inherited.add(len(vtable))
+                    vtable.append(target)
+                elif own in inherited and isinstance(vtable[own], MissingMethod):
+                    vtable[own] = target
+
+        itables = {
+            interface: [vtable[slots[signature]] for signature in self.link(interface).slots]
+            for interface in implemented
+        }
+        return MethodTables(vtable, slots, private, tuple(implemented), itables)
+
+    def __link_interface(self, class_name, interfaces, declared) -> MethodTables:
+        # Superinterface methods first; declared methods override them, private ones included
+        vtable = list()
+        slots = dict()
+        implemented = {class_name: None}
+
+        for interface in interfaces:
+            parent = self.link(interface)
+            implemented.update(dict.fromkeys(parent.interfaces))
+            for signature, slot in parent.slots.items():
+                if signature not in slots:
+                    slots[signature] = len(vtable)
+                    vtable.append(parent.vtable[slot])
+
+        for signature, (target, _) in declared.items():
+            if signature in slots:
+                vtable[slots[signature]] = target
+            else:
+                slots[signature] = len(vtable)
+                vtable.append(target)
+
+        return MethodTables(vtable, slots, dict(), tuple(implemented), dict())
+
+    # --------------------------------------------------
+    # OBJECTS
+    # --------------------------------------------------
+
+    def field_owner(self, class_name: str, name: str, static: bool) -> str | None:
+        # Class declaring field `name`: the class, then its superinterfaces, then its superclass
+        # (JVMS §5.4.3.2). Builtin classes only expose their static fields.
+        clazz = self.find_class(class_name)
+        if clazz is None:
+            self.supertypes(class_name)
+            return class_name if static and name in self.static_slots.get(class_name, ()) else None
+
+        for field in clazz.fields:
+            if field.name == name:
+                if (FieldFlags.ACC_STATIC in field.access_flags) != static:
+                    raise JavaException(self.new_throwable("java/lang/IncompatibleClassChangeError", f"{class_name}.{name}"))
+                return class_name
+
+        for interface in self.supertypes(class_name)[1]:
+            owner = self.field_owner(interface, name, static)
+            if owner is not None:
+                return owner
+
+        if clazz.super_class is None:
+            return None
+        return self.field_owner(clazz.super_class, name, static)
+
+    def resolve_field(self, class_name: str, name: str, static: bool) -> str:
+        owner = self.field_owner(class_name, name, static)
+        if owner is None:
+            raise JavaException(self.new_throwable("java/lang/NoSuchFieldError", f"{class_name}.{name}"))
+        return owner
+
+    def static_field(self, class_name: str, name: str) -> tuple[str, int]:
+        # (declaring class, slot) of static field reference class_name.name, initializing the
+        # declaring class first
+        owner = self.resolve_field(class_name, name, True)
+        self.initialize(owner)
+        return owner, self.static_slots[owner][name]
+
+    def static_storage(self, ref: tuple) -> list:
+        # Storage of the class declaring a quickened static field reference (class, name, category,
+        # declaring class, slot), for VMs that have not initialized that class yet. While its <clinit>
+        # runs, or once it failed, every access takes this path and is resolved again.
+        owner, _ = self.static_field(ref[0], ref[1])
+        return self.statics[owner].fields
+
+    def layout(self, class_name: str) -> FieldLayout:
+        # Instance field layout of a class: that of its superclass, then the fields it declares.
+        # Builtin classes declare the fields their natives use.
+        layout = self.layouts.get(class_name)
+        if layout is not None:
+            return layout
+
+        super_class, _ = self.supertypes(class_name)
+        if super_class is not None:
+            parent = self.layout(super_class)
+            slots = dict(parent.slots)
+            defaults = list(parent.defaults)
+        else:
+            slots = dict()
+            defaults = list()
+
+        clazz = self.find_class(class_name)
+        if clazz is None:
+            declared = [(name, None) for name in builtin_fields.get(class_name, ())]
+        else:
+            declared = [
+                (field.name, default_fields[field.descriptor[0]])
+                for field in clazz.fields
+                if FieldFlags.ACC_STATIC not in field.access_flags
+            ]
+
+        for name, default in declared:
+            slots[(class_name, name)] = len(defaults)
+            defaults.append(default)
+
+        layout = self.layouts[class_name] = FieldLayout(slots, defaults)
+        return layout
+
+    def field_slot(self, class_name: str, name: str) -> int:
+        # Slot of instance field reference class_name.name, in the layout of its declaring class and
+        # so of every subclass
+        owner = self.resolve_field(class_name, name, False)
+        return self.layout(owner).slots[(owner, name)]
+
+    def new(self, class_name: str) -> ClassInstance:
+        self.initialize(class_name)
+        return ClassInstance(class_name, list(self.layout(class_name).defaults))
+
+    def class_mirror(self, class_name: str) -> ClassInstance:
+        # The one Class object of a class in this VM, resolving the class first
+        mirror = self.mirrors.get(class_name)
+        if mirror is None:
+            if class_name[0] != "[":
+                self.supertypes(class_name)
+
+            mirror = self.new("java/lang/Class")
+            mirror.fields[CLASS_NAME] = class_name
+            self.mirrors[class_name] = mirror
+
+        return mirror
+
+    def new_array(self, descriptor: str, length: int) -> ArrayInstance:
+        if length < 0:
+            raise JavaException(self.new_throwable("java/lang/NegativeArraySizeException", str(length)))
+        return ArrayInstance(descriptor, [default_fields[descriptor[1]]] * length)
+
+    def new_multi_array(self, descriptor: str, lengths: list[int]) -> ArrayInstance:
+        array = self.new_array(descriptor, lengths[0])
+        if len(lengths) > 1:
+            for i in range(len(array)):
+                array[i] = self.new_multi_array(descriptor[1:], lengths[1:])
+        return array
+
+    def new_throwable(self, class_name: str, message: str | None = None) -> ClassInstance:
+        throwable = self.new(class_name)
+        throwable.fields[THROWABLE_MESSAGE] = message
+        return throwable
@@ -0,0 +1,90 @@
+import io
+import os
+from glob import glob
+from struct import pack
+
+import pytest
+
+from objects.runtime import JavaException
+from parser.class_writer import ClassFileBuilder
+from runtime.pyjvm import JVM
+
+
+# Assembles classes for the tests and runs them. Run the tests from the repository root:
+#
+#   python -m pytest tests
+
+
+STATIC = 0x0009
+OBJECT_INIT = ("java/lang/Object", "<init>", "()V")
+
+# Class files compiled by javac
+CLASS_FILES = sorted(glob(os.path.join(os.path.dirname(__file__), "*.class")))
+
+# if (value == 0) return 0; return 1: iload_0, ifeq +5, iconst_1, ireturn, iconst_0, ireturn. Needs a
+# frame at pc 6.
+BRANCH = b"\x1a\x99\x00\x05\x04\xac\x03\xac"
+
+
+def u2(value) -> bytes:
+    return pack(">H", value)
+
+
+def new_class(name, super_class="java/lang/Object", interfaces=(), access_flags=0x0021) -> ClassFileBuilder:
+    # Class with a no-argument constructor calling that of its superclass, unless it is an interface
+    builder = ClassFileBuilder(name, super_class, interfaces, access_flags)
+    if not access_flags & 0x0200:
+        init = builder.method_ref(super_class, "<init>", "()V")
+        builder.add_method("<init>", "()V", 0x0001, [builder.code(b"\x2a\xb7" + u2(init) + b"\xb1", 1, 1)])
+    return builder
+
+
+def add_static(builder: ClassFileBuilder, name, descriptor, code: bytes, max_stack=8, max_locals=8):
+    builder.add_method(name, descriptor, STATIC, [builder.code(code, max_stack, max_locals)])
+
+
+def annotated_class(name="Annotated") -> bytes:
+    # Class carrying every kind of attribute the parser decodes
+    builder = new_class(name)
+    builder.add_field("LIMIT", "I", 0x0019, [builder.attribute("ConstantValue", u2(builder.integer(42)))])
+    builder.add_field("label", "Ljava/lang/String;", 0x0002, [builder.runtime_visible_annotations([
+        builder.annotation("LLabel;", {"value": "name", "order": 3, "tags": ["a", "b", "c"]})
+    ])])
+    builder.add_method("sign", "(I)I", STATIC, [builder.code(BRANCH, 2, 1, attributes=[
+        builder.line_number_table([(0, 10), (4, 11), (6, 12)]),
+        builder.local_variable_table([(0, 8, "value", "I", 0)]),
+        builder.stack_map_table([bytes((6,))])
+    ])])
+    builder.attributes.append(builder.attribute("SourceFile", u2(builder.utf8(f"{name}.java"))))
+    return builder.build()
+
+
+def source_id(source) -> str:
+    # Test ID of a class file path or of generated bytes
+    return os.path.basename(source) if isinstance(source, str) else "generated"
+
+
+class Classpath:
+    # Directory of class files assembled by a test; every VM made from it sees the same classes
+    def __init__(self, directory):
+        self.directory = str(directory)
+
+    def add(self, name, builder: ClassFileBuilder):
+        path = os.path.join(self.directory, *name.split("/")) + ".class"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(builder.build())
+
+    def vm(self, init_class) -> JVM:
+        filename = os.path.join(self.directory, *init_class.split("/")) + ".class"
+        return JVM(filename, stdout=io.StringIO(), stderr=io.StringIO(), classpath=[self.directory])
+
+
+def call(vm, class_name, name, descriptor, *arguments):
+    return vm.invoke((class_name, name, descriptor), list(arguments))
+
+
+def thrown(vm, class_name, name, descriptor, *arguments) -> JavaException:
+    with pytest.raises(JavaException) as info:
+        call(vm, class_name, name, descriptor, *arguments)
+    return info.value
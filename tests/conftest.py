@@ -0,0 +1,8 @@
+import pytest
+
+from classfiles import Classpath
+
+
+@pytest.fixture
+def classpath(tmp_path) -> Classpath:
+    return Classpath(tmp_path)
@@ -0,0 +1,49 @@
+import mmap
+import os
+
+from parser.byte_reader import ByteReader
+
+
+CLASS_FILE = os.path.join(os.path.dirname(__file__), "Class.class")
+
+
+def test_file_is_mapped():
+    with open(CLASS_FILE, "rb") as file:
+        data = file.read()
+
+    reader = ByteReader(CLASS_FILE)
+    assert isinstance(reader.source, mmap.mmap)
+    assert reader.u4() == 0xCAFEBABE
+    assert bytes(reader.buffer) == data
+
+    mapping = reader.source
+    reader.close()
+    assert mapping.closed
+
+
+def test_kept_mapping_stays_open():
+    reader = ByteReader(CLASS_FILE)
+    mapping = reader.source
+    reader.close(keep_source=True)
+
+    assert not mapping.closed
+    assert mapping[:4] == b"\xca\xfe\xba\xbe"
+    mapping.close()
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "Empty.class"
+    path.write_bytes(b"")
+
+    reader = ByteReader(path)
+    assert len(reader) == 0
+    reader.close()
+
+
+def test_buffers_are_not_copied():
+    data = bytearray(b"\x00\x01\x00\x02")
+    reader = ByteReader(data)
+
+    assert reader.u2() == 1
+    data[3] = 3
+    assert reader.u2() == 3
@@ -0,0 +1,73 @@
+import threading
+import time
+import zipfile
+
+import pytest
+
+import runtime.class_loader
+from classfiles import new_class
+from objects.runtime import JavaException
+from parser.jar_reader import JarFile
+from runtime.class_loader import ClassLoader
+
+
+def test_loads_from_classpath(classpath):
+    classpath.add("Main", new_class("Main"))
+    classpath.add("pkg/Helper", new_class("pkg/Helper"))
+    vm = classpath.vm("Main")
+
+    helper = vm.find_class("pkg/Helper")
+    assert helper.this_class == "pkg/Helper"
+    assert vm.find_class("pkg/Helper") is helper
+    assert vm.find_class("pkg/Missing") is None
+
+
+def test_wrong_name(classpath):
+    classpath.add("Main", new_class("Main"))
+    # Other.class declares class Misnamed
+    classpath.add("Other", new_class("Misnamed"))
+    vm = classpath.vm("Main")
+
+    for _ in range(2):
+        with pytest.raises(JavaException) as info:
+            vm.find_class("Other")
+        assert str(info.value) == "java.lang.NoClassDefFoundError: Other (wrong name: Misnamed)"
+
+    assert "Other" not in vm.method_area
+    assert "Misnamed" not in vm.method_area
+
+
+def test_jar_opened_once_across_threads(tmp_path, monkeypatch):
+    path = tmp_path / "classes.jar"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("pkg/Shared.class", new_class("pkg/Shared").build())
+
+    # Indexed before the patch, which only sees archives opened for reading
+    loader = ClassLoader([path])
+    opened = list()
+
+    class SlowJarFile(JarFile):
+        # Widens the window in which another thread could open the same archive
+        def __init__(self, path):
+            opened.append(path)
+            time.sleep(0.05)
+            super().__init__(path)
+
+    monkeypatch.setattr(runtime.class_loader, "JarFile", SlowJarFile)
+    barrier = threading.Barrier(8)
+    results = list()
+
+    def load():
+        barrier.wait()
+        results.append(loader.load("pkg/Shared"))
+
+    with loader:
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert opened == [str(path)]
+    assert len(results) == 8
+    assert all(clazz is results[0] for clazz in results)
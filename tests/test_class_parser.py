@@ -0,0 +1,86 @@
+import pytest
+
+from classfiles import CLASS_FILES, annotated_class, new_class, source_id
+from objects.attributes import AttributeLazy
+from objects.constant_pool import PConstantClassInfo
+from objects.errors import ClassFormatError
+from parser.class_parser import parse_class, skim_class
+
+
+SOURCES = [*CLASS_FILES, annotated_class()]
+
+
+# --------------------------------------------------
+# LAZY ATTRIBUTES
+# --------------------------------------------------
+
+
+@pytest.mark.parametrize("source", SOURCES, ids=source_id)
+def test_lazy_equals_eager(source):
+    assert parse_class(source, lazy=True) == parse_class(source)
+
+
+def test_lazy_decodes_on_access():
+    clazz = parse_class(annotated_class(), lazy=True)
+    method = next(method for method in clazz.methods if method.name == "sign")
+
+    assert all(isinstance(attribute, AttributeLazy) for attribute in method.attribute_info.raw_attributes())
+    code = method.attribute_info[0]
+    assert code.max_stack == 2
+    # Decoded once, then cached in place
+    assert method.attribute_info.raw_attributes()[0] is code
+    assert method.attribute_info[0] is code
+
+
+def test_lazy_corrupt_attribute():
+    data = bytearray(annotated_class())
+    # Truncate the Code attribute of sign by claiming a longer bytecode array than the class holds
+    code_length = data.find(b"\x1a\x99\x00\x05") - 4
+    data[code_length:code_length + 4] = (0xFFFF).to_bytes(4, "big")
+
+    clazz = parse_class(bytes(data), lazy=True)
+    method = next(method for method in clazz.methods if method.name == "sign")
+    with pytest.raises(ClassFormatError):
+        method.attribute_info[0]
+
+    with pytest.raises(ClassFormatError):
+        parse_class(bytes(data))
+
+
+# --------------------------------------------------
+# SKIM PARSING
+# --------------------------------------------------
+
+
+@pytest.mark.parametrize("source", SOURCES, ids=source_id)
+def test_skim_matches_full_parse(source):
+    summary = skim_class(source)
+    clazz = parse_class(source)
+
+    assert (summary.minor_version, summary.major_version) == (clazz.minor_version, clazz.major_version)
+    assert summary.access_flags == clazz.access_flags
+    assert summary.this_class == clazz.this_class
+    assert summary.super_class == clazz.super_class
+    assert summary.interfaces == [clazz.constant_pool[index].name for index in clazz.interfaces]
+    assert set(summary.class_references) == {
+        entry.name for entry in clazz.constant_pool if isinstance(entry, PConstantClassInfo)
+    }
+
+
+def test_skim_stops_after_interfaces():
+    builder = new_class("Skimmed", interfaces=("java/lang/Runnable",))
+    # Magic, versions and constant pool, then access flags, this, super and one interface; members
+    # and attributes are cut off
+    header = builder.build()[:10 + sum(map(len, builder.pool)) + 8 + 2]
+
+    summary = skim_class(header)
+    assert summary.this_class == "Skimmed"
+    assert summary.interfaces == ["java/lang/Runnable"]
+
+    with pytest.raises(ClassFormatError):
+        parse_class(header)
+
+
+def test_skim_truncated_constant_pool():
+    with pytest.raises(ClassFormatError):
+        skim_class(annotated_class()[:40])
@@ -0,0 +1,113 @@
+import pytest
+
+from classfiles import CLASS_FILES, annotated_class, source_id
+from objects.attributes import AttributeCode
+from parser.class_parser import parse_class
+from parser.class_reader import ClassReader, ClassVisitor
+
+
+SOURCES = [*CLASS_FILES, annotated_class()]
+
+
+class Recorder(ClassVisitor):
+    # Records every callback, in order
+    def __init__(self):
+        self.events = list()
+
+    def visit_header(self, minor_version, major_version, constant_pool_count):
+        self.events.append(("header", major_version))
+
+    def visit_class(self, access_flags, this_class, super_class, interfaces):
+        self.events.append(("class", this_class, super_class, tuple(interfaces)))
+
+    def visit_field(self, access_flags, name, descriptor):
+        self.events.append(("field", name, descriptor))
+
+    def visit_method(self, access_flags, name, descriptor):
+        self.events.append(("method", name, descriptor))
+
+    def visit_attribute(self, name, length):
+        self.events.append(("attribute", name))
+
+    def visit_end(self):
+        self.events.append(("end",))
+
+
+class Values(ClassVisitor):
+    # Decoded attributes in the order they are visited, and Code bodies by method
+    def __init__(self, skip_methods=False):
+        self.skip_methods = skip_methods
+        self.method = None
+        self.attributes = list()
+        self.code = dict()
+
+    def visit_method(self, access_flags, name, descriptor):
+        self.method = (name, descriptor)
+        return False if self.skip_methods else None
+
+    def visit_attribute_value(self, attribute):
+        self.attributes.append(attribute)
+
+    def visit_code(self, max_stack, max_locals, code, exception_table):
+        self.code[self.method] = (max_stack, max_locals, code, exception_table)
+
+
+def visit_order(attributes) -> list:
+    # A Code attribute is visited after its nested attributes
+    order = list()
+    for attribute in attributes:
+        if isinstance(attribute, AttributeCode):
+            order += attribute.attribute_info
+        order.append(attribute)
+    return order
+
+
+def test_events_in_class_file_order():
+    visitor = Recorder()
+    ClassReader(annotated_class()).accept(visitor)
+
+    assert visitor.events == [
+        ("header", 52),
+        ("class", "Annotated", "java/lang/Object", ()),
+        ("field", "LIMIT", "I"),
+        ("attribute", "ConstantValue"),
+        ("field", "label", "Ljava/lang/String;"),
+        ("attribute", "RuntimeVisibleAnnotations"),
+        ("method", "<init>", "()V"),
+        ("attribute", "Code"),
+        ("method", "sign", "(I)I"),
+        ("attribute", "Code"),
+        ("attribute", "LineNumberTable"),
+        ("attribute", "LocalVariableTable"),
+        ("attribute", "StackMapTable"),
+        ("attribute", "SourceFile"),
+        ("end",),
+    ]
+
+
+@pytest.mark.parametrize("source", SOURCES, ids=source_id)
+def test_values_match_parse_class(source):
+    visitor = Values()
+    ClassReader(source).accept(visitor)
+    clazz = parse_class(source)
+
+    members = [*clazz.fields, *clazz.methods]
+    assert visitor.attributes == [
+        *(attribute for member in members for attribute in visit_order(member.attribute_info)),
+        *clazz.attribute_info
+    ]
+
+    for method in clazz.methods:
+        for attribute in method.attribute_info:
+            if isinstance(attribute, AttributeCode):
+                body = (attribute.max_stack, attribute.max_locals, attribute.code, attribute.exception_table)
+                assert visitor.code[(method.name, method.descriptor)] == body
+
+
+def test_skipped_members_are_not_decoded():
+    visitor = Values(skip_methods=True)
+    ClassReader(annotated_class()).accept(visitor)
+    clazz = parse_class(annotated_class())
+
+    assert visitor.code == {}
+    assert visitor.attributes == [*(attribute for field in clazz.fields for attribute in field.attribute_info), *clazz.attribute_info]
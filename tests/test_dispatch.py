@@ -0,0 +1,147 @@
+import sys
+
+import pytest
+
+from classfiles import STATIC, add_static, call, new_class, thrown, u2
+
+
+INTERFACE = 0x0601
+ABSTRACT = 0x0401
+PRIVATE = 0x0002
+
+
+def returns(builder, name, value, access_flags=0x0001):
+    # Instance method returning a constant: bipush value, ireturn
+    builder.add_method(name, "()I", access_flags, [builder.code(b"\x10" + bytes((value,)) + b"\xac", 1, 1)])
+
+
+def invokes(builder, name, opcode, owner, target, access_flags=0x0001):
+    # Instance method returning this.target(): aload_0, invoke<opcode> owner.target, ireturn
+    if opcode == 0xb9:
+        ref = u2(builder.interface_method_ref(owner, target, "()I")) + b"\x01\x00"
+    else:
+        ref = u2(builder.method_ref(owner, target, "()I"))
+    builder.add_method(name, "()I", access_flags, [builder.code(b"\x2a" + bytes((opcode,)) + ref + b"\xac", 1, 1)])
+
+
+# --------------------------------------------------
+# VIRTUAL
+# --------------------------------------------------
+
+
+@pytest.fixture
+def animals(classpath):
+    animal = new_class("Animal")
+    returns(animal, "sound", 1)
+    returns(animal, "secret", 10, PRIVATE)
+    invokes(animal, "call", 0xb6, "Animal", "sound")
+    invokes(animal, "callSecret", 0xb6, "Animal", "secret")
+    classpath.add("Animal", animal)
+
+    dog = new_class("Dog", "Animal")
+    returns(dog, "sound", 2)
+    # Does not override Animal.secret
+    returns(dog, "secret", 20, PRIVATE)
+    invokes(dog, "superSound", 0xb7, "Animal", "sound")
+    classpath.add("Dog", dog)
+
+    main = new_class("Main")
+    for name in ("call", "callSecret"):
+        # aload_0, invokevirtual Animal.<name>, ireturn
+        add_static(main, name, "(LAnimal;)I", b"\x2a\xb6" + u2(main.method_ref("Animal", name, "()I")) + b"\xac")
+    add_static(main, "superSound", "(LDog;)I", b"\x2a\xb6" + u2(main.method_ref("Dog", "superSound", "()I")) + b"\xac")
+    classpath.add("Main", main)
+    return classpath.vm("Main")
+
+
+def test_override(animals):
+    assert call(animals, "Main", "call", "(LAnimal;)I", animals.new("Animal")) == 1
+    assert call(animals, "Main", "call", "(LAnimal;)I", animals.new("Dog")) == 2
+    # Once resolved, the slot dispatches on each receiver
+    assert call(animals, "Main", "call", "(LAnimal;)I", animals.new("Animal")) == 1
+
+
+def test_invokespecial_super(animals):
+    assert call(animals, "Main", "superSound", "(LDog;)I", animals.new("Dog")) == 1
+
+
+def test_private_not_overridden(animals):
+    assert call(animals, "Main", "callSecret", "(LAnimal;)I", animals.new("Dog")) == 10
+
+
+def test_null_receiver(animals):
+    error = thrown(animals, "Main", "call", "(LAnimal;)I", None)
+    assert error.instance.identifier == "java/lang/NullPointerException"
+
+
+# --------------------------------------------------
+# INTERFACE
+# --------------------------------------------------
+
+
+@pytest.fixture
+def greeters(classpath):
+    greeter = new_class("Greeter", access_flags=INTERFACE)
+    greeter.add_method("name", "()I", ABSTRACT)
+    # default int greet() { return name() + 100; }
+    name = u2(greeter.interface_method_ref("Greeter", "name", "()I"))
+    greeter.add_method("greet", "()I", 0x0001, [greeter.code(b"\x2a\xb9" + name + b"\x01\x00\x10\x64\x60\xac", 2, 1)])
+    classpath.add("Greeter", greeter)
+
+    english = new_class("English", interfaces=("Greeter",))
+    returns(english, "name", 7)
+    classpath.add("English", english)
+
+    # Implements Greeter without name()
+    silent = new_class("Silent", interfaces=("Greeter",))
+    classpath.add("Silent", silent)
+
+    main = new_class("Main")
+    greet = u2(main.interface_method_ref("Greeter", "greet", "()I"))
+    add_static(main, "greet", "(LGreeter;)I", b"\x2a\xb9" + greet + b"\x01\x00\xac")
+    length = u2(main.interface_method_ref("java/lang/CharSequence", "length", "()I"))
+    add_static(main, "length", "(Ljava/lang/CharSequence;)I", b"\x2a\xb9" + length + b"\x01\x00\xac")
+    classpath.add("Main", main)
+    return classpath.vm("Main")
+
+
+def test_default_method(greeters):
+    assert call(greeters, "Main", "greet", "(LGreeter;)I", greeters.new("English")) == 107
+
+
+def test_missing_implementation(greeters):
+    error = thrown(greeters, "Main", "greet", "(LGreeter;)I", greeters.new("Silent"))
+    assert str(error) == "java.lang.AbstractMethodError: Greeter.name()I"
+
+
+def test_receiver_without_interface(greeters):
+    error = thrown(greeters, "Main", "greet", "(LGreeter;)I", greeters.new("java/lang/Object"))
+    assert error.instance.identifier == "java/lang/IncompatibleClassChangeError"
+
+
+def test_builtin_interface(greeters):
+    assert call(greeters, "Main", "length", "(Ljava/lang/CharSequence;)I", "hello") == 5
+
+    error = thrown(greeters, "Main", "length", "(Ljava/lang/CharSequence;)I", None)
+    assert error.instance.identifier == "java/lang/NullPointerException"
+
+
+# --------------------------------------------------
+# STATIC
+# --------------------------------------------------
+
+
+def test_deep_recursion(classpath):
+    builder = new_class("Recursive")
+    # sum(n) = n == 0 ? 0 : n + sum(n - 1): iload_0, ifne +5, iconst_0, ireturn, iload_0, iload_0,
+    # iconst_1, isub, invokestatic sum, iadd, ireturn
+    ref = u2(builder.method_ref("Recursive", "sum", "(I)I"))
+    code = b"\x1a\x9a\x00\x05\x03\xac\x1a\x1a\x04\x64\xb8" + ref + b"\x60\xac"
+    # same_frame at the branch target
+    builder.add_method("sum", "(I)I", STATIC, [builder.code(code, 3, 1, attributes=[builder.stack_map_table([bytes((6,))])])])
+    classpath.add("Recursive", builder)
+    limit = sys.getrecursionlimit()
+
+    # Deeper than the default recursion limit allows; the limit is only raised during the call
+    assert call(classpath.vm("Recursive"), "Recursive", "sum", "(I)I", 2000) == 2001000
+    assert sys.getrecursionlimit() == limit
@@ -0,0 +1,86 @@
+import pytest
+
+from classfiles import add_static, call, new_class, thrown, u2
+
+
+# --------------------------------------------------
+# INSTANCE FIELDS
+# --------------------------------------------------
+
+
+@pytest.fixture
+def shadowing(classpath):
+    # B.x shadows A.x; each is its own slot of a B
+    a = new_class("A")
+    a.add_field("x", "I")
+    classpath.add("A", a)
+
+    b = new_class("B", "A")
+    b.add_field("x", "I")
+    classpath.add("B", b)
+
+    builder = new_class("Shadow")
+    new = u2(builder.class_ref("B"))
+    init = u2(builder.method_ref("B", "<init>", "()V"))
+    a_x = u2(builder.field_ref("A", "x", "I"))
+    b_x = u2(builder.field_ref("B", "x", "I"))
+    # B b = new B(); b.A::x = 1; b.B::x = 2; return b.A::x * 10 + b.B::x
+    add_static(builder, "run", "()I", b"".join((
+        b"\xbb", new, b"\x59\xb7", init, b"\x4b",
+        b"\x2a\x04\xb5", a_x,
+        b"\x2a\x05\xb5", b_x,
+        b"\x2a\xb4", a_x, b"\x10\x0a\x68",
+        b"\x2a\xb4", b_x, b"\x60\xac"
+    )))
+    classpath.add("Shadow", builder)
+    return classpath
+
+
+def test_shadowed_fields(shadowing):
+    vm = shadowing.vm("Shadow")
+
+    assert call(vm, "Shadow", "run", "()I") == 12
+    assert vm.field_slot("A", "x") != vm.field_slot("B", "x")
+    assert len(vm.new("B").fields) == 2
+
+
+def test_null_receiver(classpath):
+    holder = new_class("Holder")
+    holder.add_field("value", "I")
+    # aload_0, getfield Holder.value, ireturn
+    add_static(holder, "get", "(LHolder;)I", b"\x2a\xb4" + u2(holder.field_ref("Holder", "value", "I")) + b"\xac")
+    classpath.add("Holder", holder)
+    vm = classpath.vm("Holder")
+
+    instance = vm.new("Holder")
+    assert call(vm, "Holder", "get", "(LHolder;)I", instance) == 0
+
+    # Also once quickened
+    error = thrown(vm, "Holder", "get", "(LHolder;)I", None)
+    assert error.instance.identifier == "java/lang/NullPointerException"
+
+
+# --------------------------------------------------
+# STATIC FIELDS
+# --------------------------------------------------
+
+
+def test_missing_field(classpath):
+    builder = new_class("Missing")
+    # getstatic Missing.value
+    add_static(builder, "get", "()I", b"\xb2" + u2(builder.field_ref("Missing", "value", "I")) + b"\xac")
+    classpath.add("Missing", builder)
+
+    error = thrown(classpath.vm("Missing"), "Missing", "get", "()I")
+    assert str(error) == "java.lang.NoSuchFieldError: Missing.value"
+
+
+def test_static_access_to_instance_field(classpath):
+    builder = new_class("Confused")
+    builder.add_field("value", "I")
+    # getstatic Confused.value
+    add_static(builder, "get", "()I", b"\xb2" + u2(builder.field_ref("Confused", "value", "I")) + b"\xac")
+    classpath.add("Confused", builder)
+
+    error = thrown(classpath.vm("Confused"), "Confused", "get", "()I")
+    assert error.instance.identifier == "java/lang/IncompatibleClassChangeError"
@@ -0,0 +1,93 @@
+import pytest
+
+from classfiles import add_static, call, new_class, thrown, u2
+from runtime.natives import THROWABLE_CAUSE
+
+
+def trace(builder, digit) -> bytes:
+    # Log.trace = Log.trace * 10 + digit
+    field = u2(builder.field_ref("Log", "trace", "I"))
+    return b"\xb2" + field + b"\x10\x0a\x68\x10" + bytes((digit,)) + b"\x60\xb3" + field
+
+
+@pytest.fixture
+def hierarchy(classpath):
+    log = new_class("Log")
+    log.add_field("trace", "I", 0x0009)
+    classpath.add("Log", log)
+
+    parent = new_class("Parent")
+    parent.add_field("inherited", "I", 0x0009)
+    add_static(parent, "<clinit>", "()V", trace(parent, 1) + b"\xb1")
+    classpath.add("Parent", parent)
+
+    child = new_class("Child", "Parent")
+    child.add_field("own", "I", 0x0009)
+    add_static(child, "<clinit>", "()V", trace(child, 2) + b"\xb1")
+    classpath.add("Child", child)
+
+    builder = new_class("Main")
+    log_trace = u2(builder.field_ref("Log", "trace", "I"))
+    # Child.own; return Log.trace
+    add_static(builder, "own", "()I", b"\xb2" + u2(builder.field_ref("Child", "own", "I")) + b"\x57\xb2" + log_trace + b"\xac")
+    # Child.inherited; return Log.trace
+    add_static(builder, "inherited", "()I", b"\xb2" + u2(builder.field_ref("Child", "inherited", "I")) + b"\x57\xb2" + log_trace + b"\xac")
+    classpath.add("Main", builder)
+    return classpath
+
+
+def test_superclass_first_and_once(hierarchy):
+    vm = hierarchy.vm("Main")
+
+    assert call(vm, "Main", "own", "()I") == 12
+    assert call(vm, "Main", "own", "()I") == 12
+
+
+def test_inherited_static_initializes_declaring_class(hierarchy):
+    vm = hierarchy.vm("Main")
+
+    assert call(vm, "Main", "inherited", "()I") == 1
+    assert "Parent" in vm.initialized
+    assert "Child" not in vm.initialized
+
+    assert call(vm, "Main", "own", "()I") == 12
+
+
+def test_initialization_per_vm(hierarchy):
+    first = hierarchy.vm("Main")
+    assert call(first, "Main", "own", "()I") == 12
+
+    second = hierarchy.vm("Main")
+    assert call(second, "Main", "inherited", "()I") == 1
+
+
+def test_failing_initializer(classpath):
+    builder = new_class("Broken")
+    # 1 / 0
+    add_static(builder, "<clinit>", "()V", b"\x04\x03\x6c\x57\xb1")
+    # return 0
+    add_static(builder, "get", "()I", b"\x03\xac")
+    classpath.add("Broken", builder)
+    vm = classpath.vm("Broken")
+
+    error = thrown(vm, "Broken", "get", "()I")
+    assert error.instance.identifier == "java/lang/ExceptionInInitializerError"
+    assert error.instance.fields[THROWABLE_CAUSE].identifier == "java/lang/ArithmeticException"
+
+    # The class is erroneous from then on
+    error = thrown(vm, "Broken", "get", "()I")
+    assert str(error) == "java.lang.NoClassDefFoundError: Could not initialize class Broken"
+
+
+def test_error_in_initializer(classpath):
+    builder = new_class("Fatal")
+    error_class = u2(builder.class_ref("java/lang/Error"))
+    error_init = u2(builder.method_ref("java/lang/Error", "<init>", "()V"))
+    # throw new Error()
+    add_static(builder, "<clinit>", "()V", b"\xbb" + error_class + b"\x59\xb7" + error_init + b"\xbf")
+    add_static(builder, "get", "()I", b"\x03\xac")
+    classpath.add("Fatal", builder)
+
+    # Errors propagate as they are
+    error = thrown(classpath.vm("Fatal"), "Fatal", "get", "()I")
+    assert error.instance.identifier == "java/lang/Error"
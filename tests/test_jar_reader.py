@@ -0,0 +1,45 @@
+import zipfile
+
+import pytest
+
+from classfiles import CLASS_FILES, annotated_class
+from parser.class_parser import parse_class
+from parser.jar_reader import JarFile
+
+
+@pytest.fixture(params=[zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2], ids=["stored", "deflated", "bzip2"])
+def jar(tmp_path, request):
+    path = tmp_path / "classes.jar"
+    with zipfile.ZipFile(path, "w", compression=request.param) as archive:
+        archive.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+        archive.writestr("META-INF/versions/9/pkg/Annotated.class", b"not a class")
+        archive.writestr("pkg/Annotated.class", annotated_class("pkg/Annotated"))
+        archive.write(CLASS_FILES[0], "java/lang/Class.class")
+        archive.writestr("README.txt", "not a class either")
+
+    with JarFile(path) as jar:
+        yield jar
+
+
+def test_index(jar):
+    assert sorted(jar.names()) == ["java/lang/Class", "pkg/Annotated"]
+    assert len(jar) == 2
+    assert "pkg/Annotated" in jar
+    assert "pkg.Annotated" in jar
+    assert "Missing" not in jar
+
+
+def test_read(jar):
+    assert bytes(jar.read("pkg/Annotated")) == annotated_class("pkg/Annotated")
+    with open(CLASS_FILES[0], "rb") as file:
+        assert bytes(jar.read("java.lang.Class")) == file.read()
+
+
+def test_classes(jar):
+    assert jar.get_class("pkg.Annotated") == parse_class(annotated_class("pkg/Annotated"))
+    assert sorted(clazz.this_class for clazz in jar.classes()) == ["java/lang/Class", "pkg/Annotated"]
+
+
+def test_lazy_classes(jar):
+    for clazz in jar.classes(lazy=True):
+        assert clazz == parse_class(jar.read(clazz.this_class))
@@ -0,0 +1,39 @@
+import pytest
+
+from objects.errors import ClassFormatError
+from parser.mutf8 import decode_mutf8
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (b"", ""),
+    (b"java/lang/Object", "java/lang/Object"),
+    (b"(I[Ljava/lang/String;)V", "(I[Ljava/lang/String;)V"),
+    # Two- and three-byte sequences, as in standard UTF-8
+    ("héllo wörld".encode(), "héllo wörld"),
+    ("名前".encode(), "名前"),
+    # Embedded NUL
+    (b"a\xc0\x80b", "a\x00b"),
+    (b"\xc0\x80", "\x00"),
+    # U+1F600 as the surrogate pair D83D DE00
+    (b"\xed\xa0\xbd\xed\xb8\x80", "\U0001F600"),
+    (b"x\xed\xa0\xbd\xed\xb8\x80\xc0\x80y", "x\U0001F600\x00y"),
+])
+def test_decode(raw, expected):
+    assert decode_mutf8(raw) == expected
+
+
+@pytest.mark.parametrize("raw", [
+    # Raw NUL
+    b"\x00",
+    b"java/lang\x00Object",
+    # Four-byte sequence of standard UTF-8 and bytes F0-FF
+    "\U0001F600".encode(),
+    b"\xff",
+    # Truncated sequences and a stray continuation byte
+    b"\xc3",
+    b"a\xe2\x82",
+    b"\x80",
+])
+def test_malformed(raw):
+    with pytest.raises(ClassFormatError):
+        decode_mutf8(raw)
@@ -0,0 +1,217 @@
+from math import inf, isnan
+
+import pytest
+
+from classfiles import add_static, call, new_class, thrown
+from objects.classes import ArrayInstance
+
+
+INT_MIN = -0x80000000
+INT_MAX = 0x7FFFFFFF
+LONG_MIN = -0x8000000000000000
+LONG_MAX = 0x7FFFFFFFFFFFFFFF
+
+
+# --------------------------------------------------
+# ARITHMETIC
+# --------------------------------------------------
+
+
+# (descriptor, code, arguments, result); longs and doubles take two argument slots
+ARITHMETIC = {
+    # iload_0, iload_1, <op>, ireturn
+    "iadd_overflow": ("(II)I", b"\x1a\x1b\x60\xac", [INT_MAX, 1], INT_MIN),
+    "imul_overflow": ("(II)I", b"\x1a\x1b\x68\xac", [0x10000, 0x10000], 0),
+    "idiv_truncates": ("(II)I", b"\x1a\x1b\x6c\xac", [-7, 2], -3),
+    "idiv_min_by_minus_one": ("(II)I", b"\x1a\x1b\x6c\xac", [INT_MIN, -1], INT_MIN),
+    "irem_sign_of_dividend": ("(II)I", b"\x1a\x1b\x70\xac", [-7, 2], -1),
+    "ishl_masks_distance": ("(II)I", b"\x1a\x1b\x78\xac", [1, 33], 2),
+    "ishr_keeps_sign": ("(II)I", b"\x1a\x1b\x7a\xac", [-16, 2], -4),
+    "iushr_fills_zeros": ("(II)I", b"\x1a\x1b\x7c\xac", [-1, 28], 15),
+    # iload_0, <op>, ireturn
+    "ineg_min": ("(I)I", b"\x1a\x74\xac", [INT_MIN], INT_MIN),
+    "i2b": ("(I)I", b"\x1a\x91\xac", [200], -56),
+    "i2c": ("(I)I", b"\x1a\x92\xac", [-1], 0xFFFF),
+    "i2s": ("(I)I", b"\x1a\x93\xac", [40000], -25536),
+    # wide iinc 0 1000, iload_0, ireturn
+    "wide_iinc": ("(I)I", b"\xc4\x84\x00\x00\x03\xe8\x1a\xac", [5], 1005),
+    # lload_0, lload_2, <op>, lreturn
+    "ladd_overflow": ("(JJ)J", b"\x1e\x20\x61\xad", [LONG_MAX, None, 1, None], LONG_MIN),
+    "lmul_overflow": ("(JJ)J", b"\x1e\x20\x69\xad", [1 << 32, None, 1 << 32, None], 0),
+    "ldiv_truncates": ("(JJ)J", b"\x1e\x20\x6d\xad", [-7, None, 2, None], -3),
+    "lrem_sign_of_dividend": ("(JJ)J", b"\x1e\x20\x71\xad", [7, None, -2, None], 1),
+    # lload_0, iload_2, lshl, lreturn
+    "lshl_masks_distance": ("(JI)J", b"\x1e\x1c\x79\xad", [1, None, 65], 2),
+    # lload_0, l2i, ireturn
+    "l2i_truncates": ("(J)I", b"\x1e\x88\xac", [0x1_8000_0000, None], INT_MIN),
+    # fload_0, f2i, ireturn
+    "f2i_nan": ("(F)I", b"\x22\x8b\xac", [float("nan")], 0),
+    "f2i_saturates": ("(F)I", b"\x22\x8b\xac", [1e20], INT_MAX),
+    "f2i_truncates": ("(F)I", b"\x22\x8b\xac", [-2.5], -2),
+    # fload_0, fload_1, fcmpl or fcmpg, ireturn
+    "fcmpl_nan": ("(FF)I", b"\x22\x23\x95\xac", [float("nan"), 1.0], -1),
+    "fcmpg_nan": ("(FF)I", b"\x22\x23\x96\xac", [float("nan"), 1.0], 1),
+    "fcmpl_less": ("(FF)I", b"\x22\x23\x95\xac", [0.5, 1.0], -1),
+    # dload_0, d2l, lreturn
+    "d2l_saturates": ("(D)J", b"\x26\x8f\xad", [-1e300, None], LONG_MIN),
+    # dload_0, dload_2, ddiv, dreturn
+    "ddiv_by_zero": ("(DD)D", b"\x26\x28\x6f\xaf", [1.0, None, 0.0, None], inf),
+}
+
+
+@pytest.fixture
+def arithmetic(classpath):
+    builder = new_class("Arithmetic")
+    for name, (descriptor, code, _, _) in ARITHMETIC.items():
+        add_static(builder, name, descriptor, code)
+    classpath.add("Arithmetic", builder)
+    return classpath.vm("Arithmetic")
+
+
+@pytest.mark.parametrize("name", ARITHMETIC)
+def test_arithmetic(arithmetic, name):
+    descriptor, _, arguments, result = ARITHMETIC[name]
+    assert call(arithmetic, "Arithmetic", name, descriptor, *arguments) == result
+
+
+def test_nan_arithmetic(classpath):
+    builder = new_class("NaN")
+    # fconst_0, fconst_0, fdiv, freturn
+    add_static(builder, "zeroByZero", "()F", b"\x0b\x0b\x6e\xae")
+    classpath.add("NaN", builder)
+
+    assert isnan(call(classpath.vm("NaN"), "NaN", "zeroByZero", "()F"))
+
+
+# --------------------------------------------------
+# STACK
+# --------------------------------------------------
+
+
+def fold(count) -> bytes:
+    # Pops `count` single-digit ints into locals 0 to count - 1, then returns them as the digits
+    # of one int, the bottom of the stack first
+    code = b"".join(bytes((0x36, local)) for local in reversed(range(count)))
+    code += b"\x1a"
+    for local in range(1, count):
+        # bipush 10, imul, iload <local>, iadd
+        code += b"\x10\x0a\x68\x15" + bytes((local,)) + b"\x60"
+    return code + b"\xac"
+
+
+# name -> (code, values left on the stack, result); iconst_1 to iconst_4 push 1 to 4
+STACK = {
+    "dup": (b"\x04\x59", 2, 11),
+    "dup_x1": (b"\x04\x05\x5a", 3, 212),
+    "dup_x2": (b"\x04\x05\x06\x5b", 4, 3123),
+    "dup2": (b"\x04\x05\x5c", 4, 1212),
+    "dup2_x1": (b"\x04\x05\x06\x5d", 5, 23123),
+    "dup2_x2": (b"\x04\x05\x06\x07\x5e", 6, 341234),
+    "swap": (b"\x04\x05\x5f", 2, 21),
+    "pop": (b"\x04\x05\x57", 1, 1),
+    "pop2": (b"\x04\x05\x06\x58", 1, 1),
+}
+
+
+@pytest.mark.parametrize("name", STACK)
+def test_stack(classpath, name):
+    code, count, result = STACK[name]
+    builder = new_class("Stack")
+    add_static(builder, name, "()I", code + fold(count))
+    classpath.add("Stack", builder)
+
+    assert call(classpath.vm("Stack"), "Stack", name, "()I") == result
+
+
+def test_category_2_stack(classpath):
+    builder = new_class("Wide")
+    # lconst_1, dup2, ladd, lreturn
+    add_static(builder, "twice", "()J", b"\x0a\x5c\x61\xad")
+    # dconst_1, dconst_0, pop2, dreturn
+    add_static(builder, "popDouble", "()D", b"\x0f\x0e\x58\xaf")
+    classpath.add("Wide", builder)
+    vm = classpath.vm("Wide")
+
+    assert call(vm, "Wide", "twice", "()J") == 2
+    assert call(vm, "Wide", "popDouble", "()D") == 1.0
+
+
+# --------------------------------------------------
+# RUNTIME EXCEPTIONS
+# --------------------------------------------------
+
+
+@pytest.fixture
+def failing(classpath):
+    builder = new_class("Failing")
+    # iload_0, iload_1, idiv, ireturn
+    add_static(builder, "divide", "(II)I", b"\x1a\x1b\x6c\xac")
+    # lload_0, lload_2, lrem, lreturn
+    add_static(builder, "remainder", "(JJ)J", b"\x1e\x20\x71\xad")
+    # aload_0, iload_1, iaload, ireturn
+    add_static(builder, "load", "([II)I", b"\x2a\x1b\x2e\xac")
+    # aload_0, iload_1, iload_2, iastore, return
+    add_static(builder, "store", "([III)V", b"\x2a\x1b\x1c\x4f\xb1")
+    # aload_0, iload_1, aload_2, aastore, return
+    add_static(builder, "storeObject", "([Ljava/lang/Object;ILjava/lang/Object;)V", b"\x2a\x1b\x2c\x53\xb1")
+    # aload_0, arraylength, ireturn
+    add_static(builder, "length", "([I)I", b"\x2a\xbe\xac")
+    # iload_0, newarray int, arraylength, ireturn
+    add_static(builder, "allocate", "(I)I", b"\x1a\xbc\x0a\xbe\xac")
+    classpath.add("Failing", builder)
+    return classpath.vm("Failing")
+
+
+def test_division_by_zero(failing):
+    error = thrown(failing, "Failing", "divide", "(II)I", 1, 0)
+    assert str(error) == "java.lang.ArithmeticException: / by zero"
+
+    error = thrown(failing, "Failing", "remainder", "(JJ)J", 1, None, 0, None)
+    assert str(error) == "java.lang.ArithmeticException: / by zero"
+
+
+def test_array_bounds(failing):
+    array = ArrayInstance("[I", [1, 2, 3])
+    assert call(failing, "Failing", "load", "([II)I", array, 2) == 3
+
+    error = thrown(failing, "Failing", "load", "([II)I", array, 3)
+    assert str(error) == "java.lang.ArrayIndexOutOfBoundsException: Index 3 out of bounds for length 3"
+
+    error = thrown(failing, "Failing", "store", "([III)V", array, -1, 0)
+    assert str(error) == "java.lang.ArrayIndexOutOfBoundsException: Index -1 out of bounds for length 3"
+    assert array == [1, 2, 3]
+
+
+def test_null_array(failing):
+    for name, descriptor, arguments in (
+        ("load", "([II)I", [None, 0]),
+        ("store", "([III)V", [None, 0, 0]),
+        ("length", "([I)I", [None]),
+    ):
+        error = thrown(failing, "Failing", name, descriptor, *arguments)
+        assert error.instance.identifier == "java/lang/NullPointerException"
+
+
+def test_negative_array_size(failing):
+    assert call(failing, "Failing", "allocate", "(I)I", 0) == 0
+
+    error = thrown(failing, "Failing", "allocate", "(I)I", -1)
+    assert str(error) == "java.lang.NegativeArraySizeException: -1"
+
+
+def test_array_store_checks_component_type(failing):
+    descriptor = "([Ljava/lang/Object;ILjava/lang/Object;)V"
+    strings = ArrayInstance("[Ljava/lang/String;", [None, None])
+    call(failing, "Failing", "storeObject", descriptor, strings, 0, "text")
+    call(failing, "Failing", "storeObject", descriptor, strings, 1, None)
+    assert strings == ["text", None]
+
+    error = thrown(failing, "Failing", "storeObject", descriptor, strings, 1, failing.new("java/lang/Object"))
+    assert str(error) == "java.lang.ArrayStoreException: java.lang.Object"
+    assert strings == ["text", None]
+
+    # Interfaces and array types
+    call(failing, "Failing", "storeObject", descriptor, ArrayInstance("[Ljava/lang/CharSequence;", [None]), 0, "text")
+    call(failing, "Failing", "storeObject", descriptor, ArrayInstance("[[I", [None]), 0, ArrayInstance("[I", []))
+    error = thrown(failing, "Failing", "storeObject", descriptor, ArrayInstance("[[J", [None]), 0, ArrayInstance("[I", []))
+    assert str(error) == "java.lang.ArrayStoreException: [I"
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+import parser.parse_cache
+from classfiles import CLASS_FILES, annotated_class
+from parser.class_parser import parse_class
+from parser.parse_cache import ParseCache
+
+
+@pytest.fixture
+def cache(tmp_path) -> ParseCache:
+    return ParseCache(str(tmp_path / "cache"))
+
+
+def entry_paths(cache) -> list[str]:
+    return [entry.path for entry in os.scandir(cache.directory) if entry.name.endswith(".parsed")]
+
+
+def test_round_trip(cache):
+    source = annotated_class()
+
+    parsed = parse_class(source, cache=cache)
+    assert cache.stats()["misses"] == 1
+    assert len(entry_paths(cache)) == 1
+
+    cached = parse_class(source, cache=cache)
+    assert cache.stats()["hits"] == 1
+    assert cached == parsed
+    assert cached is not parsed
+
+
+def test_shared_directory(cache):
+    parse_class(CLASS_FILES[0], cache=cache)
+
+    # Another cache on the same directory, as in another process
+    other = ParseCache(cache.directory)
+    assert other.stats()["size"] > 0
+    parse_class(CLASS_FILES[0], cache=other)
+    assert other.stats()["hits"] == 1
+
+
+def test_parser_version_invalidates(cache, monkeypatch):
+    source = annotated_class()
+    parse_class(source, cache=cache)
+    key = cache.key(source)
+
+    monkeypatch.setattr(parser.parse_cache, "PARSER_VERSION", parser.parse_cache.PARSER_VERSION + 1)
+    assert cache.key(source) != key
+
+    parse_class(source, cache=cache)
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["misses"] == 2
+    assert len(entry_paths(cache)) == 2
+
+
+def test_corrupt_entry(cache):
+    source = annotated_class()
+    parse_class(source, cache=cache)
+    with open(cache.path(cache.key(source)), "wb") as file:
+        file.write(b"not a cache entry")
+
+    assert cache.get(cache.key(source)) is None
+    assert entry_paths(cache) == []
+
+
+def test_eviction(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"), max_bytes=1)
+    for path in CLASS_FILES:
+        parse_class(path, cache=cache)
+
+    assert cache.stats()["evictions"] == len(CLASS_FILES)
+    assert entry_paths(cache) == []
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_writable_entry_is_not_loaded(cache):
+    source = annotated_class()
+    parse_class(source, cache=cache)
+    path = cache.path(cache.key(source))
+    os.chmod(path, 0o666)
+
+    assert cache.get(cache.key(source)) is None
+    assert os.path.exists(path)
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_writable_directory_is_refused(tmp_path):
+    directory = tmp_path / "shared"
+    directory.mkdir()
+    os.chmod(directory, 0o777)
+
+    with pytest.raises(PermissionError):
+        ParseCache(str(directory))
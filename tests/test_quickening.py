@@ -0,0 +1,84 @@
+import pytest
+
+from classfiles import add_static, call, new_class, u2
+from runtime.opcodes import GETFIELD_QUICK, GETSTATIC_QUICK, PUTFIELD_QUICK, PUTSTATIC_QUICK
+
+
+def quickened(method, opcode) -> list:
+    # Args of the instructions of a prepared method rewritten to `opcode`
+    return [arg for op, arg in zip(method.code.opcodes, method.code.args) if op == opcode]
+
+
+@pytest.fixture
+def point(classpath):
+    builder = new_class("Point")
+    builder.add_field("x", "I")
+    builder.add_field("y", "J")
+    x = u2(builder.field_ref("Point", "x", "I"))
+    y = u2(builder.field_ref("Point", "y", "J"))
+    # p.x += 1; p.y += value; return p.x
+    add_static(builder, "move", "(LPoint;J)I", b"".join((
+        b"\x2a\x59\xb4", x, b"\x04\x60\xb5", x,
+        b"\x2a\x59\xb4", y, b"\x1f\x61\xb5", y,
+        b"\x2a\xb4", x, b"\xac"
+    )))
+    classpath.add("Point", builder)
+    return classpath
+
+
+@pytest.fixture
+def counter(classpath):
+    builder = new_class("Counter")
+    builder.add_field("count", "I", 0x0009)
+    builder.add_field("total", "J", 0x0009)
+    count = u2(builder.field_ref("Counter", "count", "I"))
+    total = u2(builder.field_ref("Counter", "total", "J"))
+    # return ++count
+    add_static(builder, "next", "()I", b"\xb2" + count + b"\x04\x60\x59\xb3" + count + b"\xac")
+    # return total += value
+    add_static(builder, "add", "(J)J", b"\xb2" + total + b"\x1e\x61\x5c\xb3" + total + b"\xad")
+    classpath.add("Counter", builder)
+    return classpath
+
+
+def test_instance_fields(point):
+    vm = point.vm("Point")
+    method = vm.resolve_static(("Point", "move", "(LPoint;J)I"))
+    instance = vm.new("Point")
+
+    assert call(vm, "Point", "move", "(LPoint;J)I", instance, 1 << 40, None) == 1
+    assert {arg[3] for arg in quickened(method, GETFIELD_QUICK[1])} == {vm.field_slot("Point", "x")}
+    assert {arg[3] for arg in quickened(method, PUTFIELD_QUICK[2])} == {vm.field_slot("Point", "y")}
+
+    # The quickened instructions run on the next call
+    assert call(vm, "Point", "move", "(LPoint;J)I", instance, 1, None) == 2
+    assert instance.fields == [2, (1 << 40) + 1]
+
+
+def test_static_fields(counter):
+    vm = counter.vm("Counter")
+
+    assert [call(vm, "Counter", "next", "()I") for _ in range(3)] == [1, 2, 3]
+    method = vm.resolve_static(("Counter", "next", "()I"))
+    assert quickened(method, GETSTATIC_QUICK[1]) == [("Counter", "count", 1, "Counter", 0)]
+    assert quickened(method, PUTSTATIC_QUICK[1]) == [("Counter", "count", 1, "Counter", 0)]
+
+    assert call(vm, "Counter", "add", "(J)J", 1 << 40, None) == 1 << 40
+    assert call(vm, "Counter", "add", "(J)J", 1, None) == (1 << 40) + 1
+    method = vm.resolve_static(("Counter", "add", "(J)J"))
+    assert quickened(method, GETSTATIC_QUICK[2]) == [("Counter", "total", 2, "Counter", 1)]
+    assert quickened(method, PUTSTATIC_QUICK[2]) == [("Counter", "total", 2, "Counter", 1)]
+
+
+def test_shared_code_separate_statics(counter):
+    first = counter.vm("Counter")
+    second = counter.vm("Counter")
+
+    assert call(first, "Counter", "next", "()I") == 1
+    assert call(first, "Counter", "next", "()I") == 2
+
+    # The second VM runs the code the first quickened, on its own static fields
+    method = first.resolve_static(("Counter", "next", "()I"))
+    assert second.resolve_static(("Counter", "next", "()I")) is method
+    assert call(second, "Counter", "next", "()I") == 1
+    assert call(first, "Counter", "next", "()I") == 3
@@ -0,0 +1,104 @@
+from struct import pack
+
+import pytest
+
+from classfiles import BRANCH, STATIC
+from objects.errors import VerifyError
+from parser.class_parser import parse_class
+from parser.class_writer import ClassFileBuilder
+from parser.verifier import verify_class
+
+
+INTEGER = 1
+
+
+def verify(code, descriptor="(I)I", max_stack=2, max_locals=2, frames=None, hierarchy=None, builder=None):
+    builder = builder if builder is not None else ClassFileBuilder("Verified")
+    attributes = [builder.stack_map_table(frames)] if frames is not None else []
+    builder.add_method("run", descriptor, STATIC, [builder.code(code, max_stack, max_locals, attributes=attributes)])
+    verify_class(parse_class(builder.build()), hierarchy)
+
+
+def test_straight_line():
+    # iload_0, iconst_1, iadd, ireturn
+    verify(b"\x1a\x04\x60\xac")
+
+
+def test_branch_with_frame():
+    # same_frame at pc 6
+    verify(BRANCH, frames=[bytes((6,))])
+
+
+def test_appended_local():
+    # int local = 1; if (value == 0) return local; return 0
+    # iconst_1, istore_1, iload_0, ifeq +5, iconst_0, ireturn, iload_1, ireturn
+    code = b"\x04\x3c\x1a\x99\x00\x05\x03\xac\x1b\xac"
+    # append_frame at pc 8 adding an int local
+    verify(code, frames=[bytes((252,)) + pack(">H", 8) + bytes((INTEGER,))])
+
+
+def test_missing_frame():
+    with pytest.raises(VerifyError):
+        verify(BRANCH)
+
+
+def test_frame_not_at_instruction():
+    with pytest.raises(VerifyError):
+        verify(BRANCH, frames=[bytes((5,))])
+
+
+def test_frame_incompatible_with_incoming_state():
+    # The frame at pc 6 declares local 1 an int, but it is never stored on the way there
+    with pytest.raises(VerifyError):
+        verify(BRANCH, frames=[bytes((252,)) + pack(">H", 6) + bytes((INTEGER,))])
+
+
+def test_wrong_operand_type():
+    # fconst_0, ireturn
+    with pytest.raises(VerifyError):
+        verify(b"\x0b\xac")
+
+
+def test_stack_overflow():
+    # iconst_1, iconst_1, iadd, ireturn with max_stack 1
+    with pytest.raises(VerifyError):
+        verify(b"\x04\x04\x60\xac", max_stack=1)
+
+
+def test_stack_underflow():
+    # iadd, ireturn
+    with pytest.raises(VerifyError):
+        verify(b"\x60\xac")
+
+
+def test_uninitialized_local():
+    # iload_1, ireturn
+    with pytest.raises(VerifyError):
+        verify(b"\x1b\xac")
+
+
+def test_falls_off_end():
+    # iload_0, pop
+    with pytest.raises(VerifyError):
+        verify(b"\x1a\x57")
+
+
+def test_class_types_need_hierarchy():
+    # aload_0, areturn: returns an Object as a String
+    code = b"\x2a\xb0"
+    descriptor = "(Ljava/lang/Object;)Ljava/lang/String;"
+
+    # Without a hierarchy any class type is assignable to any other
+    verify(code, descriptor)
+
+    with pytest.raises(VerifyError):
+        verify(code, descriptor, hierarchy=lambda source, target: source == target or target == "java/lang/Object")
+
+
+def test_verify_while_parsing():
+    builder = ClassFileBuilder("Verified")
+    builder.add_method("run", "(I)I", STATIC, [builder.code(BRANCH, 2, 2)])
+
+    parse_class(builder.build())
+    with pytest.raises(VerifyError):
+        parse_class(builder.build(), verify=True)